@@ -1,1137 +1,25 @@
-import os
 import sys
-import shutil
-import threading
-import subprocess
-import re
-import time
-import zipfile
-import tkinter as tk
-from pathlib import Path
-from typing import List, Optional, Callable, Tuple, Dict, Any
-from dataclasses import dataclass
-from contextlib import suppress
-from enum import IntEnum
+import multiprocessing
 
+from p2j_core import CLI_COMMANDS, cli_main
 
-# ==================== 플랫폼 초기화 ====================
 
-
-class WindowsConsoleManager:
-    """Windows 콘솔 창 관리"""
-    
-    SW_HIDE = 0
-    CREATE_NO_WINDOW = 0x08000000
-    
-    @staticmethod
-    def hide_console() -> bool:
-        """콘솔 창을 숨기고 subprocess에 플래그 설정"""
-        if sys.platform != 'win32':
-            return False
-        
-        try:
-            import ctypes
-            
-            kernel32 = ctypes.WinDLL('kernel32')
-            user32 = ctypes.WinDLL('user32')
-            hwnd = kernel32.GetConsoleWindow()
-            
-            if hwnd:
-                user32.ShowWindow(hwnd, WindowsConsoleManager.SW_HIDE)
-            
-            _original_popen = subprocess.Popen
-            
-            def _popen_no_console(*args, **kwargs):
-                if 'creationflags' not in kwargs:
-                    kwargs['creationflags'] = 0
-                kwargs['creationflags'] |= WindowsConsoleManager.CREATE_NO_WINDOW
-                return _original_popen(*args, **kwargs)
-            
-            subprocess.Popen = _popen_no_console
-            return True
-        
-        except Exception:
-            return False
-
-
-WindowsConsoleManager.hide_console()
-
-
-# ==================== Import ====================
-
-
-import customtkinter as ctk
-from tkinterdnd2 import TkinterDnD, DND_FILES
-from pdf2image import convert_from_path, pdfinfo_from_path
-from tkinter import messagebox, filedialog
-
-
-# ==================== SSL 초기화 ====================
-
-
-class SSLManager:
-    """SSL 인증서 관리"""
-    
-    @staticmethod
-    def initialize() -> bool:
-        """SSL 인증서 경로 설정"""
-        try:
-            import certifi
-            cert_path = certifi.where()
-            os.environ['REQUESTS_CA_BUNDLE'] = cert_path
-            os.environ['SSL_CERT_FILE'] = cert_path
-            return True
-        
-        except (ImportError, AttributeError):
-            with suppress(ImportError):
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            return False
-
-
-VERIFY_SSL = SSLManager.initialize()
-import requests
-
-
-def initialize_theme() -> None:
-    """CustomTkinter 테마 및 외관 초기화"""
-    ctk.set_default_color_theme("blue")
-    ctk.set_appearance_mode("system")
-
-
-initialize_theme()
-
-
-# ==================== 설정 ====================
-
-
-@dataclass(frozen=True)
-class AppConfig:
-    """애플리케이션 전역 설정"""
-    APP_TITLE: str = "PDF → JPG 변환기 [made by. 류호준]"
-    CURRENT_VERSION: str = "2.2.1"
-    APP_REPO_OWNER: str = "c-closed"
-    APP_REPO_NAME: str = "P2J"
-    POPPLER_REPO_OWNER: str = "oschwartz10612"
-    POPPLER_REPO_NAME: str = "poppler-windows"
-    INIT_WINDOW_SIZE: str = "700x400"
-    MAIN_WINDOW_SIZE: str = "600x300"
-    ICON_FILENAME: str = "icon.ico"
-    POPPLER_FOLDER_NAME: str = "poppler"
-    CONVERSION_DPI: int = 200
-    OUTPUT_FORMAT: str = "jpeg"
-    THREAD_COUNT: int = 4
-    REQUEST_TIMEOUT: int = 10
-    DOWNLOAD_TIMEOUT: int = 90
-    DOWNLOAD_CHUNK_SIZE: int = 65536
-    PROGRESS_UPDATE_INTERVAL: int = 1
-    AUTO_CLOSE_COUNTDOWN_SECONDS: int = 3
-    COMPLETION_COUNTDOWN_SECONDS: int = 3
-
-
-CONFIG = AppConfig()
-
-
-# ==================== 유틸리티 ====================
-
-
-class PathUtils:
-    """경로 관리 유틸리티"""
-    
-    @staticmethod
-    def get_app_directory() -> Path:
-        """애플리케이션 실행 디렉토리 반환"""
-        if getattr(sys, 'frozen', False):
-            return Path(sys.executable).parent
-        return Path(__file__).parent
-    
-    @staticmethod
-    def get_icon_path() -> Optional[str]:
-        """아이콘 파일 경로 반환"""
-        icon_path = PathUtils.get_app_directory() / CONFIG.ICON_FILENAME
-        return str(icon_path) if icon_path.exists() else None
-    
-    @staticmethod
-    def get_poppler_path() -> Optional[str]:
-        """Poppler bin 디렉토리 경로 반환"""
-        poppler_dir = PathUtils.get_app_directory() / CONFIG.POPPLER_FOLDER_NAME
-        
-        if not poppler_dir.exists():
-            return None
-        
-        for item in poppler_dir.iterdir():
-            if item.is_dir() and "poppler" in item.name.lower():
-                bin_path = item / "Library" / "bin"
-                if (bin_path / "pdftoppm.exe").exists():
-                    return str(bin_path)
-        
-        return None
-
-
-class IconManager:
-    """Windows 아이콘 관리"""
-    
-    class IconSize(IntEnum):
-        SMALL = 16
-        LARGE = 32
-    
-    WM_SETICON = 0x80
-    ICON_SMALL = 0
-    ICON_BIG = 1
-    LR_LOADFROMFILE = 0x00000010
-    
-    @staticmethod
-    def set_window_icon(window, icon_path: str) -> bool:
-        """Windows API를 사용하여 창 아이콘 설정"""
-        if not icon_path or not os.path.exists(icon_path):
-            return False
-        
-        if sys.platform != 'win32':
-            return False
-        
-        try:
-            import ctypes
-            
-            window.update_idletasks()
-            hwnd = window.winfo_id()
-            
-            if not hwnd:
-                return False
-            
-            load_image = ctypes.windll.user32.LoadImageW
-            hicon_small = load_image(
-                0, icon_path, 1,
-                IconManager.IconSize.SMALL, IconManager.IconSize.SMALL,
-                IconManager.LR_LOADFROMFILE
-            )
-            hicon_large = load_image(
-                0, icon_path, 1,
-                IconManager.IconSize.LARGE, IconManager.IconSize.LARGE,
-                IconManager.LR_LOADFROMFILE
-            )
-            
-            if not (hicon_small or hicon_large):
-                return False
-            
-            send_message = ctypes.windll.user32.SendMessageW
-            if hicon_small:
-                send_message(hwnd, IconManager.WM_SETICON, IconManager.ICON_SMALL, hicon_small)
-            if hicon_large:
-                send_message(hwnd, IconManager.WM_SETICON, IconManager.ICON_BIG, hicon_large)
-            
-            return True
-        
-        except Exception:
-            return False
-
-
-class VersionManager:
-    """버전 비교 유틸리티"""
-    
-    @staticmethod
-    def parse_version(version_str: str) -> Tuple[int, int, int]:
-        """버전 문자열을 튜플로 파싱"""
-        try:
-            clean_ver = version_str.lstrip('v')
-            parts = clean_ver.split('.')
-            major = int(parts[0]) if len(parts) > 0 else 0
-            minor = int(parts[1]) if len(parts) > 1 else 0
-            patch = int(parts[2]) if len(parts) > 2 else 0
-            return (major, minor, patch)
-        except (ValueError, AttributeError, IndexError):
-            return (0, 0, 0)
-    
-    @staticmethod
-    def is_newer(current: str, latest: str) -> bool:
-        """최신 버전이 현재 버전보다 새로운지 확인"""
-        return VersionManager.parse_version(latest) > VersionManager.parse_version(current)
-
-
-class LogCallback:
-    """로깅 콜백 유틸리티"""
-    
-    @staticmethod
-    def log(callback: Optional[Callable[[str, bool], None]], message: str, is_progress: bool = False) -> None:
-        """로그 메시지 전달"""
-        if callback:
-            callback(message, is_progress)
+# ==================== 진입점 ====================
 
 
-# ==================== GitHub API ====================
-
-
-class GitHubAPIClient:
-    """GitHub API 클라이언트"""
-    
-    def get_latest_release(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
-        """저장소의 최신 Release 정보 가져오기"""
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-        
-        try:
-            response = requests.get(api_url, timeout=CONFIG.REQUEST_TIMEOUT, verify=VERIFY_SSL)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException:
-            return None
-    
-    def download_file(
-        self,
-        url: str,
-        dest_path: Path,
-        progress_callback: Optional[Callable[[int], None]] = None
-    ) -> bool:
-        """파일 다운로드 (진행률 콜백 지원)"""
-        try:
-            with requests.get(url, stream=True, timeout=CONFIG.DOWNLOAD_TIMEOUT, verify=VERIFY_SSL) as response:
-                response.raise_for_status()
-                
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-                last_percent = -1
-                
-                with open(dest_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=CONFIG.DOWNLOAD_CHUNK_SIZE):
-                        if not chunk:
-                            continue
-                        
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size and progress_callback:
-                            percent = int((downloaded / total_size) * 100)
-                            if percent != last_percent and percent % CONFIG.PROGRESS_UPDATE_INTERVAL == 0:
-                                progress_callback(percent)
-                                last_percent = percent
-                
-                if progress_callback:
-                    progress_callback(100)
-                
-                return True
-        
-        except Exception:
-            dest_path.unlink(missing_ok=True)
-            return False
-
-
-@dataclass
-class ReleaseInfo:
-    """Release 정보 데이터 클래스"""
-    version: str
-    name: str
-    html_url: str
-
-
-class ReleaseManager:
-    """GitHub Release 관리"""
-    
-    def __init__(self, api_client: GitHubAPIClient):
-        self.api_client = api_client
-    
-    def get_latest_release_info(
-        self,
-        log_callback: Optional[Callable[[str, bool], None]] = None
-    ) -> Optional[ReleaseInfo]:
-        """최신 Release 정보 가져오기"""
-        LogCallback.log(log_callback, "  → GitHub Release 확인 중...")
-        
-        data = self.api_client.get_latest_release(CONFIG.APP_REPO_OWNER, CONFIG.APP_REPO_NAME)
-        
-        if not data:
-            LogCallback.log(log_callback, "  ! Release 확인 실패")
-            return None
-        
-        tag_name = data.get('tag_name', '')
-        LogCallback.log(log_callback, f"  ✓ 최신 Release 버전: {tag_name}")
-        
-        return ReleaseInfo(
-            version=tag_name,
-            name=data.get('name', ''),
-            html_url=data.get('html_url', '')
-        )
-    
-    @staticmethod
-    def open_release_page(
-        release_url: str,
-        log_callback: Optional[Callable[[str, bool], None]] = None
-    ) -> bool:
-        """브라우저로 Release 페이지 열기"""
-        try:
-            import webbrowser
-            LogCallback.log(log_callback, "→ 브라우저로 Release 페이지를 엽니다...")
-            LogCallback.log(log_callback, f"  • URL: {release_url}")
-            webbrowser.open(release_url)
-            LogCallback.log(log_callback, "  ✓ 브라우저 열기 완료")
-            return True
-        except Exception as e:
-            LogCallback.log(log_callback, f"  ✗ 브라우저 열기 실패: {e}")
-            return False
-
-
-class PopplerManager:
-    """Poppler 다운로드 및 설치 관리"""
-    
-    VERSION_PATTERN = re.compile(r'(\d+\.\d+\.\d+)')
-    
-    def __init__(self, api_client: GitHubAPIClient):
-        self.api_client = api_client
-        self._install_completed = False
-    
-    def get_installed_version(self, poppler_dir: Path) -> Optional[str]:
-        """설치된 Poppler 버전 확인"""
-        if not poppler_dir.exists():
-            return None
-        
-        for item in poppler_dir.iterdir():
-            if item.is_dir() and "poppler" in item.name.lower():
-                match = self.VERSION_PATTERN.search(item.name)
-                if match:
-                    return match.group(1)
-        
-        return None
-    
-    def get_latest_version_info(self) -> Optional[Tuple[str, str, str]]:
-        """최신 Poppler 버전 정보 가져오기"""
-        data = self.api_client.get_latest_release(CONFIG.POPPLER_REPO_OWNER, CONFIG.POPPLER_REPO_NAME)
-        
-        if not data:
-            return None
-        
-        zip_asset = next((a for a in data.get("assets", []) if a["name"].lower().endswith(".zip")), None)
-        
-        if not zip_asset:
-            return None
-        
-        filename = zip_asset["name"]
-        match = self.VERSION_PATTERN.search(filename)
-        version = match.group(1) if match else "unknown"
-        
-        return (zip_asset["browser_download_url"], filename, version)
-    
-    def download_and_extract(
-        self,
-        dest_folder: Path,
-        log_callback: Optional[Callable[[str, bool], None]] = None
-    ) -> Path:
-        """Poppler 다운로드 및 압축 해제"""
-        version_info = self.get_latest_version_info()
-        if not version_info:
-            raise RuntimeError("Poppler 최신 버전을 찾을 수 없습니다.")
-        
-        download_url, filename, version = version_info
-        zip_path = dest_folder / filename
-        
-        LogCallback.log(log_callback, f"→ 다운로드 파일: {filename}")
-        LogCallback.log(log_callback, "→ 다운로드 시작...")
-        
-        def progress_callback(percent: int) -> None:
-            if percent >= 100:
-                LogCallback.log(log_callback, "  ✓ 다운로드 완료", True)
-            else:
-                LogCallback.log(log_callback, f"  → 다운로드 진행: {percent}%", True)
-        
-        if not self.api_client.download_file(download_url, zip_path, progress_callback):
-            raise RuntimeError("Poppler 다운로드 실패")
-        
-        LogCallback.log(log_callback, "→ 압축 해제 시작")
-        
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                members = zip_ref.namelist()
-                total_files = len(members)
-                last_percent = -1
-                
-                for i, member in enumerate(members, start=1):
-                    zip_ref.extract(member, dest_folder)
-                    percent = int((i / total_files) * 100)
-                    
-                    if percent != last_percent and percent % CONFIG.PROGRESS_UPDATE_INTERVAL == 0:
-                        if percent >= 100:
-                            LogCallback.log(log_callback, f"  ✓ 압축 해제 완료: {total_files}개 파일", True)
-                        else:
-                            LogCallback.log(log_callback, f"  → 압축 해제 진행: {percent}%", True)
-                        last_percent = percent
-        finally:
-            zip_path.unlink(missing_ok=True)
-            LogCallback.log(log_callback, "  ✓ 임시 파일 삭제 완료")
-        
-        LogCallback.log(log_callback, "→ Poppler 폴더 확인 중...")
-        
-        for item in dest_folder.iterdir():
-            if item.is_dir() and "poppler" in item.name.lower():
-                bin_path = item / "Library" / "bin"
-                if (bin_path / "pdftoppm.exe").exists():
-                    if not self._install_completed:
-                        LogCallback.log(log_callback, f"  ✓ Poppler 설치 완료 (v{version})")
-                        self._install_completed = True
-                    return bin_path
-        
-        raise RuntimeError("Poppler 폴더를 찾을 수 없습니다.")
-    
-    def check_and_update(
-        self,
-        app_dir: Path,
-        log_callback: Optional[Callable[[str, bool], None]] = None
-    ) -> None:
-        """Poppler 설치 확인 및 업데이트"""
-        LogCallback.log(log_callback, "")
-        LogCallback.log(log_callback, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        LogCallback.log(log_callback, "[ Poppler 확인 ]")
-        LogCallback.log(log_callback, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        time.sleep(0.2)
-        
-        poppler_dir = app_dir / CONFIG.POPPLER_FOLDER_NAME
-        poppler_dir.mkdir(parents=True, exist_ok=True)
-        
-        installed_version = self.get_installed_version(poppler_dir)
-        version_info = self.get_latest_version_info()
-        
-        if not version_info:
-            LogCallback.log(log_callback, "  ✗ 최신 버전 확인 실패")
-            
-            if installed_version:
-                LogCallback.log(log_callback, "")
-                LogCallback.log(log_callback, f"✓ 기존 Poppler 사용 (v{installed_version})")
-            else:
-                LogCallback.log(log_callback, "")
-                LogCallback.log(log_callback, "✗ Poppler 설치 불가")
-                raise RuntimeError("Poppler 최신 버전 확인 실패")
-            return
-        
-        _, _, latest_version = version_info
-        
-        if installed_version:
-            LogCallback.log(log_callback, f"  • 현재 버전: v{installed_version}")
-            LogCallback.log(log_callback, f"  • 최신 버전: v{latest_version}")
-            
-            if installed_version == latest_version:
-                if not self._install_completed:
-                    LogCallback.log(log_callback, "")
-                    LogCallback.log(log_callback, "✓ Poppler가 최신 버전입니다")
-                self._install_completed = True
-                return
-            
-            LogCallback.log(log_callback, "")
-            LogCallback.log(log_callback, "! 새 버전 발견 - Poppler 업데이트 시작")
-            LogCallback.log(log_callback, "→ 기존 Poppler 삭제 중...")
-            
-            self._remove_old_poppler(poppler_dir, log_callback)
-            LogCallback.log(log_callback, "")
-            self._install_completed = False
-        else:
-            LogCallback.log(log_callback, "")
-            LogCallback.log(log_callback, "! Poppler가 설치되지 않았습니다")
-            LogCallback.log(log_callback, "")
-            time.sleep(0.2)
-            self._install_completed = False
-        
-        try:
-            self.download_and_extract(poppler_dir, log_callback)
-        except Exception as e:
-            LogCallback.log(log_callback, f"✗ Poppler 설치 실패: {e}")
-            raise
-    
-    def _remove_old_poppler(
-        self,
-        poppler_dir: Path,
-        log_callback: Optional[Callable[[str, bool], None]]
-    ) -> None:
-        """기존 Poppler 폴더 삭제"""
-        for item in poppler_dir.iterdir():
-            if item.is_dir() and "poppler" in item.name.lower():
-                try:
-                    shutil.rmtree(item)
-                    LogCallback.log(log_callback, f"  ✓ 삭제 완료: {item.name}")
-                except Exception as e:
-                    LogCallback.log(log_callback, f"  ✗ 삭제 실패: {e}")
-
-
-class PDFProcessor:
-    """PDF to JPG 변환 처리"""
-    
-    def __init__(self, poppler_path: str):
-        self.poppler_path = poppler_path
-    
-    def get_page_count(self, pdf_path: str) -> int:
-        """PDF 페이지 수 확인"""
-        try:
-            info = pdfinfo_from_path(pdf_path, poppler_path=self.poppler_path)
-            return info["Pages"]
-        except Exception as e:
-            raise RuntimeError(f"PDF 정보 읽기 실패: {e}")
-    
-    def get_total_pages(self, pdf_files: List[str]) -> int:
-        """여러 PDF 파일의 총 페이지 수"""
-        return sum(self.get_page_count(pdf) for pdf in pdf_files)
-    
-    def convert_to_images(
-        self,
-        pdf_path: str,
-        output_folder: Path,
-        progress_callback: Optional[Callable[[int], None]] = None
-    ) -> int:
-        """PDF를 JPG 이미지로 변환"""
-        info = pdfinfo_from_path(pdf_path, poppler_path=self.poppler_path)
-        total_pages = info["Pages"]
-        digits = len(str(total_pages))
-        
-        images = convert_from_path(
-            pdf_path,
-            dpi=CONFIG.CONVERSION_DPI,
-            first_page=1,
-            last_page=total_pages,
-            fmt=CONFIG.OUTPUT_FORMAT,
-            output_folder=str(output_folder),
-            paths_only=True,
-            poppler_path=self.poppler_path,
-            thread_count=CONFIG.THREAD_COUNT
-        )
-        
-        for i, img_path in enumerate(images, start=1):
-            dest_path = output_folder / f"{str(i).zfill(digits)}.jpg"
-            
-            if dest_path.exists():
-                dest_path.unlink()
-            
-            shutil.move(str(img_path), str(dest_path))
-            
-            if progress_callback:
-                progress_callback(i)
-        
-        return len(images)
-
-
-@dataclass
-class InitializationResult:
-    """초기화 창 실행 결과"""
-    should_close: bool = False
-    launch_main: bool = True
-    update_started: bool = False
-
-
-class InitializationWindow(tk.Tk):
-    """초기화 창 - 순수 Tkinter"""
-    
-    def __init__(self):
-        super().__init__()
-        self.title("파일 무결성 검사 중...")
-        self.geometry(CONFIG.INIT_WINDOW_SIZE)
-        self.resizable(False, False)
-        
-        self.app_dir = PathUtils.get_app_directory()
-        self.result = InitializationResult()
-        
-        self.logs: List[str] = []
-        self._closing = False
-        
-        self._setup_icon()
-        self._center_window()
-        self._setup_ui()
-        self._start_initialization()
-    
-    def _setup_icon(self) -> None:
-        """아이콘 설정"""
-        icon_path = PathUtils.get_icon_path()
-        if icon_path:
-            with suppress(Exception):
-                self.iconbitmap(icon_path)
-    
-    def _center_window(self) -> None:
-        """창을 화면 중앙에 배치"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() - width) // 2
-        y = (self.winfo_screenheight() - height) // 2
-        self.geometry(f"{width}x{height}+{x}+{y}")
-    
-    def _setup_ui(self) -> None:
-        """UI 구성"""
-        self.log_box = tk.Text(
-            self,
-            height=22,
-            width=85,
-            font=("Consolas", 8),
-            bg="#ffffff",
-            fg="#000000",
-            state="disabled"
-        )
-        self.log_box.pack(pady=10, padx=25, fill="both", expand=True)
-    
-    def _start_initialization(self) -> None:
-        """초기화 스레드 시작"""
-        threading.Thread(target=self._init_thread, daemon=True).start()
-        self.after(500, self._check_close)
-    
-    def _init_thread(self) -> None:
-        """초기화 작업 실행"""
-        try:
-            log_cb = lambda msg, is_progress: self._add_log(msg, is_progress)
-            
-            api_client = GitHubAPIClient()
-            
-            self._check_update(api_client, log_cb)
-            if self.result.update_started:
-                return
-            
-            time.sleep(0.3)
-            
-            poppler_manager = PopplerManager(api_client)
-            poppler_manager.check_and_update(self.app_dir, log_cb)
-            time.sleep(0.3)
-            
-            self._countdown()
-            self.result.should_close = True
-        
-        except Exception as e:
-            self._add_log(f"✗ 초기화 오류: {e}", False)
-            self.result.should_close = True
-            self.result.launch_main = False
-    
-    def _check_update(
-        self,
-        api_client: GitHubAPIClient,
-        log_cb: Callable[[str, bool], None]
-    ) -> None:
-        """업데이트 확인 및 Release 페이지 열기"""
-        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-        self._add_log("[ 업데이트 확인 ]", False)
-        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-        self._add_log(f"  • 현재 버전: v{CONFIG.CURRENT_VERSION}", False)
-        
-        silent_log_cb = lambda msg, is_progress=False: None
-        
-        release_manager = ReleaseManager(api_client)
-        release_info = release_manager.get_latest_release_info(silent_log_cb)
-        
-        if not release_info:
-            self._add_log("  ✗ 최신 버전 확인 실패", False)
-            self._add_log("", False)
-            self._add_log("✓ 업데이트 확인 완료", False)
-            return
-        
-        self._add_log(f"  • 최신 버전: {release_info.version}", False)
-        
-        if not VersionManager.is_newer(CONFIG.CURRENT_VERSION, release_info.version):
-            self._add_log("", False)
-            self._add_log("✓ 이미 최신 버전입니다", False)
-            return
-        
-        # 새 버전 발견 - Release 페이지 열기
-        self._add_log("", False)
-        self._add_log("! 새 버전 발견!", False)
-        self._add_log("", False)
-        
-        if release_manager.open_release_page(release_info.html_url, log_cb):
-            self._add_log("", False)
-            self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-            self._add_log("✓ 브라우저에서 최신 버전을 다운로드하세요", False)
-            self._add_log("프로그램을 종료합니다.", False)
-            self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-            time.sleep(2)
-            
-            # 앱 종료 플래그 설정
-            self.result.update_started = True
-            self.result.should_close = True
-            self.result.launch_main = False
-
-    def _countdown(self) -> None:
-        """프로그램 시작 카운트다운"""
-        self._add_log("", False)
-        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-        
-        for i in range(CONFIG.AUTO_CLOSE_COUNTDOWN_SECONDS, 0, -1):
-            if self._closing:
-                break
-            self._add_log(f"✓ {i}초 후 프로그램이 시작됩니다...", False)
-            time.sleep(1.0)
-        
-        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
-    
-    def _add_log(self, message: str, is_progress: bool = False) -> None:
-        """로그 추가"""
-        if self._closing:
-            return
-        
-        try:
-            self.log_box.config(state="normal")
-            
-            if is_progress and self.logs:
-                self.log_box.delete(f"{len(self.logs)}.0", f"{len(self.logs) + 1}.0")
-                self.logs.pop()
-            
-            self.logs.append(message)
-            self.log_box.insert("end", message + "\n")
-            self.log_box.see("end")
-            self.log_box.config(state="disabled")
-            self.update_idletasks()
-        
-        except Exception:
-            pass
-    
-    def _check_close(self) -> None:
-        """종료 여부 확인"""
-        if self._closing:
-            return
-        
-        if self.result.should_close:
-            self._closing = True
-            self.quit()
-        else:
-            self.after(100, self._check_close)
-
-
-class ProgressPopup(ctk.CTkToplevel):
-    """진행률 표시 팝업"""
-    
-    def __init__(self, parent, total_files: int, total_pages: int):
-        super().__init__(parent)
-        self.total_files = total_files
-        self.total_pages = total_pages
-        self.cancelled = False
-        self.cancel_callback: Optional[Callable[[], None]] = None
-        self._auto_close_id: Optional[str] = None
-        
-        self._setup_window(parent)
-        self._setup_icon()
-        self._create_widgets()
-    
-    def _setup_window(self, parent) -> None:
-        """창 설정"""
-        self.title("진행 중")
-        self.geometry("450x170")
-        self.resizable(False, False)
-        self.grab_set()
-        
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 450) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 170) // 2
-        self.geometry(f"450x170+{x}+{y}")
-    
-    def _setup_icon(self) -> None:
-        """아이콘 설정"""
-        icon_path = PathUtils.get_icon_path()
-        if icon_path:
-            with suppress(Exception):
-                self.iconbitmap(icon_path)
-    
-    def _create_widgets(self) -> None:
-        """UI 요소 생성"""
-        self.file_label = ctk.CTkLabel(self, text=f"파일: 0 / {self.total_files} (0%)")
-        self.file_label.pack(pady=(10, 5))
-        
-        self.file_progress = ctk.CTkProgressBar(self, width=400)
-        self.file_progress.pack(pady=5)
-        self.file_progress.set(0)
-        
-        self.page_label = ctk.CTkLabel(self, text=f"페이지: 0 / {self.total_pages} (0%)")
-        self.page_label.pack(pady=(10, 5))
-        
-        self.page_progress = ctk.CTkProgressBar(self, width=400)
-        self.page_progress.pack(pady=5)
-        self.page_progress.set(0)
-        
-        self.cancel_button = ctk.CTkButton(self, text="취소", command=self._on_cancel)
-        self.cancel_button.pack(pady=10)
-    
-    def _on_cancel(self) -> None:
-        """취소 버튼 클릭"""
-        if messagebox.askyesno("작업 취소", "변환 작업을 정말 취소하시겠습니까?"):
-            self.cancelled = True
-            if self.cancel_callback:
-                self.cancel_callback()
-            self.cancel_button.configure(state="disabled")
-    
-    def update_file_progress(self, completed: int) -> None:
-        """파일 진행률 업데이트"""
-        percent = int((completed / self.total_files) * 100) if self.total_files else 0
-        self.file_label.configure(text=f"파일: {completed} / {self.total_files} ({percent}%)")
-        self.file_progress.set(completed / self.total_files if self.total_files else 0)
-        self.update_idletasks()
-    
-    def update_page_progress(self, completed: int) -> None:
-        """페이지 진행률 업데이트"""
-        percent = int((completed / self.total_pages) * 100) if self.total_pages else 0
-        self.page_label.configure(text=f"페이지: {completed} / {self.total_pages} ({percent}%)")
-        self.page_progress.set(completed / self.total_pages if self.total_pages else 0)
-        self.update_idletasks()
-    
-    def show_completion(self) -> None:
-        """완료 상태 표시 및 자동 종료"""
-        self.cancel_button.configure(
-            text=f"확인 ({CONFIG.COMPLETION_COUNTDOWN_SECONDS}초)",
-            state="normal",
-            command=self._close
-        )
-        self._auto_close_id = self.after(1000, lambda: self._countdown(CONFIG.COMPLETION_COUNTDOWN_SECONDS - 1))
-    
-    def _countdown(self, seconds: int) -> None:
-        """자동 종료 카운트다운"""
-        if seconds > 0:
-            self.cancel_button.configure(text=f"확인 ({seconds}초)")
-            self._auto_close_id = self.after(1000, lambda: self._countdown(seconds - 1))
-        else:
-            self._close()
-    
-    def _close(self) -> None:
-        """팝업 닫기"""
-        if self._auto_close_id:
-            self.after_cancel(self._auto_close_id)
-        self.destroy()
-
-
-class PDFtoJPGApp(ctk.CTkFrame):
-    """메인 애플리케이션"""
-    
-    def __init__(self, master):
-        super().__init__(master)
-        self.pack(fill="both", expand=True)
-        self.master = master
-        
-        self.pdf_files: List[str] = []
-        self._cancel_requested = False
-        self.progress_popup: Optional[ProgressPopup] = None
-        
-        self._setup_window()
-        self._check_poppler()
-        self._create_widgets()
-        self._setup_drag_drop()
-    
-    def _setup_window(self) -> None:
-        """윈도우 설정"""
-        self.master.title(CONFIG.APP_TITLE)
-        self.master.geometry(CONFIG.MAIN_WINDOW_SIZE)
-        
-        icon_path = PathUtils.get_icon_path()
-        if icon_path:
-            with suppress(Exception):
-                self.master.iconbitmap(icon_path)
-            
-            self.master.update_idletasks()
-            self.master.after(100, lambda: IconManager.set_window_icon(self.master, icon_path))
-        
-        self.master.update_idletasks()
-        x = (self.master.winfo_screenwidth() - 600) // 2
-        y = (self.master.winfo_screenheight() - 300) // 2
-        self.master.geometry(f"600x300+{x}+{y}")
-    
-    def _check_poppler(self) -> None:
-        """Poppler 경로 확인"""
-        self.poppler_path = PathUtils.get_poppler_path()
-        
-        if not self.poppler_path:
-            app_dir = PathUtils.get_app_directory()
-            messagebox.showerror(
-                "오류",
-                f"Poppler를 찾을 수 없습니다.\n\n"
-                f"설치 경로: {app_dir / CONFIG.POPPLER_FOLDER_NAME}\n\n"
-                f"프로그램을 다시 시작해주세요."
-            )
-            self.master.destroy()
-            sys.exit()
-        
-        self.pdf_processor = PDFProcessor(self.poppler_path)
-    
-    def _create_widgets(self) -> None:
-        """UI 요소 생성"""
-        self.drop_area = ctk.CTkTextbox(self, height=220)
-        self.drop_area.pack(padx=10, pady=10, fill="x")
-        self.drop_area.configure(state="disabled")
-        
-        control_container = ctk.CTkFrame(self, fg_color="transparent")
-        control_container.pack(pady=10, fill="x", padx=10)
-        
-        buttons = [
-            ("불러오기", self.select_files),
-            ("지우기", self.remove_selected),
-            ("비우기", self.clear_list),
-            ("변환하기", self.start_conversion)
-        ]
-        
-        for text, command in buttons:
-            btn = ctk.CTkButton(control_container, text=text, command=command, width=100)
-            btn.pack(side="left", padx=5)
-        
-        version_label = ctk.CTkLabel(
-            control_container,
-            text=f"v{CONFIG.CURRENT_VERSION}",
-            text_color="gray"
-        )
-        version_label.pack(side="right", padx=10)
-    
-    def _setup_drag_drop(self) -> None:
-        """드래그 앤 드롭 설정"""
-        self.master.drop_target_register(DND_FILES)
-        self.master.dnd_bind("<<Drop>>", self._on_drop)
-    
-    def select_files(self) -> None:
-        """파일 선택 대화상자"""
-        files = filedialog.askopenfilenames(
-            title="PDF 파일 선택",
-            filetypes=[("PDF files", "*.pdf")]
-        )
-        self._add_files(list(files))
-    
-    def _on_drop(self, event) -> None:
-        """드래그 앤 드롭 이벤트 처리"""
-        files = self.master.tk.splitlist(event.data)
-        pdf_files = [f for f in files if f.lower().endswith(".pdf")]
-        self._add_files(pdf_files)
-    
-    def _add_files(self, files) -> None:
-        """파일 목록에 추가"""
-        for f in files:
-            if f not in self.pdf_files:
-                self.pdf_files.append(f)
-        self._update_file_list()
-    
-    def remove_selected(self) -> None:
-        """선택된 파일 제거"""
-        if not self.pdf_files:
-            messagebox.showinfo("알림", "목록에 파일이 없습니다.")
-            return
-        
-        try:
-            self.drop_area.configure(state="normal")
-            cursor_index = self.drop_area.index("insert")
-            self.drop_area.configure(state="disabled")
-            
-            line_num = int(cursor_index.split('.')[0]) - 1
-            
-            if 0 <= line_num < len(self.pdf_files):
-                removed_file = Path(self.pdf_files[line_num]).name
-                if messagebox.askyesno("파일 제거", f"'{removed_file}'을(를) 목록에서 제거하시겠습니까?"):
-                    self.pdf_files.pop(line_num)
-                    self._update_file_list()
-            else:
-                messagebox.showwarning("경고", "유효한 파일을 선택해주세요.")
-        
-        except Exception as e:
-            messagebox.showerror("오류", f"파일 제거 중 오류 발생: {e}")
-    
-    def clear_list(self) -> None:
-        """파일 목록 비우기"""
-        if self.pdf_files:
-            if messagebox.askyesno("목록 비우기", "등록된 모든 파일을 목록에서 제거하시겠습니까?"):
-                self.pdf_files.clear()
-                self._update_file_list()
-        else:
-            messagebox.showinfo("알림", "목록이 이미 비어있습니다.")
-    
-    def _update_file_list(self) -> None:
-        """파일 목록 표시 업데이트"""
-        self.drop_area.configure(state="normal")
-        self.drop_area.delete("0.0", "end")
-        file_names = "\n".join(Path(f).name for f in self.pdf_files)
-        self.drop_area.insert("0.0", file_names)
-        self.drop_area.configure(state="disabled")
-    
-    def start_conversion(self) -> None:
-        """변환 작업 시작"""
-        if not self.pdf_files:
-            messagebox.showwarning("경고", "등록된 PDF 파일이 없습니다.")
-            return
-        
-        try:
-            total_files = len(self.pdf_files)
-            total_pages = self.pdf_processor.get_total_pages(self.pdf_files)
-        except Exception as e:
-            messagebox.showerror("오류", str(e))
-            return
-        
-        self.progress_popup = ProgressPopup(self.master, total_files, total_pages)
-        self.progress_popup.cancel_callback = self._cancel_conversion
-        self._cancel_requested = False
-        
-        threading.Thread(target=self._convert_files, daemon=True).start()
-    
-    def _cancel_conversion(self) -> None:
-        """변환 작업 취소"""
-        self._cancel_requested = True
-    
-    def _convert_files(self) -> None:
-        """PDF 파일들을 JPG로 변환"""
-        try:
-            completed_files = 0
-            completed_pages = 0
-            
-            for pdf_file in self.pdf_files:
-                if self._cancel_requested:
-                    break
-                
-                pdf_path = Path(pdf_file)
-                output_folder = pdf_path.parent / f"JPG 변환({pdf_path.stem})"
-                output_folder.mkdir(exist_ok=True)
-                
-                def page_callback(page_num: int) -> None:
-                    nonlocal completed_pages
-                    if not self._cancel_requested and self.progress_popup:
-                        completed_pages += 1
-                        self.progress_popup.update_page_progress(completed_pages)
-                
-                self.pdf_processor.convert_to_images(pdf_file, output_folder, page_callback)
-                
-                if not self._cancel_requested and self.progress_popup:
-                    completed_files += 1
-                    self.progress_popup.update_file_progress(completed_files)
-            
-            if not self._cancel_requested:
-                if self.progress_popup:
-                    self.progress_popup.show_completion()
-            else:
-                if self.progress_popup:
-                    self.progress_popup.cancel_button.configure(state="disabled")
-            
-            self._cancel_requested = False
-        
-        except Exception as e:
-            messagebox.showerror("오류", f"변환 중 오류 발생: {e}")
-            if self.progress_popup:
-                self.progress_popup.destroy()
+# 작업자 프로세스를 spawn으로 띄우면(Windows/macOS 기본값) 이 모듈을 '__mp_main__'으로 다시 불러오므로
+# 여기서는 p2j_core만 불러오고 GUI 모듈(customtkinter, Tk)은 main() 안에서만 불러옴
 
 
 def main() -> None:
-    """메인 함수"""
-    init_window: Optional[InitializationWindow] = None
-    
-    try:
-        init_window = InitializationWindow()
-        init_window.mainloop()
-    except KeyboardInterrupt:
-        sys.exit(0)
-    except Exception as e:
-        print(f"초기화 오류: {e}")
-        sys.exit(1)
-    
-    result = InitializationResult()
-    
-    if init_window:
-        try:
-            result.update_started = init_window.result.update_started
-            result.launch_main = init_window.result.launch_main
-        except Exception:
-            pass
-        
-        with suppress(Exception):
-            init_window.destroy()
-        
-        del init_window
-    
-    time.sleep(0.5)
-    
-    if result.update_started:
-        sys.exit(0)
-    
-    if not result.launch_main:
-        sys.exit(1)
+    """메인 함수 (명령줄 하위 명령이면 GUI 없이 실행)"""
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        sys.exit(cli_main(sys.argv[1:]))
     
-    try:
-        root = TkinterDnD.Tk()
-        app = PDFtoJPGApp(root)
-        root.mainloop()
-    except Exception as e:
-        messagebox.showerror("오류", f"프로그램 실행 중 오류 발생:\n{e}")
-        sys.exit(1)
+    from p2j_gui import main as gui_main
+    gui_main()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
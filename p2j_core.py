@@ -0,0 +1,2973 @@
+import os
+import sys
+import re
+import io
+import json
+import zipfile
+import hashlib
+import math
+import shutil
+import argparse
+import time
+import zlib
+import random
+import platform
+import importlib.util
+import tempfile
+import subprocess
+import queue
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import List, Optional, Callable, Tuple, Dict, Any, Iterator, Iterable, Deque
+from dataclasses import dataclass, asdict, fields, replace
+from collections import OrderedDict, deque
+from contextlib import suppress, contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+
+
+# ==================== 설정 ====================
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """애플리케이션 전역 설정"""
+    APP_TITLE: str = "PDF → JPG 변환기 [made by. 류호준]"
+    CURRENT_VERSION: str = "2.2.1"
+    APP_REPO_OWNER: str = "c-closed"
+    APP_REPO_NAME: str = "P2J"
+    POPPLER_REPO_OWNER: str = "oschwartz10612"
+    POPPLER_REPO_NAME: str = "poppler-windows"
+    INIT_WINDOW_SIZE: str = "700x400"
+    MAIN_WINDOW_SIZE: str = "600x300"
+    ICON_FILENAME: str = "icon.ico"
+    POPPLER_FOLDER_NAME: str = "poppler"
+    POPPLER_PATH_ENV: str = "P2J_POPPLER_PATH"
+    OFFLINE_ENV: str = "P2J_OFFLINE"
+    METRICS_ENV: str = "P2J_METRICS"
+    METRICS_PROM_ENV: str = "P2J_METRICS_PROM"
+    CONVERSION_DPI: int = 200
+    MAX_DPI: int = 1200
+    OUTPUT_FORMAT: str = "jpeg"
+    IMAGE_QUALITY: int = 75
+    ENCODE_THREADS: int = 2
+    ENCODE_QUEUE_SIZE: int = 4
+    ARCHIVE_CHUNK_SIZE: int = 8
+    PAGE_QUEUE_SIZE: int = 4
+    RENDER_ENGINE: str = "poppler"
+    SETTINGS_FILENAME: str = "p2j_settings.json"
+    CHUNK_SIZE: int = 32
+    PDFINFO_WORKERS: int = 8
+    PDFINFO_CACHE_SIZE: int = 4096
+    PDFINFO_CACHE_FILENAME: str = "pdfinfo_cache.json"
+    RENDER_CACHE_SIZE: int = 4096
+    RENDER_CACHE_FILENAME: str = "render_cache.json"
+    UPDATE_CACHE_FILENAME: str = "update_cache.json"
+    UPDATE_CHECK_TTL: int = 6 * 60 * 60
+    GITHUB_API_URL: str = "https://api.github.com"
+    RELEASE_CACHE_FILENAME: str = "release_cache.json"
+    REQUEST_TIMEOUT: int = 10
+    DOWNLOAD_TIMEOUT: int = 90
+    DOWNLOAD_CHUNK_SIZE: int = 65536
+    DOWNLOAD_SEGMENTS: int = 4
+    DOWNLOAD_SEGMENT_MIN_SIZE: int = 4 * 1024 * 1024
+    DOWNLOAD_RETRIES: int = 3
+    PROGRESS_UPDATE_INTERVAL: int = 1
+    PROGRESS_LOG_INTERVAL: float = 0.25
+    EXTRACT_THREADS: int = 4
+    AUTO_CLOSE_COUNTDOWN_SECONDS: int = 3
+    COMPLETION_COUNTDOWN_SECONDS: int = 3
+
+
+CONFIG = AppConfig()
+
+OUTPUT_EXTENSIONS: Dict[str, str] = {
+    "jpeg": "jpg",
+    "png": "png",
+    "tiff": "tif",
+    "webp": "webp",
+    "avif": "avif",
+}
+
+# pdftoppm이 직접 인코딩하는 형식 (나머지는 PPM으로 받아 PIL로 인코딩)
+STREAM_FORMATS: Dict[str, str] = {
+    "jpeg": "jpeg",
+    "png": "png",
+}
+
+# 결과를 페이지 파일 대신 압축 파일 하나에 저장 (cbz는 만화책 뷰어용 ZIP)
+ARCHIVE_FORMATS: Tuple[str, ...] = ("none", "zip", "cbz")
+
+# 품질 옵션을 쓰는 손실 압축 형식
+LOSSY_FORMATS: Tuple[str, ...] = ("jpeg", "webp", "avif")
+
+PDFTOPPM_FORMAT_FLAGS: Dict[str, Optional[str]] = {
+    "jpeg": "-jpeg",
+    "png": "-png",
+    "ppm": None,
+}
+
+RENDER_ENGINES: Tuple[str, ...] = ("poppler", "pdfium")
+
+# gray: 8비트 회색조, mono: 1비트 흑백 (JPEG는 1비트를 지원하지 않아 회색조로 저장), auto: 페이지마다 판단
+COLOR_MODES: Tuple[str, ...] = ("color", "gray", "mono", "auto")
+
+PDFINFO_PAGE_SIZE_PATTERN = re.compile(r"^Page\s+(\d+) size:\s+([\d.]+) x ([\d.]+)", re.MULTILINE)
+PDFINFO_PAGE_ROT_PATTERN = re.compile(r"^Page\s+(\d+) rot:\s+(\d+)", re.MULTILINE)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PPM_HEADER_PATTERN = re.compile(rb"P([456])\s+(\d+)\s+(\d+)\s")
+PPM_MAXVAL_PATTERN = re.compile(rb"(\d+)\s")
+# 작업자 프로세스에서 실행하는 pdftoppm도 콘솔 창 없이 실행 (Windows)
+POPEN_CREATION_FLAGS = 0x08000000 if sys.platform == "win32" else 0
+
+
+# ==================== 유틸리티 ====================
+
+
+class ConversionCancelled(Exception):
+    """변환 작업 취소"""
+
+
+class PathUtils:
+    """경로 관리 유틸리티"""
+    
+    @staticmethod
+    def get_app_directory() -> Path:
+        """애플리케이션 실행 디렉토리 반환"""
+        if getattr(sys, 'frozen', False):
+            return Path(sys.executable).parent
+        return Path(__file__).parent
+    
+    @staticmethod
+    def get_icon_path() -> Optional[str]:
+        """아이콘 파일 경로 반환"""
+        icon_path = PathUtils.get_app_directory() / CONFIG.ICON_FILENAME
+        return str(icon_path) if icon_path.exists() else None
+    
+    @staticmethod
+    def get_poppler_path() -> Optional[str]:
+        """Poppler bin 디렉토리 경로 반환 (환경 변수 → PATH → 프로그램 폴더 순서로 탐색)"""
+        configured = os.environ.get(CONFIG.POPPLER_PATH_ENV)
+        if configured:
+            return configured
+        
+        system_pdftoppm = shutil.which("pdftoppm")
+        if system_pdftoppm:
+            return str(Path(system_pdftoppm).parent)
+        
+        return PathUtils.get_bundled_poppler_path()
+    
+    @staticmethod
+    def get_bundled_poppler_path() -> Optional[str]:
+        """프로그램 폴더에 설치된 Poppler bin 디렉토리 경로 반환"""
+        poppler_dir = PathUtils.get_app_directory() / CONFIG.POPPLER_FOLDER_NAME
+        
+        if not poppler_dir.exists():
+            return None
+        
+        for item in poppler_dir.iterdir():
+            if item.is_dir() and "poppler" in item.name.lower():
+                bin_path = item / "Library" / "bin"
+                if (bin_path / "pdftoppm.exe").exists():
+                    return str(bin_path)
+        
+        return None
+    
+    @staticmethod
+    def is_offline() -> bool:
+        """오프라인 모드 여부 (환경 변수로 지정, 네트워크 요청을 하지 않음)"""
+        return os.environ.get(CONFIG.OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def link_or_copy(src: Path, dest: Path) -> None:
+        """파일을 하드 링크로 연결 (다른 드라이브 등으로 실패하면 복사)
+        
+        연결된 파일은 제자리에서 덮어쓰면 양쪽이 함께 바뀌므로 새 파일로 교체해서 써야 함
+        """
+        if dest.exists():
+            dest.unlink()
+        
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copy2(src, dest)
+    
+    @staticmethod
+    def get_archive_path(output_folder: Path, pdf_path: str, archive: str) -> Path:
+        """압축 파일 저장 경로 (결과 폴더 대신 같은 위치에 '결과 폴더 이름.zip/.cbz')
+        
+        원본 이름을 그대로 쓰면 옆에 있던 같은 이름의 압축 파일을 덮어쓰므로 결과 폴더 이름을 따름
+        """
+        return Path(output_folder).parent / f"{Path(output_folder).name}.{archive}"
+    
+    @staticmethod
+    def get_output_folder(pdf_path: Path, output_root: Optional[Path] = None, subdir: Optional[Path] = None) -> Path:
+        """PDF 파일의 변환 결과 폴더 경로 반환
+        
+        output_root를 주면 그 아래에 입력 폴더 기준 하위 폴더(subdir) 구조를 그대로 만듦
+        """
+        parent = output_root / (subdir or Path()) if output_root else pdf_path.parent
+        return parent / f"JPG 변환({pdf_path.stem})"
+
+
+class LogCallback:
+    """로깅 콜백 유틸리티"""
+    
+    @staticmethod
+    def log(callback: Optional[Callable[[str, bool], None]], message: str, is_progress: bool = False) -> None:
+        """로그 메시지 전달"""
+        if callback:
+            callback(message, is_progress)
+
+
+class ArchiveWriter:
+    """변환 결과를 ZIP/CBZ 파일에 바로 기록 (페이지 파일을 만들지 않음)
+    
+    '이름.tmp'에 쓰다가 close()에서 원래 이름으로 교체하므로 실패/취소 시 기존 파일은 그대로 남음
+    """
+    
+    def __init__(self, path: Path, compress: bool = False):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(self.path.name + ".tmp")
+        # JPEG/PNG/WebP/AVIF는 이미 압축되어 있으므로 그대로 저장
+        self.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self._lock = threading.Lock()
+        self._discarded: List[str] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._zip = zipfile.ZipFile(self.temp_path, "w")
+    
+    def add(self, name: str, data: bytes) -> None:
+        """항목 하나 기록"""
+        with self._lock:
+            self._zip.writestr(name, data, compress_type=self.compress_type)
+    
+    def discard(self, prefix: str) -> None:
+        """prefix로 시작하는 항목을 완성본에서 뺌 (일괄 압축 파일에서 실패한 PDF의 페이지 제거용)"""
+        with self._lock:
+            self._discarded.append(prefix)
+    
+    def close(self) -> None:
+        """압축 파일 마무리 후 원래 이름으로 교체"""
+        with self._lock:
+            self._zip.close()
+            if self._discarded:
+                self._rewrite_without_discarded()
+            os.replace(self.temp_path, self.path)
+    
+    def _rewrite_without_discarded(self) -> None:
+        """ZIP은 항목을 지울 수 없으므로 뺄 항목을 제외하고 새로 씀"""
+        filtered_path = self.path.with_name(self.path.name + ".tmp2")
+        try:
+            with zipfile.ZipFile(self.temp_path) as src, zipfile.ZipFile(filtered_path, "w") as dst:
+                for info in src.infolist():
+                    if not info.filename.startswith(tuple(self._discarded)):
+                        dst.writestr(info, src.read(info))
+            os.replace(filtered_path, self.temp_path)
+        finally:
+            with suppress(OSError):
+                filtered_path.unlink()
+    
+    def abort(self) -> None:
+        """실패/취소 시 쓰다 만 임시 파일 삭제 (이번 실행에서 만든 파일만 지움)"""
+        with suppress(Exception):
+            with self._lock:
+                self._zip.close()
+        with suppress(OSError):
+            self.temp_path.unlink()
+
+
+# ==================== 측정 ====================
+
+
+# 'file' 이벤트의 페이지 수 항목 (초당 페이지 수는 rendered만으로 계산)
+PAGE_COUNT_KINDS: Tuple[str, ...] = ("rendered", "skipped", "imported")
+
+
+class MetricsRecorder:
+    """변환 단계별 시간/바이트 기록 (JSON Lines, 선택적으로 Prometheus 텍스트 파일)
+    
+    이름이 '_s'로 끝나는 값은 단계별 누적 시간, 'bytes'는 기록한 바이트로 집계함
+    buffer=True이면 이벤트를 메모리에 모아 두었다가 drain()으로 넘김 (작업자 프로세스용)
+    그 외에는 누적 값만 유지하므로 Prometheus 경로만 지정해도 이벤트가 쌓이지 않음
+    """
+    
+    def __init__(self, jsonl_path: Optional[Path] = None, prometheus_path: Optional[Path] = None, buffer: bool = False):
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.prometheus_path = Path(prometheus_path) if prometheus_path else None
+        self.buffer = buffer
+        self._lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self.event_counts: Dict[str, int] = {}
+        self.stage_seconds: Dict[str, float] = {}
+        self.bytes_written = 0
+        self.pages_per_sec = 0.0
+        # 파일별 페이지 수 (렌더링, 변환 기록상 최신이라 건너뜀, 같은 내용의 결과에서 가져옴)
+        self.page_counts: Dict[str, int] = {kind: 0 for kind in PAGE_COUNT_KINDS}
+    
+    @classmethod
+    def from_env(cls) -> Optional["MetricsRecorder"]:
+        """환경 변수에 경로가 지정되어 있으면 기록기 생성"""
+        jsonl_path = os.environ.get(CONFIG.METRICS_ENV)
+        prometheus_path = os.environ.get(CONFIG.METRICS_PROM_ENV)
+        if not jsonl_path and not prometheus_path:
+            return None
+        return cls(jsonl_path or None, prometheus_path or None)
+    
+    def record(self, event: str, **fields: Any) -> None:
+        """이벤트 하나 기록"""
+        self.extend([{"ts": round(time.time(), 6), "event": event, "pid": os.getpid(), **fields}])
+    
+    @contextmanager
+    def span(self, event: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """블록 실행 시간을 'seconds_s'로 기록 (블록 안에서 필드 추가 가능)"""
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self.record(event, seconds_s=round(time.perf_counter() - start, 6), **fields)
+    
+    def extend(self, events: List[Dict[str, Any]]) -> None:
+        """기록된 이벤트 추가 (작업자 프로세스에서 돌려받은 이벤트 포함)"""
+        if not events:
+            return
+        
+        with self._lock:
+            for event in events:
+                name = event["event"]
+                self.event_counts[name] = self.event_counts.get(name, 0) + 1
+                for key, value in event.items():
+                    if key.endswith("_s") and isinstance(value, (int, float)):
+                        stage = name if key == "seconds_s" else key[:-2]
+                        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + value
+                self.bytes_written += event.get("bytes", 0)
+                if name == "file":
+                    for kind in PAGE_COUNT_KINDS:
+                        self.page_counts[kind] += event.get(kind, 0)
+                if "pages_per_sec" in event:
+                    self.pages_per_sec = event["pages_per_sec"]
+            
+            if self.jsonl_path:
+                with suppress(OSError):
+                    self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                        f.writelines(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+            if self.buffer:
+                self._pending.extend(events)
+    
+    def drain(self) -> List[Dict[str, Any]]:
+        """모아 둔 이벤트를 꺼내서 반환 (buffer=True일 때만 모음)"""
+        with self._lock:
+            events, self._pending = self._pending, []
+        return events
+    
+    def render_prometheus(self) -> str:
+        """누적 값을 Prometheus 텍스트 형식으로 변환"""
+        with self._lock:
+            lines = ["# TYPE p2j_events_total counter"]
+            lines += [f'p2j_events_total{{event="{name}"}} {count}' for name, count in sorted(self.event_counts.items())]
+            lines.append("# TYPE p2j_seconds_total counter")
+            lines += [f'p2j_seconds_total{{stage="{stage}"}} {seconds:.6f}' for stage, seconds in sorted(self.stage_seconds.items())]
+            lines.append("# TYPE p2j_pages_total counter")
+            lines += [f'p2j_pages_total{{kind="{kind}"}} {count}' for kind, count in self.page_counts.items()]
+            lines += ["# TYPE p2j_bytes_written_total counter", f"p2j_bytes_written_total {self.bytes_written}"]
+            lines += ["# TYPE p2j_pages_per_second gauge", f"p2j_pages_per_second {self.pages_per_sec:.3f}"]
+        return "\n".join(lines) + "\n"
+    
+    def flush(self) -> None:
+        """Prometheus 텍스트 파일 갱신 (읽는 쪽이 쓰다 만 파일을 보지 않도록 교체)"""
+        if not self.prometheus_path:
+            return
+        
+        temp_path = self.prometheus_path.with_name(self.prometheus_path.name + ".tmp")
+        with suppress(OSError):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(self.render_prometheus())
+            os.replace(temp_path, self.prometheus_path)
+
+
+# ==================== 변환 설정 ====================
+
+
+@dataclass(frozen=True)
+class RenderSettings:
+    """작업별 변환 설정 (설정 파일/명령줄/GUI에서 지정)"""
+    
+    dpi: int = CONFIG.CONVERSION_DPI
+    fmt: str = CONFIG.OUTPUT_FORMAT
+    quality: int = CONFIG.IMAGE_QUALITY
+    optimize: bool = False
+    multipage: bool = False
+    archive: str = "none"
+    color_mode: str = "color"
+    max_width: int = 0
+    max_height: int = 0
+    scale_to: int = 0
+    max_pixels: int = 0
+    workers: int = 0
+    engine: str = CONFIG.RENDER_ENGINE
+    
+    @property
+    def worker_count(self) -> int:
+        """동시에 실행할 작업자 수 (0이면 CPU 코어 수)"""
+        return self.workers or os.cpu_count() or 1
+    
+    @property
+    def has_size_limit(self) -> bool:
+        """최대 크기 제한 여부"""
+        return bool(self.max_width or self.max_height or self.max_pixels)
+    
+    @property
+    def has_target_size(self) -> bool:
+        """페이지 크기에 따라 해상도를 정해야 하는지 여부"""
+        return bool(self.scale_to) or self.has_size_limit
+    
+    def page_dpi(self, width_pt: float, height_pt: float) -> float:
+        """페이지 크기(포인트)에 맞는 렌더링 해상도 (목표 크기/최대 크기/최대 픽셀 수 반영)
+        
+        목표 크기에 정확히 맞도록 소수 해상도를 반환함 (dpi 항목에는 저장하지 않고 렌더러에 따로 전달)
+        """
+        dpi = self.scale_to * 72 / max(width_pt, height_pt) if self.scale_to else float(self.dpi)
+        
+        limits: List[float] = []
+        if self.max_width:
+            limits.append(self.max_width * 72 / width_pt)
+        if self.max_height:
+            limits.append(self.max_height * 72 / height_pt)
+        if self.max_pixels:
+            limits.append(72 * math.sqrt(self.max_pixels / (width_pt * height_pt)))
+        if limits:
+            dpi = min(dpi, min(limits))
+        
+        # 부동소수점 오차로 목표보다 한 픽셀 커지지 않도록 살짝 낮춤 (pdftoppm은 올림으로 크기를 정함)
+        if self.scale_to or limits:
+            dpi *= 1 - 1e-9
+        
+        return min(dpi, float(CONFIG.MAX_DPI))
+    
+    @property
+    def stream_format(self) -> str:
+        """pdftoppm 표준 출력으로 받을 형식 (PIL로 인코딩해야 하면 무손실 PPM)"""
+        if self.optimize:
+            return "ppm"
+        return STREAM_FORMATS.get(self.fmt, "ppm")
+    
+    @property
+    def output_color_mode(self) -> str:
+        """실제로 저장할 색상 모드 (JPEG는 1비트를 지원하지 않아 mono도 회색조로 저장)"""
+        if self.color_mode == "mono" and self.fmt == "jpeg":
+            return "gray"
+        return self.color_mode
+    
+    def fit_size(self, size: Tuple[int, int]) -> Tuple[int, int]:
+        """최대 크기 안에 들도록 줄인 이미지 크기"""
+        width, height = size
+        scale = 1.0
+        if self.max_width:
+            scale = min(scale, self.max_width / width)
+        if self.max_height:
+            scale = min(scale, self.max_height / height)
+        if self.max_pixels:
+            scale = min(scale, math.sqrt(self.max_pixels / (width * height)))
+        if scale >= 1:
+            return size
+        return max(1, int(width * scale)), max(1, int(height * scale))
+    
+    def fits(self, size: Tuple[int, int]) -> bool:
+        """이미지 크기가 최대 크기 안에 드는지 확인"""
+        return self.fit_size(size) == tuple(size)
+    
+    def validate(self) -> None:
+        """설정 값 확인 (잘못된 값이면 ValueError)"""
+        if not 1 <= self.dpi <= CONFIG.MAX_DPI:
+            raise ValueError(f"DPI는 1~{CONFIG.MAX_DPI} 사이여야 합니다: {self.dpi}")
+        if self.fmt not in OUTPUT_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {self.fmt}")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"품질은 1~100 사이여야 합니다: {self.quality}")
+        if self.multipage and self.fmt != "tiff":
+            raise ValueError("여러 페이지 파일은 TIFF 형식에서만 만들 수 있습니다.")
+        if self.archive not in ARCHIVE_FORMATS:
+            raise ValueError(f"지원하지 않는 압축 파일 형식입니다: {self.archive}")
+        if self.multipage and self.archive != "none":
+            raise ValueError("여러 페이지 TIFF와 압축 파일 저장은 함께 쓸 수 없습니다.")
+        if self.color_mode not in COLOR_MODES:
+            raise ValueError(f"지원하지 않는 색상 모드입니다: {self.color_mode}")
+        if self.max_width < 0 or self.max_height < 0 or self.max_pixels < 0:
+            raise ValueError("최대 크기는 0(제한 없음) 이상이어야 합니다.")
+        if self.scale_to < 0:
+            raise ValueError("목표 크기는 0(해상도 사용) 이상이어야 합니다.")
+        if self.workers < 0:
+            raise ValueError("작업자 수는 0(자동) 이상이어야 합니다.")
+        if self.engine not in RENDER_ENGINES:
+            raise ValueError(f"알 수 없는 렌더링 엔진: {self.engine}")
+    
+    def override(self, **changes: Any) -> "RenderSettings":
+        """None이 아닌 값만 바꾼 새 설정 반환"""
+        return replace(self, **{key: value for key, value in changes.items() if value is not None})
+    
+    def output_key(self) -> Dict[str, Any]:
+        """페이지 이미지에 영향을 주는 설정 (변환 기록 비교용, 작업자 수/저장 방식 제외)"""
+        data = self.to_dict()
+        for key in ("workers", "multipage", "archive"):
+            del data[key]
+        return data
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """설정 파일 형식으로 변환 (fmt는 "format"으로 저장)"""
+        return {("format" if key == "fmt" else key): value for key, value in asdict(self).items()}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RenderSettings":
+        """설정 파일 내용으로 생성 (없는 항목은 기본값)"""
+        types = {f.name: f.type for f in fields(cls)}
+        values: Dict[str, Any] = {}
+        
+        for key, value in data.items():
+            name = "fmt" if key == "format" else key
+            if name not in types or key == "fmt":
+                raise ValueError(f"알 수 없는 설정 항목: {key}")
+            
+            expected = types[name]
+            # bool은 int의 하위 형식이므로 정수 항목에 true/false가 들어오지 않도록 따로 확인
+            if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+                raise ValueError(f"설정 값이 올바르지 않습니다: {key}={value!r}")
+            values[name] = value
+        
+        return cls(**values)
+    
+    @classmethod
+    def load(cls, path: Path) -> "RenderSettings":
+        """설정 파일(JSON 또는 TOML) 읽기"""
+        path = Path(path)
+        
+        if path.suffix.lower() == ".toml":
+            # tomllib은 Python 3.11부터 표준 라이브러리, 이전 버전은 같은 API의 tomli 사용
+            try:
+                import tomllib
+            except ImportError:
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise ValueError(
+                        f"Python {platform.python_version()}에서 TOML 설정 파일을 읽으려면 tomli를 설치하세요. "
+                        f"(pip install tomli, 또는 JSON 설정 파일 사용): {path}"
+                    ) from None
+            
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        
+        if not isinstance(data, dict):
+            raise ValueError(f"설정 파일 형식이 올바르지 않습니다: {path}")
+        
+        return cls.from_dict(data)
+    
+    def save(self, path: Path) -> None:
+        """설정 파일(JSON) 저장"""
+        path = Path(path)
+        temp_path = path.with_name(path.name + ".tmp")
+        
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+
+# ==================== PDF 정보 캐시 ====================
+
+
+class PDFInfoCache:
+    """pdfinfo 결과 캐시 (경로 + 수정 시각 + 크기 기준, LRU 제거, 선택적 디스크 저장)"""
+    
+    def __init__(self, max_entries: int = CONFIG.PDFINFO_CACHE_SIZE, store_path: Optional[Path] = None):
+        self.max_entries = max(1, max_entries)
+        self.store_path = store_path
+        self._entries: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        if store_path:
+            self.load()
+    
+    @staticmethod
+    def make_key(pdf_path: str) -> Tuple[str, int, int]:
+        """캐시 키 생성 (파일이 바뀌면 키도 달라짐)"""
+        stat = os.stat(pdf_path)
+        return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+    
+    def get(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+        """캐시된 PDF 정보 반환"""
+        try:
+            key = self.make_key(pdf_path)
+        except OSError:
+            return None
+        
+        with self._lock:
+            info = self._entries.get(key)
+            if info is not None:
+                self._entries.move_to_end(key)
+            return info
+    
+    def put(self, pdf_path: str, info: Dict[str, Any]) -> None:
+        """PDF 정보 저장"""
+        try:
+            key = self.make_key(pdf_path)
+        except OSError:
+            return
+        
+        with self._lock:
+            self._entries[key] = info
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+    
+    def load(self) -> None:
+        """디스크에 저장된 캐시 불러오기"""
+        if not self.store_path or not self.store_path.exists():
+            return
+        
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # 형식이 맞지 않는 항목이 하나라도 있으면 캐시를 비어 있는 것으로 취급 (변환은 계속 진행)
+        entries: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        try:
+            for path, mtime_ns, size, info in records[-self.max_entries:]:
+                if not (isinstance(path, str) and isinstance(mtime_ns, int) and isinstance(size, int) and isinstance(info, dict)):
+                    return
+                entries[(path, mtime_ns, size)] = info
+        except (TypeError, ValueError, KeyError):
+            return
+        
+        with self._lock:
+            self._entries.update(entries)
+    
+    def save(self) -> None:
+        """변경된 캐시를 디스크에 저장"""
+        if not self.store_path:
+            return
+        
+        with self._lock:
+            if not self._dirty:
+                return
+            records = [[*key, info] for key, info in self._entries.items()]
+            self._dirty = False
+        
+        temp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        with suppress(OSError):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False)
+            os.replace(temp_path, self.store_path)
+
+
+# ==================== 변환 기록 ====================
+
+
+class ConversionManifest:
+    """결과 폴더별 변환 기록 (원본 해시, 변환 설정, 완료된 페이지)"""
+    
+    FILENAME: str = ".p2j_manifest.json"
+    VERSION: int = 1
+    HASH_CHUNK_SIZE: int = 1 << 20
+    
+    def __init__(
+        self,
+        output_folder: Path,
+        source: Dict[str, Any],
+        settings: Dict[str, Any],
+        total_pages: int,
+        completed: Optional[List[int]] = None
+    ):
+        self.output_folder = output_folder
+        self.source = source
+        self.settings = settings
+        self.total_pages = total_pages
+        self.completed = set(completed or [])
+        self._lock = threading.Lock()
+        self._dirty = False
+    
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        """파일의 SHA-256 해시 계산"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @classmethod
+    def _read_stored(cls, output_folder: Path) -> Optional[Dict[str, Any]]:
+        """저장된 기록 원본 읽기 (형식이 맞지 않으면 기록이 없는 것으로 취급)"""
+        stored: Optional[Dict[str, Any]] = None
+        with suppress(OSError, ValueError):
+            with open(output_folder / cls.FILENAME, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        
+        if not isinstance(stored, dict) or stored.get("version") != cls.VERSION:
+            return None
+        
+        source = stored.get("source")
+        completed = stored.get("completed")
+        pages = stored.get("pages")
+        if (
+            not isinstance(source, dict)
+            or not isinstance(stored.get("settings"), dict)
+            or not isinstance(pages, int) or isinstance(pages, bool)
+            or not isinstance(completed, list)
+            or not all(isinstance(page, int) and not isinstance(page, bool) for page in completed)
+        ):
+            return None
+        return stored
+    
+    @classmethod
+    def read(cls, output_folder: Path) -> Optional["ConversionManifest"]:
+        """다른 결과 폴더의 기록을 원본 확인 없이 읽기"""
+        stored = cls._read_stored(output_folder)
+        if not stored or not isinstance(stored["source"].get("sha256"), str):
+            return None
+        return cls(output_folder, stored["source"], stored["settings"], stored["pages"], stored["completed"])
+    
+    @classmethod
+    def load(
+        cls,
+        output_folder: Path,
+        pdf_path: str,
+        total_pages: int,
+        settings: Dict[str, Any]
+    ) -> "ConversionManifest":
+        """기존 기록 불러오기 (원본이나 설정이 바뀌었으면 빈 기록으로 시작)"""
+        stored = cls._read_stored(output_folder)
+        stat = os.stat(pdf_path)
+        source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        stored_source = stored.get("source", {}) if stored else {}
+        
+        # 크기와 수정 시각이 같으면 저장된 해시를 그대로 사용 (원본 전체 읽기 생략)
+        if all(stored_source.get(key) == value for key, value in source.items()) and isinstance(stored_source.get("sha256"), str):
+            source["sha256"] = stored_source["sha256"]
+        else:
+            source["sha256"] = cls.hash_file(pdf_path)
+        
+        completed: List[int] = []
+        if (
+            stored
+            and stored_source.get("sha256") == source["sha256"]
+            and stored.get("settings") == settings
+            and stored.get("pages") == total_pages
+        ):
+            completed = stored.get("completed", [])
+        
+        return cls(output_folder, source, settings, total_pages, completed)
+    
+    def content_key(self) -> str:
+        """내용 기반 키 (원본 해시 + 변환 설정)"""
+        return f"{self.source['sha256']}:{json.dumps(self.settings, sort_keys=True)}"
+    
+    def missing_pages(self, extension: str) -> List[int]:
+        """다시 변환해야 하는 페이지 목록 (기록이 없거나 결과 파일이 사라진 페이지)"""
+        digits = len(str(self.total_pages))
+        existing = set(os.listdir(self.output_folder)) if self.output_folder.is_dir() else set()
+        
+        with self._lock:
+            return [
+                page_num for page_num in range(1, self.total_pages + 1)
+                if page_num not in self.completed or f"{str(page_num).zfill(digits)}.{extension}" not in existing
+            ]
+    
+    def import_pages(self, source: "ConversionManifest", pages: List[int], extension: str) -> List[int]:
+        """같은 원본/설정으로 변환된 다른 결과 폴더에서 페이지 가져오기 (하드 링크, 안 되면 복사)"""
+        if source.output_folder == self.output_folder or source.content_key() != self.content_key():
+            return []
+        
+        with source._lock:
+            available = set(source.completed)
+        
+        digits = len(str(self.total_pages))
+        imported: List[int] = []
+        
+        for page_num in pages:
+            if page_num not in available:
+                continue
+            
+            filename = f"{str(page_num).zfill(digits)}.{extension}"
+            try:
+                self.output_folder.mkdir(parents=True, exist_ok=True)
+                PathUtils.link_or_copy(source.output_folder / filename, self.output_folder / filename)
+            except OSError:
+                continue
+            
+            self.mark_done(page_num)
+            imported.append(page_num)
+        
+        return imported
+    
+    def mark_done(self, page_num: int) -> None:
+        """페이지 완료 기록"""
+        with self._lock:
+            self.completed.add(page_num)
+            self._dirty = True
+    
+    def save(self) -> None:
+        """기록 저장"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "source": self.source,
+                "settings": self.settings,
+                "pages": self.total_pages,
+                "completed": sorted(self.completed),
+            }
+            self._dirty = False
+        
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.output_folder / self.FILENAME
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+
+
+class RenderCache:
+    """내용 기반 렌더링 색인 (원본 해시 + 변환 설정 → 결과 폴더, LRU 제거)"""
+    
+    MAX_FOLDERS_PER_KEY: int = 4
+    
+    def __init__(self, store_path: Optional[Path] = None, max_entries: int = CONFIG.RENDER_CACHE_SIZE):
+        self.store_path = store_path
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        if store_path:
+            self.load()
+    
+    def lookup(self, key: str) -> List[Path]:
+        """같은 내용이 변환된 결과 폴더 목록"""
+        with self._lock:
+            folders = self._entries.get(key)
+            if folders is None:
+                return []
+            self._entries.move_to_end(key)
+            return [Path(folder) for folder in folders]
+    
+    def register(self, key: str, output_folder: Path) -> None:
+        """결과 폴더 등록"""
+        folder = str(output_folder)
+        
+        with self._lock:
+            folders = [f for f in self._entries.get(key, []) if f != folder]
+            folders.insert(0, folder)
+            self._entries[key] = folders[:self.MAX_FOLDERS_PER_KEY]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+    
+    def load(self) -> None:
+        """디스크에 저장된 색인 불러오기"""
+        if not self.store_path or not self.store_path.exists():
+            return
+        
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # 형식이 맞지 않는 항목이 하나라도 있으면 색인을 비어 있는 것으로 취급 (변환은 계속 진행)
+        entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        try:
+            for key, folders in records[-self.max_entries:]:
+                if not (isinstance(key, str) and isinstance(folders, list) and all(isinstance(f, str) for f in folders)):
+                    return
+                entries[key] = folders
+        except (TypeError, ValueError, KeyError):
+            return
+        
+        with self._lock:
+            self._entries.update(entries)
+    
+    def save(self) -> None:
+        """변경된 색인을 디스크에 저장"""
+        if not self.store_path:
+            return
+        
+        with self._lock:
+            if not self._dirty:
+                return
+            records = [[key, folders] for key, folders in self._entries.items()]
+            self._dirty = False
+        
+        temp_path = self.store_path.with_name(self.store_path.name + ".tmp")
+        with suppress(OSError):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False)
+            os.replace(temp_path, self.store_path)
+
+
+# ==================== 렌더링 엔진 ====================
+
+
+def check_encoder(fmt: str) -> bool:
+    """PIL로 해당 형식을 저장할 수 있는지 확인 (AVIF는 pillow-avif-plugin으로도 지원)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+    
+    if fmt == "avif" and importlib.util.find_spec("pillow_avif") is not None:
+        # 불러오면 PIL에 AVIF 저장 기능이 등록됨
+        importlib.import_module("pillow_avif")
+    
+    Image.init()
+    return fmt.upper() in Image.SAVE
+
+
+def timed_encode_image(image: Any, settings: RenderSettings) -> Tuple[bytes, float]:
+    """encode_image 결과와 걸린 시간(초) 반환"""
+    start = time.perf_counter()
+    data = encode_image(image, settings)
+    return data, time.perf_counter() - start
+
+
+def encode_image(image: Any, settings: RenderSettings) -> bytes:
+    """PIL 이미지를 설정에 맞게 인코딩 (색상 모드 변환, 최대 크기 제한 포함)"""
+    from PIL import Image
+    
+    if settings.fmt == "avif" and not check_encoder("avif"):
+        raise RuntimeError("AVIF로 저장하려면 pillow-avif-plugin을 설치하세요.")
+    
+    mode = settings.output_color_mode
+    if mode == "gray" and image.mode != "L":
+        image = image.convert("L")
+    elif mode == "mono" and image.mode != "1":
+        image = image.convert("L").convert("1", dither=Image.Dither.NONE)
+    
+    if not settings.fits(image.size):
+        image = image.resize(settings.fit_size(image.size))
+    
+    options: Dict[str, Any] = {}
+    if settings.fmt in LOSSY_FORMATS:
+        options["quality"] = settings.quality
+    if settings.optimize and settings.fmt in ("jpeg", "png"):
+        options["optimize"] = True
+    if settings.fmt == "tiff" and image.mode == "1":
+        # 1비트 TIFF는 팩스용 CCITT G4로 압축
+        options["compression"] = "group4"
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format=settings.fmt.upper(), **options)
+    return buffer.getvalue()
+
+
+def classify_color_mode(images: List[Tuple[str, int]]) -> str:
+    """페이지에 들어 있는 이미지 (색 공간, 비트 수)로 색상 모드 추정
+    
+    스캔 문서처럼 회색조/1비트 이미지만 있는 페이지만 흑백으로 보고 나머지는 컬러로 렌더링
+    """
+    if not images or any(colorspace != "gray" for colorspace, _ in images):
+        return "color"
+    return "mono" if all(bits == 1 for _, bits in images) else "gray"
+
+
+class PageRenderer:
+    """페이지 렌더링 엔진 인터페이스"""
+    
+    name: str = ""
+    # 한 프로세스 안의 여러 스레드가 동시에 렌더링할 수 있는지 여부
+    parallel_in_process: bool = True
+    
+    def get_info(self, pdf_path: str) -> Dict[str, Any]:
+        """PDF 정보 확인 (최소한 "Pages" 포함)"""
+        raise NotImplementedError
+    
+    def get_page_sizes(self, pdf_path: str, first_page: int, last_page: int) -> List[Tuple[float, float]]:
+        """페이지별 크기 (포인트, 회전 반영) 확인"""
+        raise NotImplementedError
+    
+    def get_color_modes(self, pdf_path: str, first_page: int, last_page: int) -> List[str]:
+        """페이지별 색상 모드 추정 (판단할 수 없으면 color)"""
+        return ["color"] * (last_page - first_page + 1)
+    
+    def iter_pages(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        settings: RenderSettings,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        dpi: Optional[float] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """페이지를 렌더링하여 순서대로 반환
+        
+        렌더러가 설정한 형식으로 바로 만들 수 있으면 인코딩된 bytes를,
+        아니면 encode_image로 인코딩할 PIL 이미지를 반환
+        dpi를 주면 settings.dpi 대신 그 해상도(소수 가능)로 렌더링
+        """
+        raise NotImplementedError
+
+
+class PopplerRenderer(PageRenderer):
+    """pdftoppm 하위 프로세스 기반 엔진"""
+    
+    name = "poppler"
+    STREAM_READ_SIZE: int = 1 << 20
+    CANCEL_POLL_INTERVAL: float = 0.1
+    
+    def __init__(self, poppler_path: Optional[str]):
+        self.poppler_path = poppler_path
+    
+    def get_info(self, pdf_path: str) -> Dict[str, Any]:
+        """pdfinfo로 PDF 정보 확인"""
+        from pdf2image import pdfinfo_from_path
+        
+        return pdfinfo_from_path(pdf_path, poppler_path=self.poppler_path)
+    
+    def get_page_sizes(self, pdf_path: str, first_page: int, last_page: int) -> List[Tuple[float, float]]:
+        """pdfinfo로 페이지별 크기 (포인트, 회전 반영) 확인"""
+        command = [self._get_command("pdfinfo"), "-f", str(first_page), "-l", str(last_page), pdf_path]
+        result = subprocess.run(command, capture_output=True, creationflags=POPEN_CREATION_FLAGS)
+        if result.returncode != 0:
+            message = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"pdfinfo 실행 실패 (코드 {result.returncode}): {message}")
+        
+        output = result.stdout.decode("utf-8", errors="replace")
+        sizes = {int(n): (float(w), float(h)) for n, w, h in PDFINFO_PAGE_SIZE_PATTERN.findall(output)}
+        rotations = {int(n): int(rot) for n, rot in PDFINFO_PAGE_ROT_PATTERN.findall(output)}
+        
+        page_sizes: List[Tuple[float, float]] = []
+        for page_num in range(first_page, last_page + 1):
+            if page_num not in sizes:
+                raise RuntimeError(f"pdfinfo에서 {page_num}페이지 크기를 읽지 못했습니다.")
+            width, height = sizes[page_num]
+            # 90/270도 회전된 페이지는 가로세로가 바뀌어 렌더링됨
+            page_sizes.append((height, width) if rotations.get(page_num, 0) % 180 else (width, height))
+        
+        return page_sizes
+    
+    def get_color_modes(self, pdf_path: str, first_page: int, last_page: int) -> List[str]:
+        """pdfimages 목록(이미지를 풀지 않음)으로 페이지별 색상 모드 추정"""
+        command = [self._get_command("pdfimages"), "-list", "-f", str(first_page), "-l", str(last_page), pdf_path]
+        result = subprocess.run(command, capture_output=True, creationflags=POPEN_CREATION_FLAGS)
+        if result.returncode != 0:
+            return super().get_color_modes(pdf_path, first_page, last_page)
+        
+        # page num type width height color comp bpc ... (머리글 두 줄 다음부터)
+        images: Dict[int, List[Tuple[str, int]]] = {}
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines()[2:]:
+            columns = line.split()
+            if len(columns) >= 8 and columns[0].isdigit() and columns[2] == "image" and columns[7].isdigit():
+                images.setdefault(int(columns[0]), []).append((columns[5], int(columns[7])))
+        
+        return [classify_color_mode(images.get(page_num, [])) for page_num in range(first_page, last_page + 1)]
+    
+    def _get_command(self, name: str) -> str:
+        """Poppler 실행 파일 경로 반환"""
+        return os.path.join(self.poppler_path, name) if self.poppler_path else name
+    
+    @staticmethod
+    def _find_jpeg_end(buffer: bytearray) -> int:
+        """버퍼 맨 앞 JPEG의 EOI 마커 다음 위치 반환 (아직 다 받지 못했으면 -1)
+        
+        FF D9는 낮은 품질의 양자화 테이블 안에도 나올 수 있으므로 마커 구간은 길이 필드로 건너뛰고
+        SOS 다음의 압축 데이터에서만 마커를 찾음 (FF 00과 RST 마커는 데이터의 일부)
+        """
+        if len(buffer) < 2:
+            return -1
+        if not buffer.startswith(b"\xff\xd8"):
+            raise RuntimeError("pdftoppm 출력이 올바른 JPEG가 아닙니다.")
+        
+        pos = 2
+        while pos + 2 <= len(buffer):
+            if buffer[pos] != 0xFF:
+                raise RuntimeError("pdftoppm 출력이 올바른 JPEG가 아닙니다.")
+            
+            marker = buffer[pos + 1]
+            if marker == 0xFF:
+                # 마커 앞의 채움 바이트
+                pos += 1
+                continue
+            if marker == 0xD9:
+                return pos + 2
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                pos += 2
+                continue
+            
+            if pos + 4 > len(buffer):
+                return -1
+            pos += 2 + int.from_bytes(buffer[pos + 2:pos + 4], "big")
+            if marker != 0xDA:
+                continue
+            
+            # 압축 데이터는 다음 마커(점진적 JPEG이면 다음 스캔, 아니면 EOI)까지
+            while True:
+                pos = buffer.find(b"\xff", pos)
+                if pos < 0 or pos + 2 > len(buffer):
+                    return -1
+                following = buffer[pos + 1]
+                if following == 0x00 or 0xD0 <= following <= 0xD7:
+                    pos += 2
+                elif following == 0xFF:
+                    pos += 1
+                else:
+                    break
+        
+        return -1
+    
+    @staticmethod
+    def _find_image_end(buffer: bytearray, stream_format: str) -> int:
+        """버퍼 맨 앞 이미지의 끝 위치 반환 (아직 다 받지 못했으면 -1)"""
+        if stream_format == "jpeg":
+            return PopplerRenderer._find_jpeg_end(buffer)
+        
+        if stream_format == "png":
+            if len(buffer) < len(PNG_SIGNATURE):
+                return -1
+            if not buffer.startswith(PNG_SIGNATURE):
+                raise RuntimeError("pdftoppm 출력이 올바른 PNG가 아닙니다.")
+            
+            pos = len(PNG_SIGNATURE)
+            while pos + 8 <= len(buffer):
+                length = int.from_bytes(buffer[pos:pos + 4], "big")
+                chunk_type = bytes(buffer[pos + 4:pos + 8])
+                pos += 12 + length
+                if chunk_type == b"IEND":
+                    return pos if pos <= len(buffer) else -1
+            return -1
+        
+        match = PPM_HEADER_PATTERN.match(buffer)
+        if not match:
+            if len(buffer) > 64:
+                raise RuntimeError("pdftoppm 출력이 올바른 PPM이 아닙니다.")
+            return -1
+        
+        kind, width, height = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        header_end = match.end()
+        
+        if kind == 4:
+            data_size = ((width + 7) // 8) * height
+        else:
+            maxval = PPM_MAXVAL_PATTERN.match(buffer, header_end)
+            if not maxval:
+                return -1
+            header_end = maxval.end()
+            data_size = width * height * (3 if kind == 6 else 1)
+        
+        end = header_end + data_size
+        return end if end <= len(buffer) else -1
+    
+    def _watch_cancel(
+        self,
+        process: subprocess.Popen,
+        cancel_check: Callable[[], bool],
+        killed: threading.Event
+    ) -> None:
+        """취소 요청 시 실행 중인 pdftoppm 종료"""
+        while process.poll() is None:
+            if cancel_check():
+                killed.set()
+                with suppress(OSError):
+                    process.kill()
+                return
+            time.sleep(self.CANCEL_POLL_INTERVAL)
+    
+    def _iter_stream(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        settings: RenderSettings,
+        stream_format: str,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        dpi: Optional[float] = None
+    ) -> Iterator[Tuple[int, bytes]]:
+        """pdftoppm 표준 출력에서 렌더링이 끝난 페이지를 stream_format 그대로 순서대로 반환"""
+        command = [self._get_command("pdftoppm")]
+        if PDFTOPPM_FORMAT_FLAGS[stream_format]:
+            command.append(PDFTOPPM_FORMAT_FLAGS[stream_format])
+        if stream_format == "jpeg":
+            command += ["-jpegopt", f"quality={settings.quality}"]
+        mode = settings.output_color_mode
+        if mode == "gray":
+            command.append("-gray")
+        elif mode == "mono":
+            command.append("-mono")
+        resolution = str(settings.dpi) if dpi is None else f"{dpi:.6f}"
+        command += ["-r", resolution, "-f", str(first_page), "-l", str(last_page), pdf_path]
+        
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=stderr_file, creationflags=POPEN_CREATION_FLAGS
+            )
+            buffer = bytearray()
+            page_num = first_page
+            killed = threading.Event()
+            
+            if cancel_check:
+                # 페이지 하나를 렌더링하는 도중에도 취소되도록 별도 스레드에서 감시
+                threading.Thread(
+                    target=self._watch_cancel, args=(process, cancel_check, killed), daemon=True
+                ).start()
+            
+            try:
+                while True:
+                    end = self._find_image_end(buffer, stream_format)
+                    
+                    if end > 0:
+                        yield page_num, bytes(buffer[:end])
+                        del buffer[:end]
+                        page_num += 1
+                        continue
+                    
+                    chunk = process.stdout.read1(self.STREAM_READ_SIZE)
+                    if not chunk:
+                        break
+                    buffer += chunk
+                
+                if process.wait() != 0 and killed.is_set():
+                    raise ConversionCancelled("변환이 취소되었습니다.")
+                
+                if process.returncode != 0:
+                    stderr_file.seek(0)
+                    message = stderr_file.read().decode(errors="replace").strip()
+                    raise RuntimeError(f"pdftoppm 실행 실패 ({process.returncode}): {message}")
+                
+                if buffer:
+                    raise RuntimeError("pdftoppm 출력이 중간에 끊겼습니다.")
+            
+            finally:
+                process.stdout.close()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+    
+    def iter_pages(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        settings: RenderSettings,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        dpi: Optional[float] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """pdftoppm으로 페이지를 렌더링하여 순서대로 반환"""
+        stream_format = settings.stream_format
+        pages = self._iter_stream(pdf_path, first_page, last_page, settings, stream_format, cancel_check, dpi)
+        
+        if stream_format == settings.fmt and not settings.has_size_limit:
+            yield from pages
+            return
+        
+        from PIL import Image
+        
+        for page_num, data in pages:
+            # 이미지는 머리글만 읽어 두고 실제 디코딩은 인코딩 스레드에서 수행
+            image = Image.open(io.BytesIO(data))
+            
+            # 크기 제한 안에 드는 페이지는 pdftoppm 결과를 그대로 사용
+            if stream_format == settings.fmt and settings.fits(image.size):
+                image.close()
+                yield page_num, data
+            else:
+                yield page_num, image
+
+
+class PdfiumRenderer(PageRenderer):
+    """pypdfium2 기반 프로세스 내 엔진 (하위 프로세스 실행/임시 파일 없음)"""
+    
+    name = "pdfium"
+    # pdfium은 스레드 안전하지 않으므로 프로세스 안에서는 한 번에 하나만 호출
+    # (클래스 속성이라 같은 프로세스의 렌더러끼리만 공유하며 작업자 프로세스는 각자 잠금을 가짐)
+    # 따라서 한 프로세스 안에서 작업자 스레드를 늘려도 렌더링은 차례로 진행되고 인코딩/저장만 겹침
+    parallel_in_process = False
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def is_available() -> bool:
+        """pypdfium2 설치 여부 (불러오지 않고 확인)"""
+        return importlib.util.find_spec("pypdfium2") is not None
+    
+    def get_info(self, pdf_path: str) -> Dict[str, Any]:
+        """pdfium으로 PDF 정보 확인"""
+        import pypdfium2 as pdfium
+        
+        with self._lock:
+            document = pdfium.PdfDocument(pdf_path)
+            try:
+                return {"Pages": len(document)}
+            finally:
+                document.close()
+    
+    def get_page_sizes(self, pdf_path: str, first_page: int, last_page: int) -> List[Tuple[float, float]]:
+        """pdfium으로 페이지별 크기 (포인트) 확인"""
+        import pypdfium2 as pdfium
+        
+        with self._lock:
+            document = pdfium.PdfDocument(pdf_path)
+            try:
+                return [tuple(document[page_num - 1].get_size()) for page_num in range(first_page, last_page + 1)]
+            finally:
+                document.close()
+    
+    def get_color_modes(self, pdf_path: str, first_page: int, last_page: int) -> List[str]:
+        """pdfium 이미지 객체 정보로 페이지별 색상 모드 추정"""
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_c
+        
+        modes: List[str] = []
+        with self._lock:
+            document = pdfium.PdfDocument(pdf_path)
+            try:
+                for page_num in range(first_page, last_page + 1):
+                    page = document[page_num - 1]
+                    images = []
+                    for image in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
+                        metadata = image.get_metadata()
+                        colorspace = "gray" if metadata.colorspace == pdfium_c.FPDF_COLORSPACE_DEVICEGRAY else "other"
+                        images.append((colorspace, metadata.bits_per_pixel))
+                    modes.append(classify_color_mode(images))
+            finally:
+                document.close()
+        
+        return modes
+    
+    def iter_pages(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        settings: RenderSettings,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        dpi: Optional[float] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """pdfium으로 페이지를 렌더링하여 순서대로 반환 (인코딩은 호출한 쪽에서 수행)"""
+        import pypdfium2 as pdfium
+        
+        with self._lock:
+            document = pdfium.PdfDocument(pdf_path)
+        
+        try:
+            for page_num in range(first_page, last_page + 1):
+                if cancel_check and cancel_check():
+                    raise ConversionCancelled("변환이 취소되었습니다.")
+                
+                with self._lock:
+                    page = document[page_num - 1]
+                    try:
+                        grayscale = settings.color_mode in ("gray", "mono")
+                        scale = (settings.dpi if dpi is None else dpi) / 72
+                        image = page.render(scale=scale, grayscale=grayscale).to_pil()
+                    finally:
+                        page.close()
+                
+                yield page_num, image
+        
+        finally:
+            with self._lock:
+                document.close()
+
+
+def create_renderer(engine: str, poppler_path: Optional[str]) -> PageRenderer:
+    """엔진 이름으로 렌더러 생성"""
+    if engine == "poppler":
+        return PopplerRenderer(poppler_path)
+    if engine == "pdfium":
+        return PdfiumRenderer()
+    raise ValueError(f"알 수 없는 렌더링 엔진: {engine}")
+
+
+# ==================== PDF 변환 ====================
+
+
+class PDFProcessor:
+    """PDF to JPG 변환 처리"""
+    
+    def __init__(
+        self,
+        poppler_path: Optional[str],
+        info_cache: Optional[PDFInfoCache] = None,
+        engine: str = CONFIG.RENDER_ENGINE
+    ):
+        self.poppler_path = poppler_path
+        self.info_cache = info_cache if info_cache is not None else PDFInfoCache()
+        self.engine = engine
+        # 지정하면 PDF 정보 확인과 페이지별 렌더링/인코딩/저장 시간을 기록
+        self.metrics: Optional[MetricsRecorder] = None
+        self.renderer = create_renderer(engine, poppler_path)
+        self._renderers: Dict[str, PageRenderer] = {engine: self.renderer}
+        # PIL 인코더는 GIL을 놓고 동작하므로 스레드에서 인코딩하는 동안 다음 페이지 렌더링을 계속할 수 있음
+        self.encode_pool = ThreadPoolExecutor(max_workers=CONFIG.ENCODE_THREADS, thread_name_prefix="p2j-encode")
+    
+    def close(self) -> None:
+        """인코딩 스레드 종료"""
+        self.encode_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def get_renderer(self, engine: str) -> PageRenderer:
+        """엔진 이름에 해당하는 렌더러 반환 (한 번 만든 렌더러는 재사용)"""
+        if engine not in self._renderers:
+            self._renderers[engine] = create_renderer(engine, self.poppler_path)
+        return self._renderers[engine]
+    
+    def get_pdf_info(self, pdf_path: str) -> Dict[str, Any]:
+        """PDF 정보 확인 (같은 파일은 캐시된 결과 사용)"""
+        info = self.info_cache.get(pdf_path)
+        if info is not None:
+            return info
+        
+        start = time.perf_counter()
+        try:
+            info = self.renderer.get_info(pdf_path)
+        except Exception as e:
+            raise RuntimeError(f"PDF 정보 읽기 실패: {e}")
+        
+        if self.metrics:
+            self.metrics.record("pdfinfo", pdf=pdf_path, seconds_s=round(time.perf_counter() - start, 6))
+        
+        self.info_cache.put(pdf_path, info)
+        return info
+    
+    def get_page_count(self, pdf_path: str) -> int:
+        """PDF 페이지 수 확인"""
+        return self.get_pdf_info(pdf_path)["Pages"]
+    
+    def iter_page_counts(
+        self,
+        pdf_files: List[str],
+        max_workers: int = CONFIG.PDFINFO_WORKERS
+    ) -> Iterator[Tuple[int, int, Optional[Exception]]]:
+        """여러 PDF의 페이지 수를 동시에 확인하여 끝난 순서대로 (순번, 페이지 수, 오류) 반환"""
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        
+        try:
+            futures = {executor.submit(self.get_page_count, pdf): index for index, pdf in enumerate(pdf_files)}
+            
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], (0 if error else future.result()), error
+        
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.info_cache.save()
+    
+    @staticmethod
+    def group_page_ranges(pages: List[int], chunk_size: Optional[int]) -> List[Tuple[int, int]]:
+        """페이지 목록을 연속 구간별로 묶고 chunk_size 단위로 분할"""
+        ranges: List[Tuple[int, int]] = []
+        
+        for page_num in sorted(pages):
+            if ranges:
+                first, last = ranges[-1]
+                if page_num == last + 1 and (not chunk_size or page_num - first < chunk_size):
+                    ranges[-1] = (first, page_num)
+                    continue
+            ranges.append((page_num, page_num))
+        
+        return ranges
+    
+    def iter_rendered_pages(
+        self,
+        pdf_path: str,
+        first_page: int,
+        last_page: int,
+        settings: RenderSettings,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """페이지 범위 렌더링
+        
+        목표 크기가 있으면 페이지 크기에 맞춰 해상도를 정해 과도한 비트맵을 만들지 않고,
+        색상 모드가 auto이면 흑백 페이지를 회색조/1비트로 렌더링
+        """
+        renderer = self.get_renderer(settings.engine)
+        
+        if not settings.has_target_size and settings.color_mode != "auto":
+            yield from renderer.iter_pages(pdf_path, first_page, last_page, settings, cancel_check)
+            return
+        
+        count = last_page - first_page + 1
+        if settings.has_target_size:
+            page_sizes = renderer.get_page_sizes(pdf_path, first_page, last_page)
+            dpis = [settings.page_dpi(width, height) for width, height in page_sizes]
+        else:
+            dpis = [float(settings.dpi)] * count
+        
+        if settings.color_mode == "auto":
+            # 출력 형식에서 같은 결과가 되는 모드(JPEG의 mono/gray)는 하나로 묶음
+            modes = [
+                replace(settings, color_mode=mode).output_color_mode
+                for mode in renderer.get_color_modes(pdf_path, first_page, last_page)
+            ]
+        else:
+            modes = [settings.color_mode] * count
+        
+        page_settings = list(zip(dpis, modes))
+        
+        # 해상도와 색상 모드가 같은 연속 페이지는 한 번에 렌더링
+        start = 0
+        for end in range(1, count + 1):
+            if end == count or page_settings[end] != page_settings[start]:
+                dpi, mode = page_settings[start]
+                # 페이지별 해상도는 소수일 수 있으므로 설정(dpi: int)에 넣지 않고 따로 전달
+                yield from renderer.iter_pages(
+                    pdf_path, first_page + start, first_page + end - 1, replace(settings, color_mode=mode), cancel_check, dpi
+                )
+                start = end
+    
+    def convert_page_range(
+        self,
+        pdf_path: str,
+        output_folder: Path,
+        first_page: int,
+        last_page: int,
+        digits: int,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        settings: Optional[RenderSettings] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        page_writer: Optional[Callable[[int, bytes], None]] = None
+    ) -> int:
+        """지정한 페이지 범위를 이미지로 변환 (렌더링 결과를 최종 파일명으로 바로 저장)
+        
+        PIL 인코딩이 필요한 페이지는 인코딩 스레드에 넘기고 다음 페이지 렌더링을 계속함
+        page_writer를 주면 파일 대신 (페이지 번호, 데이터)를 넘김
+        """
+        settings = settings or RenderSettings()
+        extension = OUTPUT_EXTENSIONS[settings.fmt]
+        converted = 0
+        # (페이지 번호, 인코딩 작업, 렌더링 시간)
+        encoding: Deque[Tuple[int, Any, float]] = deque()
+        metrics = self.metrics
+        
+        def write_encoded(page_num: int, future: Any, render_s: float) -> None:
+            wait_start = time.perf_counter()
+            data, encode_s = future.result()
+            write_page(page_num, data, render_s, encode_s, time.perf_counter() - wait_start)
+        
+        def write_page(
+            page_num: int,
+            data: bytes,
+            render_s: float = 0.0,
+            encode_s: float = 0.0,
+            encode_wait_s: float = 0.0
+        ) -> None:
+            nonlocal converted
+            write_start = time.perf_counter()
+            
+            if page_writer:
+                page_writer(page_num, data)
+            else:
+                dest_path = output_folder / f"{str(page_num).zfill(digits)}.{extension}"
+                temp_path = dest_path.with_name(dest_path.name + ".tmp")
+                
+                # 기존 파일은 같은 내용의 다른 결과 폴더와 하드 링크로 공유될 수 있으므로
+                # 제자리에서 덮어쓰지 않고 새 파일로 교체 (쓰다 만 파일도 남기지 않음)
+                try:
+                    with open(temp_path, "wb") as f:
+                        f.write(data)
+                    os.replace(temp_path, dest_path)
+                except BaseException:
+                    with suppress(OSError):
+                        temp_path.unlink()
+                    raise
+            
+            converted += 1
+            
+            if metrics:
+                metrics.record(
+                    "page",
+                    pdf=pdf_path,
+                    page=page_num,
+                    bytes=len(data),
+                    render_s=round(render_s, 6),
+                    encode_s=round(encode_s, 6),
+                    encode_wait_s=round(encode_wait_s, 6),
+                    write_s=round(time.perf_counter() - write_start, 6)
+                )
+            
+            if progress_callback:
+                progress_callback(page_num)
+        
+        pages = self.iter_rendered_pages(pdf_path, first_page, last_page, settings, cancel_check)
+        render_start = time.perf_counter()
+        
+        try:
+            for page_num, page in pages:
+                # 렌더러가 다음 페이지를 내놓을 때까지 걸린 시간
+                render_s = time.perf_counter() - render_start
+                
+                if cancel_check and cancel_check():
+                    raise ConversionCancelled("변환이 취소되었습니다.")
+                
+                if isinstance(page, bytes):
+                    write_page(page_num, page, render_s)
+                else:
+                    encoding.append((page_num, self.encode_pool.submit(timed_encode_image, page, settings), render_s))
+                
+                # 인코딩이 끝난 페이지부터 저장 (대기 페이지 수를 제한하여 메모리 사용량을 묶어 둠)
+                while encoding and (encoding[0][1].done() or len(encoding) > CONFIG.ENCODE_QUEUE_SIZE):
+                    write_encoded(*encoding.popleft())
+                
+                render_start = time.perf_counter()
+            
+            while encoding:
+                write_encoded(*encoding.popleft())
+        
+        finally:
+            pages.close()
+            for _, future, _ in encoding:
+                future.cancel()
+        
+        return converted
+    
+    def iter_page_data(
+        self,
+        pdf_path: str,
+        settings: Optional[RenderSettings] = None,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        queue_size: int = CONFIG.PAGE_QUEUE_SIZE,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> Iterator[Tuple[int, bytes]]:
+        """페이지를 디스크에 쓰지 않고 (페이지 번호, 인코딩된 데이터)로 차례대로 반환
+        
+        렌더링은 백그라운드 스레드에서 진행하고 결과는 queue_size 크기의 큐에 쌓으므로
+        메모리 사용량은 문서 길이가 아니라 큐 크기로 제한됨 (소비가 늦으면 렌더링이 대기)
+        파일 객체가 필요하면 io.BytesIO(data)로 감싸서 사용
+        """
+        settings = settings or RenderSettings()
+        settings.validate()
+        if last_page is None:
+            last_page = self.get_page_count(pdf_path)
+        
+        pages: "queue.Queue[Tuple[int, Any]]" = queue.Queue(maxsize=max(1, queue_size))
+        stop = threading.Event()
+        done = object()
+        
+        def should_stop() -> bool:
+            return stop.is_set() or bool(cancel_check and cancel_check())
+        
+        def put(item: Tuple[int, Any]) -> None:
+            # 소비자가 멈추면 큐가 빌 때까지 기다리되 중단 요청은 확인
+            while True:
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    if stop.is_set():
+                        raise ConversionCancelled("변환이 취소되었습니다.")
+        
+        def produce() -> None:
+            try:
+                self.convert_page_range(
+                    pdf_path, Path(), first_page, last_page, len(str(last_page)),
+                    settings=settings, cancel_check=should_stop, page_writer=lambda page_num, data: put((page_num, data))
+                )
+            except BaseException as e:
+                with suppress(ConversionCancelled):
+                    put((0, e))
+            else:
+                with suppress(ConversionCancelled):
+                    put((0, done))
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                page_num, data = pages.get()
+                if data is done:
+                    return
+                if isinstance(data, BaseException):
+                    raise data
+                yield page_num, data
+        finally:
+            # 소비자가 중간에 멈추면 렌더링을 중단하고 남은 데이터를 버림
+            stop.set()
+            while producer.is_alive():
+                with suppress(queue.Empty):
+                    pages.get(timeout=0.1)
+    
+    @staticmethod
+    def get_multipage_path(output_folder: Path, pdf_path: str) -> Path:
+        """여러 페이지 TIFF 경로 (페이지 파일 이름은 숫자뿐이므로 겹치지 않음)"""
+        return Path(output_folder) / f"{Path(pdf_path).stem}(전체).tif"
+    
+    @staticmethod
+    def assemble_multipage_tiff(output_folder: Path, pdf_path: str, total_pages: int) -> Path:
+        """페이지별 TIFF를 순서대로 모아 여러 페이지 TIFF 하나로 저장 (한 번에 한 페이지만 메모리에 올림)"""
+        from PIL import TiffImagePlugin, Image
+        
+        output_folder = Path(output_folder)
+        digits = len(str(total_pages))
+        dest_path = PDFProcessor.get_multipage_path(output_folder, pdf_path)
+        temp_path = dest_path.with_name(dest_path.name + ".tmp")
+        
+        try:
+            with TiffImagePlugin.AppendingTiffWriter(str(temp_path), True) as writer:
+                for page_num in range(1, total_pages + 1):
+                    with Image.open(output_folder / f"{str(page_num).zfill(digits)}.tif") as image:
+                        options = {"compression": "group4"} if image.mode == "1" else {}
+                        image.save(writer, format="TIFF", **options)
+                    writer.newFrame()
+            os.replace(temp_path, dest_path)
+        except BaseException:
+            with suppress(OSError):
+                temp_path.unlink()
+            raise
+        
+        return dest_path
+    
+    def convert_to_images(
+        self,
+        pdf_path: str,
+        output_folder: Path,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        settings: Optional[RenderSettings] = None,
+        chunk_size: Optional[int] = None,
+        resume: bool = True,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> int:
+        """PDF를 JPG 이미지로 변환 (페이지 묶음마다 pdftoppm 하나를 작업 큐에서 실행)
+        
+        resume이면 변환 기록을 확인하여 이미 최신인 페이지는 건너뜀
+        압축 파일로 저장하면 결과 폴더 대신 '원본 이름.zip/.cbz'에 모든 페이지를 바로 기록
+        progress_callback은 지금까지 끝난 페이지 수(건너뛴 페이지 포함)를 받음
+        """
+        settings = settings or RenderSettings()
+        settings.validate()
+        thread_count = settings.worker_count
+        start = time.perf_counter()
+        
+        total_pages = self.get_page_count(pdf_path)
+        digits = len(str(total_pages))
+        pages = list(range(1, total_pages + 1))
+        manifest: Optional[ConversionManifest] = None
+        archive: Optional[ArchiveWriter] = None
+        
+        if settings.archive != "none":
+            # 압축 파일은 매번 새로 만들므로 변환 기록을 쓰지 않음
+            resume = False
+            archive_path = PathUtils.get_archive_path(output_folder, pdf_path, settings.archive)
+            archive = ArchiveWriter(archive_path, compress=settings.fmt == "tiff")
+        
+        def write_to_archive(page_num: int, data: bytes) -> None:
+            archive.add(f"{str(page_num).zfill(digits)}.{OUTPUT_EXTENSIONS[settings.fmt]}", data)
+        
+        page_writer: Optional[Callable[[int, bytes], None]] = write_to_archive if archive else None
+        
+        if resume:
+            manifest = ConversionManifest.load(output_folder, pdf_path, total_pages, settings.output_key())
+            pages = manifest.missing_pages(OUTPUT_EXTENSIONS[settings.fmt])
+        
+        done_count = total_pages - len(pages)
+        if progress_callback and done_count:
+            progress_callback(done_count)
+        
+        if not chunk_size:
+            # 묶음 크기를 지정하지 않으면 thread_count개로 균등 분할
+            chunk_size = -(-len(pages) // max(1, thread_count)) if pages else None
+        
+        ranges = self.group_page_ranges(pages, chunk_size)
+        callback_lock = threading.Lock()
+        
+        def chunk_callback(page_num: int) -> None:
+            nonlocal done_count
+            if manifest:
+                manifest.mark_done(page_num)
+            if progress_callback:
+                with callback_lock:
+                    done_count += 1
+                    progress_callback(done_count)
+        
+        # 먼저 끝난 작업자가 다음 묶음을 가져감
+        executor = ThreadPoolExecutor(max_workers=max(1, min(thread_count, len(ranges) or 1)))
+        completed = False
+        
+        try:
+            futures = [
+                executor.submit(
+                    self.convert_page_range, pdf_path, output_folder, first, last, digits,
+                    chunk_callback, settings, cancel_check, page_writer
+                )
+                for first, last in ranges
+            ]
+            converted = sum(future.result() for future in futures)
+            completed = True
+        finally:
+            # 오류나 취소 시 아직 시작하지 않은 묶음은 실행하지 않음
+            executor.shutdown(wait=True, cancel_futures=True)
+            if manifest:
+                manifest.save()
+            if archive:
+                if completed:
+                    archive.close()
+                else:
+                    archive.abort()
+        
+        if settings.multipage:
+            self.assemble_multipage_tiff(output_folder, pdf_path, total_pages)
+        
+        if self.metrics:
+            self.metrics.record(
+                "file", pdf=pdf_path, pages=total_pages, rendered=converted, skipped=total_pages - len(pages), imported=0,
+                seconds_s=round(time.perf_counter() - start, 6)
+            )
+        
+        return converted + (total_pages - len(pages))
+
+
+# ==================== 병렬 변환 스케줄러 ====================
+
+
+@dataclass
+class ConversionJob:
+    """파일 단위 변환 작업"""
+    index: int
+    pdf_path: str
+    output_folder: str
+    pages: int
+    pending_pages: Optional[List[int]] = None
+    imported_pages: int = 0
+
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_render_worker(progress_queue: Any, cancel_event: Any) -> None:
+    """작업자 프로세스 초기화 (진행 큐와 취소 이벤트는 프로세스 시작 시 한 번만 전달)"""
+    _worker_state["progress_queue"] = progress_queue
+    _worker_state["cancel_event"] = cancel_event
+    _worker_state["processors"] = {}
+
+
+def _run_conversion_job(
+    run_id: int,
+    poppler_path: Optional[str],
+    job: ConversionJob,
+    first_page: int,
+    last_page: int,
+    settings: RenderSettings,
+    to_archive: bool = False,
+    submitted_at: Optional[float] = None
+) -> Tuple[int, List[Tuple[int, bytes]], List[Dict[str, Any]]]:
+    """프로세스 풀 작업자: PDF 파일의 페이지 묶음 하나 변환
+    
+    to_archive이면 파일을 쓰지 않고 (페이지 번호, 데이터) 목록을 결과로 돌려주어
+    압축 파일은 스케줄러 한 곳에서만 기록하도록 함
+    submitted_at(제출 시각)을 주면 측정 이벤트를 모아 함께 돌려줌 (기록은 스케줄러에서)
+    """
+    progress_queue = _worker_state["progress_queue"]
+    cancel_event = _worker_state["cancel_event"]
+    rendered: List[Tuple[int, bytes]] = []
+    metrics = MetricsRecorder(buffer=True) if submitted_at is not None else None
+    queue_wait_s = time.time() - submitted_at if submitted_at is not None else 0.0
+    start = time.perf_counter()
+    
+    if cancel_event.is_set():
+        return 0, rendered, []
+    
+    output_folder = Path(job.output_folder)
+    if not to_archive:
+        output_folder.mkdir(parents=True, exist_ok=True)
+    
+    def page_callback(page_num: int) -> None:
+        progress_queue.put((run_id, job.index, page_num))
+    
+    # 렌더러는 작업자 프로세스마다 한 번만 만들어 재사용
+    processors = _worker_state["processors"]
+    if poppler_path not in processors:
+        processors[poppler_path] = PDFProcessor(poppler_path, engine=settings.engine)
+    processor = processors[poppler_path]
+    processor.metrics = metrics
+    
+    try:
+        converted = processor.convert_page_range(
+            job.pdf_path, output_folder, first_page, last_page, len(str(job.pages)),
+            page_callback, settings, cancel_event.is_set,
+            (lambda page_num, data: rendered.append((page_num, data))) if to_archive else None
+        )
+    finally:
+        processor.metrics = None
+    
+    if not metrics:
+        return converted, rendered, []
+    
+    metrics.record(
+        "task", pdf=job.pdf_path, first=first_page, last=last_page, pages=converted,
+        queue_wait_s=round(max(0.0, queue_wait_s), 6),
+        seconds_s=round(time.perf_counter() - start, 6)
+    )
+    return converted, rendered, metrics.drain()
+
+
+class RenderWorkerPool:
+    """변환 작업자 프로세스 풀 (여러 번의 변환에 걸쳐 재사용)
+    
+    작업자 시작 비용(Windows에서는 모듈 재로드 포함)을 파일마다가 아니라 작업자마다 한 번만 치름
+    한 번에 하나의 ConversionScheduler.run만 사용할 수 있음
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        # SimpleQueue는 put이 바로 파이프에 기록되므로 작업 결과보다 진행 메시지가 늦게 도착하지 않음
+        self.progress_queue = multiprocessing.SimpleQueue()
+        self.cancel_event = multiprocessing.Event()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._run_id = 0
+    
+    def __enter__(self) -> "RenderWorkerPool":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_render_worker,
+            initargs=(self.progress_queue, self.cancel_event)
+        )
+    
+    def resize(self, max_workers: int) -> None:
+        """작업자 수 변경 (바뀌었으면 다음 제출 때 작업자를 새로 시작)"""
+        if max(1, max_workers) != self.max_workers:
+            self.shutdown()
+            self.max_workers = max(1, max_workers)
+    
+    def begin_run(self) -> int:
+        """새 변환 시작 (이전 실행의 취소 상태 초기화), 실행 번호 반환"""
+        self.cancel_event.clear()
+        self._run_id += 1
+        return self._run_id
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """작업 제출 (작업자가 비정상 종료되어 풀이 깨졌으면 새로 만듦)"""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        
+        try:
+            return self._executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            return self._executor.submit(fn, *args)
+    
+    def cancel(self) -> None:
+        """실행 중인 작업자에게 취소 알림"""
+        self.cancel_event.set()
+    
+    def iter_progress(self, run_id: int) -> Iterator[Tuple[int, int]]:
+        """도착한 진행 메시지를 (작업 번호, 페이지 번호)로 반환 (이전 실행의 메시지는 버림)"""
+        while not self.progress_queue.empty():
+            message_run, index, page_num = self.progress_queue.get()
+            if message_run == run_id:
+                yield index, page_num
+    
+    def shutdown(self) -> None:
+        """작업자 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+class ConversionScheduler:
+    """여러 PDF를 프로세스 풀에서 동시에 변환
+    
+    압축 파일로 저장하면 작업자는 페이지 데이터를 결과로 돌려주고 이 스케줄러가 압축 파일에 기록함
+    (batch_archive를 주면 모든 PDF를 그 압축 파일 하나에 'PDF 이름/페이지' 형태로 저장)
+    """
+    
+    POLL_INTERVAL: float = 0.1
+    
+    def __init__(
+        self,
+        poppler_path: Optional[str],
+        settings: Optional[RenderSettings] = None,
+        chunk_size: Optional[int] = CONFIG.CHUNK_SIZE,
+        resume: bool = True,
+        render_cache: Optional[RenderCache] = None,
+        pool: Optional[RenderWorkerPool] = None,
+        batch_archive: Optional[Path] = None,
+        metrics: Optional[MetricsRecorder] = None
+    ):
+        self.poppler_path = poppler_path
+        self.settings = settings or RenderSettings()
+        self.pool = pool
+        self.max_workers = self.settings.worker_count
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.render_cache = render_cache
+        self.batch_archive = batch_archive
+        self.to_archive = batch_archive is not None or self.settings.archive != "none"
+        self.metrics = metrics
+        # 마지막 run의 페이지 수 (rendered/skipped/imported)
+        self.page_counts: Dict[str, int] = {kind: 0 for kind in PAGE_COUNT_KINDS}
+    
+    @staticmethod
+    def balance(jobs: List[ConversionJob]) -> List[ConversionJob]:
+        """페이지 수가 많은 파일부터 배치 (LPT 방식으로 코어별 작업량 균등화)"""
+        return sorted(jobs, key=lambda job: job.pages, reverse=True)
+    
+    def split_tasks(self, jobs: List[ConversionJob]) -> List[Tuple[ConversionJob, int, int]]:
+        """작업 묶음을 (작업, 첫 페이지, 마지막 페이지) 단위로 분할"""
+        # 큰 파일은 페이지 묶음으로 나눠 여러 작업자가 나눠 처리
+        # 전체 페이지가 적으면 묶음을 줄여 모든 작업자에게 일이 돌아가도록 함
+        def job_pages(job: ConversionJob) -> List[int]:
+            if job.pending_pages is None:
+                return list(range(1, job.pages + 1))
+            return job.pending_pages
+        
+        total_pages = sum(len(job_pages(job)) for job in jobs)
+        chunk_size = max(1, -(-total_pages // self.max_workers))
+        if self.chunk_size:
+            chunk_size = min(chunk_size, self.chunk_size)
+        if self.to_archive:
+            # 페이지 데이터가 결과로 전달되므로 묶음을 작게 하여 메모리 사용량을 제한
+            chunk_size = min(chunk_size, CONFIG.ARCHIVE_CHUNK_SIZE)
+        
+        return [
+            (job, first, last)
+            for job in self.balance(jobs)
+            for first, last in PDFProcessor.group_page_ranges(job_pages(job), chunk_size)
+        ]
+    
+    def prepare_manifest(self, job: ConversionJob) -> Optional[ConversionManifest]:
+        """변환 기록을 불러와 남은 페이지만 작업에 지정 (압축 파일은 매번 새로 만들므로 기록 없음)"""
+        if not self.resume or self.to_archive:
+            return None
+        
+        try:
+            settings = self.settings.output_key()
+            manifest = ConversionManifest.load(Path(job.output_folder), job.pdf_path, job.pages, settings)
+        except OSError:
+            # 원본을 읽을 수 없으면 기록 없이 변환하여 실제 오류를 보고
+            return None
+        
+        extension = OUTPUT_EXTENSIONS[self.settings.fmt]
+        job.pending_pages = manifest.missing_pages(extension)
+        
+        if self.render_cache:
+            # 같은 내용을 이전에 변환한 폴더가 있으면 렌더링 대신 결과를 가져옴
+            key = manifest.content_key()
+            for folder in self.render_cache.lookup(key):
+                if not job.pending_pages:
+                    break
+                previous = ConversionManifest.read(folder)
+                if previous:
+                    imported = set(manifest.import_pages(previous, job.pending_pages, extension))
+                    job.pending_pages = [p for p in job.pending_pages if p not in imported]
+                    job.imported_pages += len(imported)
+            self.render_cache.register(key, Path(job.output_folder))
+        
+        return manifest
+    
+    def run(
+        self,
+        jobs: Iterable[ConversionJob],
+        page_callback: Optional[Callable[[ConversionJob, int], None]] = None,
+        file_callback: Optional[Callable[[ConversionJob, int, Optional[BaseException]], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """작업 실행 (취소 없이 끝나면 True)
+        
+        jobs가 제너레이터이면 페이지 수 확인이 끝난 파일부터 바로 변환을 시작함
+        설정이 잘못되었으면 작업을 시작하기 전에 ValueError 발생
+        """
+        self.settings.validate()
+        if self.batch_archive is not None and self.settings.multipage:
+            raise ValueError("여러 페이지 TIFF와 압축 파일 저장은 함께 쓸 수 없습니다.")
+        
+        job_queue: "queue.Queue[Tuple[ConversionJob, Optional[ConversionManifest]]]" = queue.Queue()
+        feeder_done = threading.Event()
+        stop_feeding = threading.Event()
+        feeder_errors: List[BaseException] = []
+        
+        def feed() -> None:
+            try:
+                for job in jobs:
+                    if stop_feeding.is_set():
+                        break
+                    job_queue.put((job, self.prepare_manifest(job)))
+            except BaseException as e:
+                feeder_errors.append(e)
+            finally:
+                feeder_done.set()
+        
+        threading.Thread(target=feed, daemon=True).start()
+        
+        by_index: Dict[int, ConversionJob] = {}
+        manifests: Dict[int, ConversionManifest] = {}
+        remaining: Dict[int, int] = {}
+        converted: Dict[int, int] = {}
+        # 완료 페이지 중 이번에 렌더링/건너뜀/가져온 페이지 수 (초당 페이지 수는 렌더링한 페이지만)
+        page_counts: Dict[int, Dict[str, int]] = {}
+        errors: Dict[int, BaseException] = {}
+        finished: set = set()
+        started: Dict[int, float] = {}
+        run_start = time.perf_counter()
+        # 같은 내용(원본 해시 + 설정)의 파일은 먼저 들어온 작업만 렌더링하고 나머지는 결과를 가져옴
+        leaders: Dict[str, int] = {}
+        followers: Dict[int, List[ConversionJob]] = {}
+        extension = OUTPUT_EXTENSIONS[self.settings.fmt]
+        
+        archives: Dict[int, ArchiveWriter] = {}
+        archive_names: Dict[int, str] = {}
+        batch_writer: Optional[ArchiveWriter] = None
+        if self.batch_archive is not None:
+            batch_writer = ArchiveWriter(self.batch_archive, compress=self.settings.fmt == "tiff")
+        
+        def take_new_jobs() -> List[ConversionJob]:
+            new_jobs: List[ConversionJob] = []
+            while not job_queue.empty():
+                job, manifest = job_queue.get()
+                if manifest:
+                    manifests[job.index] = manifest
+                if batch_writer:
+                    # 압축 파일 안의 폴더 이름 (이름이 같은 PDF는 번호를 붙여 구분)
+                    name = Path(job.pdf_path).stem
+                    if name in archive_names.values():
+                        name = f"{name}_{job.index + 1}"
+                    archive_names[job.index] = name
+                    job.output_folder = str(self.batch_archive)
+                elif self.to_archive:
+                    job.output_folder = str(
+                        PathUtils.get_archive_path(Path(job.output_folder), job.pdf_path, self.settings.archive)
+                    )
+                new_jobs.append(job)
+            return new_jobs
+        
+        def write_archive(job: ConversionJob, rendered: List[Tuple[int, bytes]]) -> None:
+            if batch_writer:
+                writer, prefix = batch_writer, f"{archive_names[job.index]}/"
+            else:
+                if job.index not in archives:
+                    archives[job.index] = ArchiveWriter(Path(job.output_folder), compress=self.settings.fmt == "tiff")
+                writer, prefix = archives[job.index], ""
+            
+            for page_num, data in rendered:
+                writer.add(f"{prefix}{str(page_num).zfill(len(str(job.pages)))}.{extension}", data)
+        
+        def drain() -> None:
+            for index, page_num in pool.iter_progress(run_id):
+                if index in manifests:
+                    manifests[index].mark_done(page_num)
+                if page_callback:
+                    page_callback(by_index[index], 1)
+        
+        def import_from(leader: ConversionJob, job: ConversionJob) -> None:
+            imported = set(manifests[job.index].import_pages(manifests[leader.index], job.pending_pages, extension))
+            if imported:
+                job.pending_pages = [p for p in job.pending_pages if p not in imported]
+                converted[job.index] += len(imported)
+                page_counts[job.index]["imported"] += len(imported)
+                if page_callback:
+                    page_callback(job, len(imported))
+        
+        def complete_file(job: ConversionJob) -> None:
+            finished.add(job.index)
+            if job.index in manifests:
+                manifests[job.index].save()
+            
+            if batch_writer and job.index in errors:
+                # 일부만 변환된 PDF의 페이지는 일괄 압축 파일에 남기지 않음
+                batch_writer.discard(f"{archive_names[job.index]}/")
+            
+            writer = archives.pop(job.index, None)
+            if writer:
+                try:
+                    if job.index in errors:
+                        writer.abort()
+                    else:
+                        writer.close()
+                except Exception as e:
+                    errors[job.index] = e
+            
+            if self.settings.multipage and job.index not in errors:
+                try:
+                    PDFProcessor.assemble_multipage_tiff(Path(job.output_folder), job.pdf_path, job.pages)
+                except Exception as e:
+                    errors[job.index] = e
+            
+            if self.metrics:
+                self.metrics.record(
+                    "file", pdf=job.pdf_path, pages=converted[job.index], **page_counts[job.index],
+                    error=str(errors[job.index]) if job.index in errors else None,
+                    seconds_s=round(time.perf_counter() - started[job.index], 6)
+                )
+            
+            if file_callback:
+                file_callback(job, converted[job.index], errors.get(job.index))
+            
+            for follower in followers.pop(job.index, []):
+                import_from(job, follower)
+                submit_jobs([follower])
+        
+        def submit_jobs(new_jobs: List[ConversionJob]) -> None:
+            for job, first, last in self.split_tasks(new_jobs):
+                remaining[job.index] += 1
+                future = pool.submit(
+                    _run_conversion_job, run_id, self.poppler_path, job, first, last, self.settings, self.to_archive,
+                    time.time() if self.metrics else None
+                )
+                futures[future] = job
+                pending.add(future)
+            
+            # 남은 페이지가 없는 파일은 바로 완료 처리
+            for job in new_jobs:
+                if remaining[job.index] == 0:
+                    complete_file(job)
+        
+        def start_jobs(new_jobs: List[ConversionJob]) -> None:
+            ready: List[ConversionJob] = []
+            
+            for job in new_jobs:
+                by_index[job.index] = job
+                started[job.index] = time.perf_counter()
+                remaining[job.index] = 0
+                # 기록상 이미 최신이거나 이전 결과에서 가져온 페이지는 완료된 것으로 처리
+                done = job.pages - len(job.pending_pages) if job.pending_pages is not None else 0
+                converted[job.index] = done
+                page_counts[job.index] = {"rendered": 0, "skipped": done - job.imported_pages, "imported": job.imported_pages}
+                if done and page_callback:
+                    page_callback(job, done)
+                
+                key = manifests[job.index].content_key() if job.index in manifests else None
+                if key is None:
+                    ready.append(job)
+                    continue
+                
+                leader_index = leaders.setdefault(key, job.index)
+                if leader_index != job.index and job.pending_pages:
+                    if leader_index not in finished:
+                        followers.setdefault(leader_index, []).append(job)
+                        continue
+                    import_from(by_index[leader_index], job)
+                
+                ready.append(job)
+            
+            submit_jobs(ready)
+        
+        def finish_task(
+            job: ConversionJob,
+            pages: int,
+            rendered: List[Tuple[int, bytes]],
+            error: Optional[BaseException]
+        ) -> None:
+            if rendered and job.index not in errors:
+                try:
+                    write_archive(job, rendered)
+                except Exception as e:
+                    error = error or e
+            
+            converted[job.index] += pages
+            page_counts[job.index]["rendered"] += pages
+            if error and job.index not in errors:
+                errors[job.index] = error
+            remaining[job.index] -= 1
+            
+            if job.index in manifests:
+                manifests[job.index].save()
+            
+            if remaining[job.index] == 0:
+                complete_file(job)
+        
+        # 풀을 받지 않았으면 이번 실행에서만 쓰고 종료
+        pool = self.pool or RenderWorkerPool(self.max_workers)
+        pool.resize(self.max_workers)
+        run_id = pool.begin_run()
+        cancelled = False
+        futures: Dict[Any, ConversionJob] = {}
+        pending: set = set()
+        
+        try:
+            while pending or not feeder_done.is_set() or not job_queue.empty():
+                if not cancelled and cancel_check and cancel_check():
+                    cancelled = True
+                    pool.cancel()
+                    stop_feeding.set()
+                    for future in pending:
+                        future.cancel()
+                
+                # 그동안 도착한 파일을 한 묶음으로 모아 균등 배분 후 제출
+                if not cancelled:
+                    start_jobs(take_new_jobs())
+                
+                if cancelled and not pending:
+                    break
+                
+                if not pending:
+                    feeder_done.wait(self.POLL_INTERVAL)
+                    continue
+                
+                done, pending = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                drain()
+                
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    
+                    error = future.exception()
+                    if isinstance(error, ConversionCancelled):
+                        continue
+                    pages, rendered, events = (0, [], []) if error else future.result()
+                    if self.metrics:
+                        self.metrics.extend(events)
+                    finish_task(futures[future], pages, rendered, error)
+            
+            drain()
+        
+        finally:
+            if self.pool is None:
+                pool.shutdown()
+            
+            # 취소 등으로 끝나지 않은 압축 파일은 지움
+            for writer in archives.values():
+                writer.abort()
+            if batch_writer:
+                if cancelled:
+                    batch_writer.abort()
+                else:
+                    batch_writer.close()
+        
+        for manifest in manifests.values():
+            manifest.save()
+        if self.render_cache:
+            self.render_cache.save()
+        
+        self.page_counts = {kind: sum(counts[kind] for counts in page_counts.values()) for kind in PAGE_COUNT_KINDS}
+        if self.metrics:
+            elapsed = time.perf_counter() - run_start
+            rendered_pages = self.page_counts["rendered"]
+            self.metrics.record(
+                "run", files=len(finished), pages=sum(converted.values()), **self.page_counts, errors=len(errors),
+                cancelled=cancelled, engine=self.settings.engine, fmt=self.settings.fmt, workers=self.max_workers,
+                pages_per_sec=round(rendered_pages / elapsed, 3) if elapsed > 0 else 0.0, seconds_s=round(elapsed, 6)
+            )
+            self.metrics.flush()
+        
+        if feeder_errors:
+            raise feeder_errors[0]
+        
+        return not cancelled
+
+
+# ==================== 라이브러리 API ====================
+
+
+@dataclass(frozen=True)
+class PageResult:
+    """변환된 페이지 한 장"""
+    page: int
+    data: bytes
+    fmt: str
+    
+    @property
+    def extension(self) -> str:
+        """파일 확장자"""
+        return OUTPUT_EXTENSIONS[self.fmt]
+    
+    def filename(self, digits: int = 0) -> str:
+        """결과 폴더와 같은 규칙의 파일 이름 (digits: 페이지 번호 자릿수)"""
+        return f"{str(self.page).zfill(digits)}.{self.extension}"
+    
+    def as_file(self) -> io.BytesIO:
+        """파일 객체로 반환"""
+        return io.BytesIO(self.data)
+
+
+def convert(
+    pdf_path: str,
+    settings: Optional[RenderSettings] = None,
+    poppler_path: Optional[str] = None,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    cancel_check: Optional[Callable[[], bool]] = None
+) -> Iterator[PageResult]:
+    """PDF 페이지를 차례대로 변환하여 반환 (파일을 쓰지 않고 GUI/네트워크 모듈도 불러오지 않음)
+    
+    poppler_path를 주지 않으면 PathUtils.get_poppler_path()로 탐색 (환경 변수 → PATH → 프로그램 폴더)
+    설정이나 페이지 범위(1 ≤ first_page ≤ last_page ≤ 전체 페이지 수)가 잘못되었으면 바로 ValueError 발생
+    """
+    settings = settings or RenderSettings()
+    settings.validate()
+    if settings.multipage or settings.archive != "none":
+        raise ValueError("convert()는 페이지 데이터만 반환하므로 여러 페이지 TIFF/압축 파일 설정을 쓸 수 없습니다.")
+    
+    processor = PDFProcessor(poppler_path or PathUtils.get_poppler_path(), engine=settings.engine)
+    
+    try:
+        total_pages = processor.get_page_count(pdf_path)
+        if last_page is None:
+            last_page = total_pages
+        if not 1 <= first_page <= last_page <= total_pages:
+            raise ValueError(f"페이지 범위가 잘못되었습니다: {first_page}~{last_page} (전체 {total_pages}페이지)")
+    except BaseException:
+        processor.close()
+        raise
+    
+    def iter_results() -> Iterator[PageResult]:
+        try:
+            pages = processor.iter_page_data(pdf_path, settings, first_page, last_page, cancel_check=cancel_check)
+            for page_num, data in pages:
+                yield PageResult(page_num, data, settings.fmt)
+        finally:
+            processor.close()
+    
+    return iter_results()
+
+
+# ==================== 벤치마크 ====================
+
+
+# 합성 PDF 종류 (many-pages는 --pages의 10배, huge-page는 2000pt 크기 페이지 하나)
+BENCH_KINDS: Tuple[str, ...] = ("text", "image", "vector", "many-pages", "huge-page")
+
+
+def _synthetic_page(kind: str, rng: random.Random, width: int, height: int) -> bytes:
+    """합성 페이지 하나의 내용 스트림"""
+    ops: List[str] = []
+    
+    if kind in ("text", "many-pages", "huge-page"):
+        lines = 8 if kind == "many-pages" else (height - 80) // 11
+        ops.append(f"BT /F1 9 Tf 11 TL 40 {height - 40} Td")
+        for _ in range(lines):
+            words = ("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9))) for _ in range(14))
+            ops.append(f"({' '.join(words)}) '")
+        ops.append("ET")
+    
+    if kind in ("vector", "huge-page"):
+        for _ in range(2000 if kind == "vector" else 6000):
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+            points = " ".join(f"{x + rng.uniform(-60, 60):.1f} {y + rng.uniform(-60, 60):.1f}" for _ in range(3))
+            ops.append(f"{rng.random():.2f} {rng.random():.2f} {rng.random():.2f} rg {x:.1f} {y:.1f} m {points} c h f")
+            ops.append(f"{rng.uniform(0.2, 2):.1f} w {x:.1f} {y:.1f} m {rng.uniform(0, width):.1f} {rng.uniform(0, height):.1f} l S")
+    
+    if kind == "image":
+        ops.append(f"q {width - 80} 0 0 {(height - 80) // 2} 40 40 cm /Im1 Do Q")
+        ops.append(f"q {width - 80} 0 0 {(height - 80) // 2} 40 {height // 2} cm /Im1 Do Q")
+    
+    return "\n".join(ops).encode("latin-1")
+
+
+def write_synthetic_pdf(path: Path, kind: str, pages: int) -> int:
+    """벤치마크용 PDF 생성 (외부 라이브러리 없이 직접 작성), 만든 페이지 수 반환"""
+    rng = random.Random(kind)
+    objects: List[bytes] = []
+    
+    def add(data: bytes) -> int:
+        objects.append(data)
+        return len(objects)
+    
+    def add_stream(header: str, data: bytes) -> int:
+        return add(f"<< {header} /Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream")
+    
+    width, height = (2000, 2000) if kind == "huge-page" else (595, 842)
+    count = {"many-pages": pages * 10, "huge-page": 1}.get(kind, pages)
+    
+    pages_id = add(b"")
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    resources = f"<< /Font << /F1 {font_id} 0 R >>"
+    if kind == "image":
+        # 사진처럼 압축이 잘 되지 않는 이미지 (페이지마다 같은 이미지를 두 번 배치)
+        image_id = add_stream(
+            "/Type /XObject /Subtype /Image /Width 800 /Height 600 /ColorSpace /DeviceRGB /BitsPerComponent 8 "
+            "/Filter /FlateDecode",
+            zlib.compress(rng.randbytes(800 * 600 * 3), 1)
+        )
+        resources += f" /XObject << /Im1 {image_id} 0 R >>"
+    resources += " >>"
+    
+    page_ids: List[int] = []
+    for _ in range(count):
+        content_id = add_stream("/Filter /FlateDecode", zlib.compress(_synthetic_page(kind, rng, width, height)))
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {width} {height}] "
+            f"/Resources {resources} /Contents {content_id} 0 R >>".encode()
+        ))
+    
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {count} >>".encode()
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+    
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets: List[int] = []
+        for number, data in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(f"{number} 0 obj\n".encode() + data + b"\nendobj\n")
+        
+        xref_offset = f.tell()
+        f.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+        f.writelines(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+        f.write(f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+    
+    return count
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """백분위수 (최근접 순위 방식)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """이 프로세스와 종료된 자식 프로세스(pdftoppm)의 최대 메모리 사용량 (MB, 측정 불가면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    
+    # Linux는 KB, macOS는 바이트 단위
+    unit = 1 if sys.platform == "darwin" else 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return round(peak * unit / (1024 * 1024), 1)
+
+
+def _run_bench_case(poppler_path: Optional[str], pdf_path: str, settings: RenderSettings) -> Dict[str, Any]:
+    """벤치마크 한 건 실행 (최대 메모리를 따로 재도록 새 프로세스에서 실행)"""
+    processor = PDFProcessor(poppler_path, engine=settings.engine)
+    processor.metrics = MetricsRecorder(buffer=True)
+    
+    with tempfile.TemporaryDirectory(prefix="p2j-bench-") as output_folder:
+        start = time.perf_counter()
+        pages = processor.convert_to_images(pdf_path, Path(output_folder), settings=settings, resume=False)
+        elapsed = time.perf_counter() - start
+        output_bytes = sum(entry.stat().st_size for entry in Path(output_folder).iterdir())
+    
+    processor.close()
+    latencies = [
+        (event["render_s"] + event["encode_s"] + event["write_s"]) * 1000
+        for event in processor.metrics.drain() if event["event"] == "page"
+    ]
+    
+    return {
+        "pages": pages,
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 1),
+        "p95_ms": round(_percentile(latencies, 95), 1),
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": output_bytes,
+        # 실제로 동시에 렌더링한 스레드 수 (pdfium은 프로세스 안에서 한 번에 하나만 렌더링)
+        "render_threads": settings.worker_count if processor.renderer.parallel_in_process else 1,
+    }
+
+
+def run_benchmark(
+    poppler_path: Optional[str],
+    kinds: List[str],
+    dpis: List[int],
+    workers: List[int],
+    engines: List[str],
+    formats: List[str],
+    pages: int = 10,
+    log_callback: Optional[Callable[[str, bool], None]] = None
+) -> Dict[str, Any]:
+    """합성 PDF로 설정 조합마다 convert_to_images를 측정하여 결과 반환"""
+    results: List[Dict[str, Any]] = []
+    
+    with tempfile.TemporaryDirectory(prefix="p2j-bench-pdf-") as work_dir:
+        documents: List[Tuple[str, Path, int]] = []
+        for kind in kinds:
+            pdf_path = Path(work_dir) / f"{kind}.pdf"
+            count = write_synthetic_pdf(pdf_path, kind, pages)
+            LogCallback.log(log_callback, f"• {kind}.pdf: {count}페이지, {pdf_path.stat().st_size / 1024:.0f}KB")
+            documents.append((kind, pdf_path, count))
+        
+        for kind, pdf_path, count in documents:
+            for engine in engines:
+                for fmt in formats:
+                    for dpi in dpis:
+                        for worker_count in workers:
+                            settings = RenderSettings(dpi=dpi, fmt=fmt, workers=worker_count, engine=engine)
+                            case = {"kind": kind, "engine": engine, "format": fmt, "dpi": dpi, "workers": worker_count}
+                            
+                            # 케이스마다 새 프로세스를 띄워 최대 메모리가 이전 케이스와 섞이지 않게 함
+                            # (fork는 부모의 메모리를 물려받으므로 spawn 사용, 메인 모듈은 p2j_core만 불러옴)
+                            try:
+                                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                                    case.update(executor.submit(_run_bench_case, poppler_path, str(pdf_path), settings).result())
+                                if case["pages"] != count:
+                                    raise RuntimeError(f"{count}페이지 중 {case['pages']}페이지만 변환되었습니다.")
+                            except Exception as e:
+                                case["error"] = str(e)
+                            
+                            results.append(case)
+                            if "error" in case:
+                                LogCallback.log(log_callback, f"✗ {kind} {engine} {fmt} {dpi}DPI x{worker_count}: {case['error']}")
+                            else:
+                                serial = " (렌더링은 한 번에 하나씩)" if case["render_threads"] < settings.worker_count else ""
+                                LogCallback.log(
+                                    log_callback,
+                                    f"✓ {kind} {engine} {fmt} {dpi}DPI x{worker_count}{serial}: {case['pages_per_sec']}페이지/초, "
+                                    f"p50 {case['p50_ms']}ms, p95 {case['p95_ms']}ms, 최대 메모리 {case['peak_rss_mb']}MB"
+                                )
+    
+    return {
+        "version": CONFIG.CURRENT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "cases": results,
+    }
+
+
+def bench_main(args: argparse.Namespace) -> int:
+    """bench 하위 명령 실행"""
+    if any(dpi < 1 or dpi > CONFIG.MAX_DPI for dpi in args.dpi) or any(count < 0 for count in args.jobs) or args.pages < 1:
+        print(f"✗ DPI는 1~{CONFIG.MAX_DPI}, --jobs는 0 이상, --pages는 1 이상이어야 합니다.", file=sys.stderr)
+        return 2
+    
+    if "pdfium" in args.engine and not PdfiumRenderer.is_available():
+        print("✗ pdfium 엔진을 사용하려면 pypdfium2를 설치하세요.", file=sys.stderr)
+        return 2
+    
+    for fmt in args.fmt:
+        if fmt not in STREAM_FORMATS and not check_encoder(fmt):
+            print(f"✗ {fmt} 형식으로 저장할 수 없습니다. (Pillow 또는 pillow-avif-plugin 필요)", file=sys.stderr)
+            return 2
+    
+    log_cb = lambda msg, is_progress=False: print(msg, flush=True)
+    report = run_benchmark(
+        args.poppler or PathUtils.get_poppler_path(),
+        args.kinds, args.dpi, args.jobs, args.engine, args.fmt, args.pages, log_cb
+    )
+    
+    temp_path = args.out.with_name(args.out.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, args.out)
+    print(f"결과 저장: {args.out}")
+    
+    return 1 if any("error" in case for case in report["cases"]) else 0
+
+
+# ==================== CLI ====================
+
+
+CLI_COMMANDS = ("convert", "bench")
+
+
+class BatchConverter:
+    """명령줄 일괄 변환 (GUI 모듈 없이 동작)"""
+    
+    def __init__(
+        self,
+        processor: PDFProcessor,
+        settings: Optional[RenderSettings] = None,
+        output_root: Optional[Path] = None,
+        chunk_size: Optional[int] = CONFIG.CHUNK_SIZE,
+        resume: bool = True,
+        render_cache: Optional[RenderCache] = None,
+        batch_archive: Optional[Path] = None,
+        metrics: Optional[MetricsRecorder] = None
+    ):
+        self.processor = processor
+        self.settings = settings or RenderSettings()
+        self.output_root = output_root
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.render_cache = render_cache
+        self.batch_archive = batch_archive
+        self.metrics = metrics
+    
+    @staticmethod
+    def collect_inputs(inputs: List[str]) -> List[Tuple[Path, Path]]:
+        """입력 경로에서 (PDF 파일, 입력 폴더 기준 하위 폴더) 목록 수집 (폴더는 하위까지 검색)"""
+        pdf_files: List[Tuple[Path, Path]] = []
+        seen = set()
+        
+        for entry in inputs:
+            path = Path(entry)
+            
+            if path.is_dir():
+                candidates = sorted(p for p in path.rglob("*") if p.suffix.lower() == ".pdf" and p.is_file())
+                subdirs = [candidate.parent.relative_to(path) for candidate in candidates]
+            else:
+                candidates = [path]
+                subdirs = [Path()]
+            
+            for candidate, subdir in zip(candidates, subdirs):
+                key = str(candidate.resolve())
+                if key not in seen:
+                    seen.add(key)
+                    pdf_files.append((candidate, subdir))
+        
+        return pdf_files
+    
+    def get_output_folders(self, pdf_files: List[Tuple[Path, Path]]) -> List[Path]:
+        """파일마다 결과 폴더 경로 (--out을 주면 입력 폴더의 하위 폴더 구조를 그대로 만듦)"""
+        return [PathUtils.get_output_folder(pdf, self.output_root, subdir) for pdf, subdir in pdf_files]
+    
+    @staticmethod
+    def find_conflicts(output_folders: List[Path]) -> List[Tuple[int, int]]:
+        """결과 폴더가 겹치는 파일 번호 쌍 (먼저 나온 파일, 겹치는 파일) 목록
+        
+        겹치면 나중 파일이 앞 파일의 페이지와 변환 기록을 덮어쓰므로 변환 전에 확인함
+        """
+        first_seen: Dict[str, int] = {}
+        conflicts: List[Tuple[int, int]] = []
+        
+        for index, folder in enumerate(output_folders):
+            key = os.path.normcase(str(folder.resolve()))
+            if key in first_seen:
+                conflicts.append((first_seen[key], index))
+            else:
+                first_seen[key] = index
+        
+        return conflicts
+    
+    def run(
+        self,
+        pdf_files: List[Tuple[Path, Path]],
+        log_callback: Optional[Callable[[str, bool], None]] = None
+    ) -> int:
+        """일괄 변환 실행, 실패한 파일 수 반환 (pdf_files는 collect_inputs 결과)"""
+        output_folders = self.get_output_folders(pdf_files)
+        pdf_files = [pdf for pdf, _ in pdf_files]
+        failed = 0
+        done = 0
+        total_pages = 0
+        start = time.perf_counter()
+        
+        def iter_jobs() -> Iterator[ConversionJob]:
+            nonlocal failed
+            page_counts = self.processor.iter_page_counts([str(pdf) for pdf in pdf_files])
+            
+            for index, pages, error in page_counts:
+                if error:
+                    failed += 1
+                    LogCallback.log(log_callback, f"✗ {pdf_files[index]}: {error}")
+                    continue
+                yield ConversionJob(index, str(pdf_files[index]), str(output_folders[index]), pages)
+        
+        def file_callback(job: ConversionJob, pages: int, error: Optional[BaseException]) -> None:
+            nonlocal failed, done, total_pages
+            done += 1
+            if error:
+                failed += 1
+                LogCallback.log(log_callback, f"[{done}/{len(pdf_files)}] ✗ {job.pdf_path}: {error}")
+            else:
+                total_pages += pages
+                LogCallback.log(log_callback, f"[{done}/{len(pdf_files)}] ✓ {job.pdf_path} → {job.output_folder} ({pages}페이지)")
+        
+        scheduler = ConversionScheduler(
+            self.processor.poppler_path, self.settings, self.chunk_size, self.resume, self.render_cache,
+            batch_archive=self.batch_archive, metrics=self.metrics
+        )
+        scheduler.run(iter_jobs(), file_callback=file_callback)
+        
+        elapsed = time.perf_counter() - start
+        counts = scheduler.page_counts
+        # 건너뛰거나 가져온 페이지는 속도 계산에서 제외
+        pages_per_sec = counts["rendered"] / elapsed if elapsed > 0 else 0.0
+        LogCallback.log(
+            log_callback,
+            f"완료: 파일 {len(pdf_files) - failed}/{len(pdf_files)}개, {total_pages}페이지 "
+            f"(렌더링 {counts['rendered']}, 건너뜀 {counts['skipped']}, 가져옴 {counts['imported']}), {elapsed:.1f}초 "
+            f"({self.settings.engine}, {pages_per_sec:.1f}페이지/초)"
+        )
+        return failed
+
+
+def build_cli_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서 생성"""
+    parser = argparse.ArgumentParser(prog="P2J", description=CONFIG.APP_TITLE)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    convert_parser = subparsers.add_parser("convert", help="PDF 파일을 이미지로 변환")
+    convert_parser.add_argument("inputs", nargs="+", help="PDF 파일 또는 PDF가 들어 있는 폴더")
+    convert_parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help=f"설정 파일 (JSON 또는 TOML, 기본값: 프로그램 폴더의 {CONFIG.SETTINGS_FILENAME})"
+    )
+    convert_parser.add_argument("--dpi", type=int, default=None, help=f"변환 해상도 (기본값: {CONFIG.CONVERSION_DPI})")
+    convert_parser.add_argument(
+        "--format",
+        dest="fmt",
+        choices=sorted(OUTPUT_EXTENSIONS),
+        default=None,
+        help=f"출력 형식 (기본값: {CONFIG.OUTPUT_FORMAT})"
+    )
+    convert_parser.add_argument(
+        "--quality", type=int, default=None, help=f"JPEG/WebP/AVIF 품질 1~100 (기본값: {CONFIG.IMAGE_QUALITY})"
+    )
+    convert_parser.add_argument(
+        "--optimize", action=argparse.BooleanOptionalAction, default=None, help="PNG/JPEG 최적 압축 (느리지만 파일이 작아짐)"
+    )
+    convert_parser.add_argument(
+        "--multipage", action=argparse.BooleanOptionalAction, default=None, help="TIFF 페이지를 여러 페이지 파일 하나로도 저장"
+    )
+    convert_parser.add_argument(
+        "--archive",
+        choices=ARCHIVE_FORMATS,
+        default=None,
+        help="페이지 파일 대신 PDF마다 압축 파일(zip/cbz) 하나로 저장 (기본값: none)"
+    )
+    convert_parser.add_argument(
+        "--archive-batch",
+        type=Path,
+        default=None,
+        help="모든 PDF를 압축 파일 하나에 저장 (PDF마다 폴더로 구분)"
+    )
+    convert_parser.add_argument(
+        "--color",
+        dest="color_mode",
+        choices=COLOR_MODES,
+        default=None,
+        help="색상 모드: 회색조(gray), 1비트 흑백(mono), 페이지마다 자동 판단(auto) (기본값: color)"
+    )
+    convert_parser.add_argument("--max-width", type=int, default=None, help="최대 가로 픽셀, 0이면 제한 없음")
+    convert_parser.add_argument("--max-height", type=int, default=None, help="최대 세로 픽셀, 0이면 제한 없음")
+    convert_parser.add_argument("--scale-to", type=int, default=None, help="긴 변을 이 픽셀 수에 맞춰 렌더링 (DPI 대신 사용)")
+    convert_parser.add_argument("--max-pixels", type=int, default=None, help="페이지당 최대 픽셀 수, 0이면 제한 없음")
+    convert_parser.add_argument("--out", type=Path, default=None, help="결과 폴더 위치 (기본값: PDF와 같은 폴더)")
+    convert_parser.add_argument("--jobs", type=int, default=None, help="동시에 실행할 작업자 수, 0이면 CPU 코어 수 (기본값: 0)")
+    convert_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CONFIG.CHUNK_SIZE,
+        help="큰 PDF를 나눠 처리할 페이지 묶음 크기, 0이면 나누지 않음 (기본값: %(default)s)"
+    )
+    convert_parser.add_argument(
+        "--engine",
+        choices=RENDER_ENGINES,
+        default=None,
+        help=f"렌더링 엔진, pdfium은 pypdfium2 필요 (기본값: {CONFIG.RENDER_ENGINE})"
+    )
+    convert_parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        help=f"단계별 시간/바이트를 JSON Lines로 추가 기록할 파일 (환경 변수 {CONFIG.METRICS_ENV})"
+    )
+    convert_parser.add_argument(
+        "--metrics-prom",
+        type=Path,
+        default=None,
+        help=f"누적 측정값을 Prometheus 텍스트 형식으로 저장할 파일 (환경 변수 {CONFIG.METRICS_PROM_ENV})"
+    )
+    convert_parser.add_argument("--force", action="store_true", help="변환 기록을 무시하고 모든 페이지를 다시 변환")
+    convert_parser.add_argument(
+        "--poppler",
+        default=None,
+        help=f"Poppler bin 디렉토리 (기본값: {CONFIG.POPPLER_PATH_ENV} 환경 변수 → PATH → 프로그램 폴더 순서로 탐색)"
+    )
+    
+    bench_parser = subparsers.add_parser("bench", help="합성 PDF로 변환 속도 측정")
+    bench_parser.add_argument(
+        "--kinds", nargs="+", choices=BENCH_KINDS, default=list(BENCH_KINDS), help="측정할 합성 PDF 종류 (기본값: 전부)"
+    )
+    bench_parser.add_argument("--dpi", nargs="+", type=int, default=[CONFIG.CONVERSION_DPI], help="해상도 목록")
+    bench_parser.add_argument("--jobs", nargs="+", type=int, default=[1], help="작업자 수 목록, 0이면 CPU 코어 수")
+    bench_parser.add_argument("--engine", nargs="+", choices=RENDER_ENGINES, default=[CONFIG.RENDER_ENGINE], help="렌더링 엔진 목록")
+    bench_parser.add_argument(
+        "--format", dest="fmt", nargs="+", choices=sorted(OUTPUT_EXTENSIONS), default=[CONFIG.OUTPUT_FORMAT], help="출력 형식 목록"
+    )
+    bench_parser.add_argument("--pages", type=int, default=10, help="합성 PDF 페이지 수 (many-pages는 10배, 기본값: %(default)s)")
+    bench_parser.add_argument("--out", type=Path, default=Path("p2j_bench.json"), help="결과 JSON 파일 (기본값: %(default)s)")
+    bench_parser.add_argument("--poppler", default=None, help="Poppler bin 디렉토리 (기본값: 자동 탐색)")
+    
+    return parser
+
+
+def cli_main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점"""
+    args = build_cli_parser().parse_args(argv)
+    
+    if args.command == "bench":
+        return bench_main(args)
+    
+    config_path = args.config or PathUtils.get_app_directory() / CONFIG.SETTINGS_FILENAME
+    
+    try:
+        settings = RenderSettings.load(config_path) if args.config or config_path.exists() else RenderSettings()
+        settings = settings.override(
+            dpi=args.dpi,
+            fmt=args.fmt,
+            quality=args.quality,
+            optimize=args.optimize,
+            multipage=args.multipage,
+            archive=args.archive,
+            color_mode=args.color_mode,
+            max_width=args.max_width,
+            max_height=args.max_height,
+            scale_to=args.scale_to,
+            max_pixels=args.max_pixels,
+            workers=args.jobs,
+            engine=args.engine
+        )
+        settings.validate()
+    except (OSError, ValueError) as e:
+        print(f"✗ 설정 오류: {e}", file=sys.stderr)
+        return 2
+    
+    if args.archive_batch and settings.multipage:
+        print("✗ --archive-batch는 --multipage와 함께 쓸 수 없습니다.", file=sys.stderr)
+        return 2
+    
+    if args.chunk_size < 0:
+        print("✗ --chunk-size는 0 이상이어야 합니다.", file=sys.stderr)
+        return 2
+    
+    if settings.fmt not in STREAM_FORMATS and not check_encoder(settings.fmt):
+        print(f"✗ {settings.fmt} 형식으로 저장할 수 없습니다. (Pillow 또는 pillow-avif-plugin 필요)", file=sys.stderr)
+        return 2
+    
+    if settings.engine == "pdfium" and not PdfiumRenderer.is_available():
+        print("✗ pdfium 엔진을 사용하려면 pypdfium2를 설치하세요.", file=sys.stderr)
+        return 2
+    
+    pdf_files = BatchConverter.collect_inputs(args.inputs)
+    if not pdf_files:
+        print("✗ 변환할 PDF 파일이 없습니다.", file=sys.stderr)
+        return 2
+    
+    info_cache = PDFInfoCache(store_path=PathUtils.get_app_directory() / CONFIG.PDFINFO_CACHE_FILENAME)
+    processor = PDFProcessor(args.poppler or PathUtils.get_poppler_path(), info_cache, settings.engine)
+    if args.metrics or args.metrics_prom:
+        processor.metrics = MetricsRecorder(args.metrics, args.metrics_prom)
+    else:
+        processor.metrics = MetricsRecorder.from_env()
+    converter = BatchConverter(
+        processor,
+        settings,
+        output_root=args.out,
+        chunk_size=args.chunk_size or None,
+        resume=not args.force,
+        render_cache=RenderCache(PathUtils.get_app_directory() / CONFIG.RENDER_CACHE_FILENAME),
+        batch_archive=args.archive_batch,
+        metrics=processor.metrics
+    )
+    
+    if not args.archive_batch:
+        output_folders = converter.get_output_folders(pdf_files)
+        conflicts = BatchConverter.find_conflicts(output_folders)
+        for first, second in conflicts:
+            print(
+                f"✗ 결과 위치가 겹칩니다: {pdf_files[first][0]}, {pdf_files[second][0]} → {output_folders[second]}",
+                file=sys.stderr
+            )
+        if conflicts:
+            return 2
+    
+    log_cb = lambda msg, is_progress=False: print(msg, flush=True)
+    failed = converter.run(pdf_files, log_cb)
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli_main())
@@ -0,0 +1,1367 @@
+import os
+import sys
+import shutil
+import threading
+import subprocess
+import re
+import json
+import time
+import tempfile
+import zipfile
+import tkinter as tk
+from pathlib import Path
+from typing import List, Optional, Callable, Tuple, Dict, Iterator
+from dataclasses import dataclass, asdict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+
+from p2j_core import (
+    CONFIG, OUTPUT_EXTENSIONS, STREAM_FORMATS, RENDER_ENGINES, COLOR_MODES, ARCHIVE_FORMATS,
+    PathUtils, LogCallback, RenderSettings, check_encoder, PDFProcessor, PdfiumRenderer, PDFInfoCache, RenderCache,
+    ConversionJob, ConversionScheduler, RenderWorkerPool, MetricsRecorder
+)
+from p2j_net import GitHubAPIClient
+
+
+# ==================== 플랫폼 초기화 ====================
+
+
+class WindowsConsoleManager:
+    """Windows 콘솔 창 관리"""
+    
+    SW_HIDE = 0
+    CREATE_NO_WINDOW = 0x08000000
+    
+    @staticmethod
+    def hide_console() -> bool:
+        """콘솔 창을 숨기고 subprocess에 플래그 설정"""
+        if sys.platform != 'win32':
+            return False
+        
+        try:
+            import ctypes
+            
+            kernel32 = ctypes.WinDLL('kernel32')
+            user32 = ctypes.WinDLL('user32')
+            hwnd = kernel32.GetConsoleWindow()
+            
+            if hwnd:
+                user32.ShowWindow(hwnd, WindowsConsoleManager.SW_HIDE)
+            
+            _original_popen = subprocess.Popen
+            
+            def _popen_no_console(*args, **kwargs):
+                if 'creationflags' not in kwargs:
+                    kwargs['creationflags'] = 0
+                kwargs['creationflags'] |= WindowsConsoleManager.CREATE_NO_WINDOW
+                return _original_popen(*args, **kwargs)
+            
+            subprocess.Popen = _popen_no_console
+            return True
+        
+        except Exception:
+            return False
+
+
+# ==================== Import ====================
+
+
+import customtkinter as ctk
+from tkinterdnd2 import TkinterDnD, DND_FILES
+from tkinter import messagebox, filedialog
+
+
+# ==================== SSL 초기화 ====================
+
+
+class SSLManager:
+    """SSL 인증서 관리"""
+    
+    @staticmethod
+    def initialize() -> bool:
+        """SSL 인증서 경로 설정"""
+        try:
+            import certifi
+            cert_path = certifi.where()
+            os.environ['REQUESTS_CA_BUNDLE'] = cert_path
+            os.environ['SSL_CERT_FILE'] = cert_path
+            return True
+        
+        except (ImportError, AttributeError):
+            with suppress(ImportError):
+                import urllib3
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return False
+
+
+# initialize_app()에서 인증서 설정 결과로 갱신 (requests는 네트워크를 처음 쓸 때 불러옴)
+VERIFY_SSL = True
+
+
+def initialize_theme() -> None:
+    """CustomTkinter 테마 및 외관 초기화"""
+    ctk.set_default_color_theme("blue")
+    ctk.set_appearance_mode("system")
+
+
+def initialize_app() -> None:
+    """GUI 실행 전 프로세스 전역 설정 (불러오기만 할 때는 적용하지 않음)"""
+    global VERIFY_SSL
+    WindowsConsoleManager.hide_console()
+    VERIFY_SSL = SSLManager.initialize()
+    initialize_theme()
+
+
+# ==================== 유틸리티 ====================
+
+
+class IconManager:
+    """Windows 아이콘 관리"""
+    
+    class IconSize(IntEnum):
+        SMALL = 16
+        LARGE = 32
+    
+    WM_SETICON = 0x80
+    ICON_SMALL = 0
+    ICON_BIG = 1
+    LR_LOADFROMFILE = 0x00000010
+    
+    @staticmethod
+    def set_window_icon(window, icon_path: str) -> bool:
+        """Windows API를 사용하여 창 아이콘 설정"""
+        if not icon_path or not os.path.exists(icon_path):
+            return False
+        
+        if sys.platform != 'win32':
+            return False
+        
+        try:
+            import ctypes
+            
+            window.update_idletasks()
+            hwnd = window.winfo_id()
+            
+            if not hwnd:
+                return False
+            
+            load_image = ctypes.windll.user32.LoadImageW
+            hicon_small = load_image(
+                0, icon_path, 1,
+                IconManager.IconSize.SMALL, IconManager.IconSize.SMALL,
+                IconManager.LR_LOADFROMFILE
+            )
+            hicon_large = load_image(
+                0, icon_path, 1,
+                IconManager.IconSize.LARGE, IconManager.IconSize.LARGE,
+                IconManager.LR_LOADFROMFILE
+            )
+            
+            if not (hicon_small or hicon_large):
+                return False
+            
+            send_message = ctypes.windll.user32.SendMessageW
+            if hicon_small:
+                send_message(hwnd, IconManager.WM_SETICON, IconManager.ICON_SMALL, hicon_small)
+            if hicon_large:
+                send_message(hwnd, IconManager.WM_SETICON, IconManager.ICON_BIG, hicon_large)
+            
+            return True
+        
+        except Exception:
+            return False
+
+
+class VersionManager:
+    """버전 비교 유틸리티"""
+    
+    @staticmethod
+    def parse_version(version_str: str) -> Tuple[int, int, int]:
+        """버전 문자열을 튜플로 파싱"""
+        try:
+            clean_ver = version_str.lstrip('v')
+            parts = clean_ver.split('.')
+            major = int(parts[0]) if len(parts) > 0 else 0
+            minor = int(parts[1]) if len(parts) > 1 else 0
+            patch = int(parts[2]) if len(parts) > 2 else 0
+            return (major, minor, patch)
+        except (ValueError, AttributeError, IndexError):
+            return (0, 0, 0)
+    
+    @staticmethod
+    def is_newer(current: str, latest: str) -> bool:
+        """최신 버전이 현재 버전보다 새로운지 확인"""
+        return VersionManager.parse_version(latest) > VersionManager.parse_version(current)
+
+
+# ==================== GitHub API ====================
+
+
+@dataclass
+class ReleaseInfo:
+    """Release 정보 데이터 클래스"""
+    version: str
+    name: str
+    html_url: str
+
+
+class ReleaseManager:
+    """GitHub Release 관리"""
+    
+    def __init__(self, api_client: GitHubAPIClient):
+        self.api_client = api_client
+    
+    def get_latest_release_info(
+        self,
+        log_callback: Optional[Callable[[str, bool], None]] = None
+    ) -> Optional[ReleaseInfo]:
+        """최신 Release 정보 가져오기"""
+        LogCallback.log(log_callback, "  → GitHub Release 확인 중...")
+        
+        data = self.api_client.get_latest_release(CONFIG.APP_REPO_OWNER, CONFIG.APP_REPO_NAME)
+        
+        if not data:
+            LogCallback.log(log_callback, "  ! Release 확인 실패")
+            return None
+        
+        tag_name = data.get('tag_name', '')
+        LogCallback.log(log_callback, f"  ✓ 최신 Release 버전: {tag_name}")
+        
+        return ReleaseInfo(
+            version=tag_name,
+            name=data.get('name', ''),
+            html_url=data.get('html_url', '')
+        )
+    
+    @staticmethod
+    def open_release_page(
+        release_url: str,
+        log_callback: Optional[Callable[[str, bool], None]] = None
+    ) -> bool:
+        """브라우저로 Release 페이지 열기"""
+        try:
+            import webbrowser
+            LogCallback.log(log_callback, "→ 브라우저로 Release 페이지를 엽니다...")
+            LogCallback.log(log_callback, f"  • URL: {release_url}")
+            webbrowser.open(release_url)
+            LogCallback.log(log_callback, "  ✓ 브라우저 열기 완료")
+            return True
+        except Exception as e:
+            LogCallback.log(log_callback, f"  ✗ 브라우저 열기 실패: {e}")
+            return False
+
+
+class PopplerManager:
+    """Poppler 다운로드 및 설치 관리"""
+    
+    VERSION_PATTERN = re.compile(r'(\d+\.\d+\.\d+)')
+    # 압축 파일에서 실제로 쓰는 부분 (실행 파일/DLL과 CJK 문자 인코딩 데이터)
+    RUNTIME_PREFIXES = ("Library/bin/", "Library/share/poppler/")
+    
+    def __init__(self, api_client: GitHubAPIClient):
+        self.api_client = api_client
+        self._install_completed = False
+    
+    def get_installed_version(self, poppler_dir: Path) -> Optional[str]:
+        """설치된 Poppler 버전 확인"""
+        if not poppler_dir.exists():
+            return None
+        
+        for item in poppler_dir.iterdir():
+            if item.is_dir() and "poppler" in item.name.lower():
+                match = self.VERSION_PATTERN.search(item.name)
+                if match:
+                    return match.group(1)
+        
+        return None
+    
+    def get_latest_version_info(self) -> Optional[Tuple[str, str, str, Optional[str]]]:
+        """최신 Poppler 버전 정보 가져오기 (다운로드 URL, 파일 이름, 버전, SHA-256)"""
+        data = self.api_client.get_latest_release(CONFIG.POPPLER_REPO_OWNER, CONFIG.POPPLER_REPO_NAME)
+        
+        if not data:
+            return None
+        
+        zip_asset = next((a for a in data.get("assets", []) if a["name"].lower().endswith(".zip")), None)
+        
+        if not zip_asset:
+            return None
+        
+        filename = zip_asset["name"]
+        match = self.VERSION_PATTERN.search(filename)
+        version = match.group(1) if match else "unknown"
+        # Release API가 제공하는 자산 해시 ("sha256:..."), 없으면 크기만 확인
+        digest = zip_asset.get("digest") or ""
+        sha256 = digest.split(":", 1)[1] if digest.startswith("sha256:") else None
+        
+        return (zip_asset["browser_download_url"], filename, version, sha256)
+    
+    @classmethod
+    def is_runtime_member(cls, name: str) -> bool:
+        """'poppler-x.y.z/Library/bin/...'처럼 실행에 필요한 항목인지 확인"""
+        parts = name.split("/")
+        return len(parts) > 2 and "/".join(parts[1:]).startswith(cls.RUNTIME_PREFIXES)
+    
+    def extract_runtime(
+        self,
+        zip_path: Path,
+        dest_folder: Path,
+        log_callback: Optional[Callable[[str, bool], None]] = None
+    ) -> List[Path]:
+        """실행에 필요한 파일만 임시 폴더에 병렬로 풀고 완성된 폴더를 한 번에 제자리로 이동
+        
+        중간에 실패하면 임시 폴더만 지우므로 설치가 반쯤 된 폴더는 남지 않음
+        """
+        # 이전 실행이 비정상 종료되어 남은 임시 폴더 정리
+        for leftover in dest_folder.glob(".extract-*"):
+            shutil.rmtree(leftover, ignore_errors=True)
+        
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = [info for info in zip_ref.infolist() if not info.is_dir() and self.is_runtime_member(info.filename)]
+        
+        if not members:
+            raise RuntimeError("압축 파일에 Poppler 실행 파일이 없습니다.")
+        
+        staging = Path(tempfile.mkdtemp(prefix=".extract-", dir=dest_folder))
+        staging_root = staging.resolve()
+        total_bytes = sum(info.file_size for info in members) or 1
+        extracted_bytes = 0
+        last_log = 0.0
+        progress_lock = threading.Lock()
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+        
+        def extract(info: zipfile.ZipInfo) -> None:
+            nonlocal extracted_bytes, last_log
+            target = (staging / info.filename).resolve()
+            if staging_root not in target.parents:
+                raise RuntimeError(f"잘못된 압축 파일 경로입니다: {info.filename}")
+            
+            # 스레드마다 압축 파일을 따로 열어 읽기가 서로 막히지 않게 함
+            if not hasattr(local, "zip_ref"):
+                local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                with progress_lock:
+                    handles.append(local.zip_ref)
+            
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with local.zip_ref.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, CONFIG.DOWNLOAD_CHUNK_SIZE)
+            
+            with progress_lock:
+                extracted_bytes += info.file_size
+                now = time.monotonic()
+                if now - last_log >= CONFIG.PROGRESS_LOG_INTERVAL:
+                    last_log = now
+                    percent = int(extracted_bytes / total_bytes * 100)
+                    LogCallback.log(log_callback, f"  → 압축 해제 진행: {percent}%", True)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=CONFIG.EXTRACT_THREADS) as executor:
+                for _ in executor.map(extract, members):
+                    pass
+            
+            installed: List[Path] = []
+            for name in sorted({info.filename.split("/")[0] for info in members}):
+                target = dest_folder / name
+                if target.exists():
+                    # 같은 버전을 다시 설치하면 기존 폴더를 임시 폴더로 옮긴 뒤 교체
+                    os.replace(target, staging / f".old-{name}")
+                os.replace(staging / name, target)
+                installed.append(target)
+            
+            LogCallback.log(log_callback, f"  ✓ 압축 해제 완료: {len(members)}개 파일", True)
+            return installed
+        
+        finally:
+            for handle in handles:
+                handle.close()
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def download_and_extract(
+        self,
+        dest_folder: Path,
+        log_callback: Optional[Callable[[str, bool], None]] = None,
+        version_info: Optional[Tuple[str, str, str, Optional[str]]] = None
+    ) -> Path:
+        """Poppler 다운로드 및 압축 해제 (version_info를 주면 Release API를 다시 호출하지 않음)"""
+        version_info = version_info or self.get_latest_version_info()
+        if not version_info:
+            raise RuntimeError("Poppler 최신 버전을 찾을 수 없습니다.")
+        
+        download_url, filename, version, sha256 = version_info
+        zip_path = dest_folder / filename
+        
+        LogCallback.log(log_callback, f"→ 다운로드 파일: {filename}")
+        LogCallback.log(log_callback, "→ 다운로드 시작...")
+        
+        def progress_callback(percent: int) -> None:
+            if percent >= 100:
+                LogCallback.log(log_callback, "  ✓ 다운로드 완료", True)
+            else:
+                LogCallback.log(log_callback, f"  → 다운로드 진행: {percent}%", True)
+        
+        if not self.api_client.download_file(download_url, zip_path, progress_callback, sha256):
+            raise RuntimeError("Poppler 다운로드 실패")
+        
+        LogCallback.log(log_callback, "→ 압축 해제 시작 (실행 파일만)")
+        
+        try:
+            installed = self.extract_runtime(zip_path, dest_folder, log_callback)
+        finally:
+            zip_path.unlink(missing_ok=True)
+            LogCallback.log(log_callback, "  ✓ 임시 파일 삭제 완료")
+        
+        LogCallback.log(log_callback, "→ Poppler 폴더 확인 중...")
+        
+        for item in installed:
+            if "poppler" in item.name.lower():
+                bin_path = item / "Library" / "bin"
+                if (bin_path / "pdftoppm.exe").exists():
+                    if not self._install_completed:
+                        LogCallback.log(log_callback, f"  ✓ Poppler 설치 완료 (v{version})")
+                        self._install_completed = True
+                    return bin_path
+        
+        raise RuntimeError("Poppler 폴더를 찾을 수 없습니다.")
+    
+    def check_and_update(
+        self,
+        app_dir: Path,
+        log_callback: Optional[Callable[[str, bool], None]] = None
+    ) -> None:
+        """Poppler 설치 확인 및 업데이트"""
+        LogCallback.log(log_callback, "")
+        LogCallback.log(log_callback, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        LogCallback.log(log_callback, "[ Poppler 확인 ]")
+        LogCallback.log(log_callback, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        
+        poppler_dir = app_dir / CONFIG.POPPLER_FOLDER_NAME
+        poppler_dir.mkdir(parents=True, exist_ok=True)
+        
+        installed_version = self.get_installed_version(poppler_dir)
+        version_info = self.get_latest_version_info()
+        
+        if not version_info:
+            LogCallback.log(log_callback, "  ✗ 최신 버전 확인 실패")
+            
+            if installed_version:
+                LogCallback.log(log_callback, "")
+                LogCallback.log(log_callback, f"✓ 기존 Poppler 사용 (v{installed_version})")
+            else:
+                LogCallback.log(log_callback, "")
+                LogCallback.log(log_callback, "✗ Poppler 설치 불가")
+                raise RuntimeError("Poppler 최신 버전 확인 실패")
+            return
+        
+        latest_version = version_info[2]
+        
+        if installed_version:
+            LogCallback.log(log_callback, f"  • 현재 버전: v{installed_version}")
+            LogCallback.log(log_callback, f"  • 최신 버전: v{latest_version}")
+            
+            if installed_version == latest_version:
+                if not self._install_completed:
+                    LogCallback.log(log_callback, "")
+                    LogCallback.log(log_callback, "✓ Poppler가 최신 버전입니다")
+                self._install_completed = True
+                return
+            
+            LogCallback.log(log_callback, "")
+            LogCallback.log(log_callback, "! 새 버전 발견 - Poppler 업데이트 시작")
+            LogCallback.log(log_callback, "")
+            self._install_completed = False
+        else:
+            LogCallback.log(log_callback, "")
+            LogCallback.log(log_callback, "! Poppler가 설치되지 않았습니다")
+            LogCallback.log(log_callback, "")
+            self._install_completed = False
+        
+        try:
+            bin_path = self.download_and_extract(poppler_dir, log_callback, version_info)
+        except Exception as e:
+            LogCallback.log(log_callback, f"✗ Poppler 설치 실패: {e}")
+            if not installed_version:
+                raise
+            # 새 버전을 설치하지 못해도 기존 설치는 그대로 사용
+            LogCallback.log(log_callback, f"✓ 기존 Poppler 사용 (v{installed_version})")
+            return
+        
+        if installed_version:
+            # 새 버전이 완전히 설치된 뒤에 기존 버전 삭제
+            LogCallback.log(log_callback, "→ 기존 Poppler 삭제 중...")
+            self._remove_old_poppler(poppler_dir, log_callback, keep=bin_path.parent.parent)
+    
+    def _remove_old_poppler(
+        self,
+        poppler_dir: Path,
+        log_callback: Optional[Callable[[str, bool], None]],
+        keep: Optional[Path] = None
+    ) -> None:
+        """기존 Poppler 폴더 삭제 (keep은 남김)"""
+        for item in poppler_dir.iterdir():
+            if item.is_dir() and "poppler" in item.name.lower() and item != keep:
+                try:
+                    shutil.rmtree(item)
+                    LogCallback.log(log_callback, f"  ✓ 삭제 완료: {item.name}")
+                except Exception as e:
+                    LogCallback.log(log_callback, f"  ✗ 삭제 실패: {e}")
+
+
+@dataclass
+class UpdateStatus:
+    """업데이트 확인 결과"""
+    release: Optional[ReleaseInfo] = None
+    poppler_version: Optional[str] = None
+    checked_at: float = 0.0
+
+
+class UpdateChecker:
+    """업데이트 확인 결과를 파일에 캐시 (유효 시간 안에는 네트워크를 사용하지 않음)"""
+    
+    def __init__(
+        self,
+        cache_path: Path,
+        api_client: Optional[GitHubAPIClient] = None,
+        ttl: int = CONFIG.UPDATE_CHECK_TTL
+    ):
+        self.cache_path = cache_path
+        self.api_client = api_client or GitHubAPIClient(verify_ssl=VERIFY_SSL)
+        self.ttl = ttl
+    
+    def load(self) -> Optional[UpdateStatus]:
+        """캐시된 결과 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            release = ReleaseInfo(**data["release"]) if data.get("release") else None
+            return UpdateStatus(release, data.get("poppler_version"), float(data["checked_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save(self, status: UpdateStatus) -> None:
+        """결과 저장"""
+        data = {
+            "checked_at": status.checked_at,
+            "release": asdict(status.release) if status.release else None,
+            "poppler_version": status.poppler_version,
+        }
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with suppress(OSError):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+    
+    def is_fresh(self, status: Optional[UpdateStatus]) -> bool:
+        """캐시가 유효 시간 안인지 확인"""
+        return status is not None and 0 <= time.time() - status.checked_at < self.ttl
+    
+    def refresh(self) -> UpdateStatus:
+        """GitHub에서 다시 확인하여 저장 (확인에 실패한 항목은 이전 결과 유지)"""
+        previous = self.load() or UpdateStatus()
+        release = ReleaseManager(self.api_client).get_latest_release_info()
+        poppler_info = PopplerManager(self.api_client).get_latest_version_info()
+        
+        if not release and not poppler_info:
+            return previous
+        
+        status = UpdateStatus(
+            release or previous.release,
+            poppler_info[2] if poppler_info else previous.poppler_version,
+            time.time()
+        )
+        self.save(status)
+        return status
+    
+    def get(self) -> UpdateStatus:
+        """유효한 캐시가 있으면 그대로, 없으면 다시 확인"""
+        status = self.load()
+        return status if self.is_fresh(status) else self.refresh()
+    
+    def can_fast_start(self, app_dir: Path) -> bool:
+        """Poppler가 설치되어 있고 알려진 Poppler 업데이트가 없으면 초기화 창 없이 시작 가능"""
+        if not PathUtils.get_poppler_path():
+            return False
+        
+        installed = PopplerManager(self.api_client).get_installed_version(app_dir / CONFIG.POPPLER_FOLDER_NAME)
+        status = self.load()
+        return not (status and status.poppler_version and installed and status.poppler_version != installed)
+
+
+@dataclass
+class InitializationResult:
+    """초기화 창 실행 결과"""
+    should_close: bool = False
+    launch_main: bool = True
+    update_started: bool = False
+
+
+class InitializationWindow(tk.Tk):
+    """초기화 창 - 순수 Tkinter"""
+    
+    def __init__(self, update_checker: UpdateChecker):
+        super().__init__()
+        self.title("파일 무결성 검사 중...")
+        self.geometry(CONFIG.INIT_WINDOW_SIZE)
+        self.resizable(False, False)
+        
+        self.app_dir = PathUtils.get_app_directory()
+        self.update_checker = update_checker
+        self.result = InitializationResult()
+        
+        self.logs: List[str] = []
+        self._closing = False
+        
+        self._setup_icon()
+        self._center_window()
+        self._setup_ui()
+        self._start_initialization()
+    
+    def _setup_icon(self) -> None:
+        """아이콘 설정"""
+        icon_path = PathUtils.get_icon_path()
+        if icon_path:
+            with suppress(Exception):
+                self.iconbitmap(icon_path)
+    
+    def _center_window(self) -> None:
+        """창을 화면 중앙에 배치"""
+        self.update_idletasks()
+        width = self.winfo_width()
+        height = self.winfo_height()
+        x = (self.winfo_screenwidth() - width) // 2
+        y = (self.winfo_screenheight() - height) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
+    
+    def _setup_ui(self) -> None:
+        """UI 구성"""
+        self.log_box = tk.Text(
+            self,
+            height=22,
+            width=85,
+            font=("Consolas", 8),
+            bg="#ffffff",
+            fg="#000000",
+            state="disabled"
+        )
+        self.log_box.pack(pady=10, padx=25, fill="both", expand=True)
+    
+    def _start_initialization(self) -> None:
+        """초기화 스레드 시작"""
+        threading.Thread(target=self._init_thread, daemon=True).start()
+        self.after(500, self._check_close)
+    
+    def _init_thread(self) -> None:
+        """초기화 작업 실행"""
+        try:
+            log_cb = lambda msg, is_progress: self._add_log(msg, is_progress)
+            
+            api_client = self.update_checker.api_client
+            
+            self._check_update(api_client, log_cb)
+            if self.result.update_started:
+                return
+            
+            poppler_manager = PopplerManager(api_client)
+            poppler_manager.check_and_update(self.app_dir, log_cb)
+            
+            self._countdown()
+            self.result.should_close = True
+        
+        except Exception as e:
+            self._add_log(f"✗ 초기화 오류: {e}", False)
+            self.result.should_close = True
+            self.result.launch_main = False
+    
+    def _check_update(
+        self,
+        api_client: GitHubAPIClient,
+        log_cb: Callable[[str, bool], None]
+    ) -> None:
+        """업데이트 확인 및 Release 페이지 열기"""
+        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+        self._add_log("[ 업데이트 확인 ]", False)
+        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+        self._add_log(f"  • 현재 버전: v{CONFIG.CURRENT_VERSION}", False)
+        
+        release_manager = ReleaseManager(api_client)
+        release_info = self.update_checker.get().release
+        
+        if not release_info:
+            self._add_log("  ✗ 최신 버전 확인 실패", False)
+            self._add_log("", False)
+            self._add_log("✓ 업데이트 확인 완료", False)
+            return
+        
+        self._add_log(f"  • 최신 버전: {release_info.version}", False)
+        
+        if not VersionManager.is_newer(CONFIG.CURRENT_VERSION, release_info.version):
+            self._add_log("", False)
+            self._add_log("✓ 이미 최신 버전입니다", False)
+            return
+        
+        # 새 버전 발견 - Release 페이지 열기
+        self._add_log("", False)
+        self._add_log("! 새 버전 발견!", False)
+        self._add_log("", False)
+        
+        if release_manager.open_release_page(release_info.html_url, log_cb):
+            self._add_log("", False)
+            self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+            self._add_log("✓ 브라우저에서 최신 버전을 다운로드하세요", False)
+            self._add_log("프로그램을 종료합니다.", False)
+            self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+            time.sleep(2)
+            
+            # 앱 종료 플래그 설정
+            self.result.update_started = True
+            self.result.should_close = True
+            self.result.launch_main = False
+
+    def _countdown(self) -> None:
+        """프로그램 시작 카운트다운"""
+        self._add_log("", False)
+        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+        
+        for i in range(CONFIG.AUTO_CLOSE_COUNTDOWN_SECONDS, 0, -1):
+            if self._closing:
+                break
+            self._add_log(f"✓ {i}초 후 프로그램이 시작됩니다...", False)
+            time.sleep(1.0)
+        
+        self._add_log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", False)
+    
+    def _add_log(self, message: str, is_progress: bool = False) -> None:
+        """로그 추가"""
+        if self._closing:
+            return
+        
+        try:
+            self.log_box.config(state="normal")
+            
+            if is_progress and self.logs:
+                self.log_box.delete(f"{len(self.logs)}.0", f"{len(self.logs) + 1}.0")
+                self.logs.pop()
+            
+            self.logs.append(message)
+            self.log_box.insert("end", message + "\n")
+            self.log_box.see("end")
+            self.log_box.config(state="disabled")
+            self.update_idletasks()
+        
+        except Exception:
+            pass
+    
+    def _check_close(self) -> None:
+        """종료 여부 확인"""
+        if self._closing:
+            return
+        
+        if self.result.should_close:
+            self._closing = True
+            self.quit()
+        else:
+            self.after(100, self._check_close)
+
+
+class ProgressPopup(ctk.CTkToplevel):
+    """진행률 표시 팝업"""
+    
+    def __init__(self, parent, total_files: int, total_pages: int):
+        super().__init__(parent)
+        self.total_files = total_files
+        self.total_pages = total_pages
+        self.completed_pages = 0
+        self.counting_pages = True
+        self.cancelled = False
+        self.cancel_callback: Optional[Callable[[], None]] = None
+        self._auto_close_id: Optional[str] = None
+        
+        self._setup_window(parent)
+        self._setup_icon()
+        self._create_widgets()
+    
+    def _setup_window(self, parent) -> None:
+        """창 설정"""
+        self.title("진행 중")
+        self.geometry("450x170")
+        self.resizable(False, False)
+        self.grab_set()
+        
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - 450) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - 170) // 2
+        self.geometry(f"450x170+{x}+{y}")
+    
+    def _setup_icon(self) -> None:
+        """아이콘 설정"""
+        icon_path = PathUtils.get_icon_path()
+        if icon_path:
+            with suppress(Exception):
+                self.iconbitmap(icon_path)
+    
+    def _create_widgets(self) -> None:
+        """UI 요소 생성"""
+        self.file_label = ctk.CTkLabel(self, text=f"파일: 0 / {self.total_files} (0%)")
+        self.file_label.pack(pady=(10, 5))
+        
+        self.file_progress = ctk.CTkProgressBar(self, width=400)
+        self.file_progress.pack(pady=5)
+        self.file_progress.set(0)
+        
+        self.page_label = ctk.CTkLabel(self, text="페이지: 0 / 계산 중...")
+        self.page_label.pack(pady=(10, 5))
+        
+        self.page_progress = ctk.CTkProgressBar(self, width=400)
+        self.page_progress.pack(pady=5)
+        self.page_progress.set(0)
+        
+        self.cancel_button = ctk.CTkButton(self, text="취소", command=self._on_cancel)
+        self.cancel_button.pack(pady=10)
+    
+    def _on_cancel(self) -> None:
+        """취소 버튼 클릭"""
+        if messagebox.askyesno("작업 취소", "변환 작업을 정말 취소하시겠습니까?"):
+            self.cancelled = True
+            if self.cancel_callback:
+                self.cancel_callback()
+            self.cancel_button.configure(state="disabled")
+    
+    def update_file_progress(self, completed: int) -> None:
+        """파일 진행률 업데이트"""
+        percent = int((completed / self.total_files) * 100) if self.total_files else 0
+        self.file_label.configure(text=f"파일: {completed} / {self.total_files} ({percent}%)")
+        self.file_progress.set(completed / self.total_files if self.total_files else 0)
+        self.update_idletasks()
+    
+    def update_page_progress(self, completed: int) -> None:
+        """페이지 진행률 업데이트"""
+        self.completed_pages = completed
+        percent = int((completed / self.total_pages) * 100) if self.total_pages else 0
+        total_text = f"{self.total_pages}+" if self.counting_pages else f"{self.total_pages}"
+        self.page_label.configure(text=f"페이지: {completed} / {total_text} ({percent}%)")
+        self.page_progress.set(completed / self.total_pages if self.total_pages else 0)
+        self.update_idletasks()
+    
+    def update_total_pages(self, total_pages: int, counting: bool) -> None:
+        """전체 페이지 수 갱신 (counting이면 아직 확인 중인 파일이 있음)"""
+        self.total_pages = total_pages
+        self.counting_pages = counting
+        self.update_page_progress(self.completed_pages)
+    
+    def show_completion(self) -> None:
+        """완료 상태 표시 및 자동 종료"""
+        self.cancel_button.configure(
+            text=f"확인 ({CONFIG.COMPLETION_COUNTDOWN_SECONDS}초)",
+            state="normal",
+            command=self._close
+        )
+        self._auto_close_id = self.after(1000, lambda: self._countdown(CONFIG.COMPLETION_COUNTDOWN_SECONDS - 1))
+    
+    def _countdown(self, seconds: int) -> None:
+        """자동 종료 카운트다운"""
+        if seconds > 0:
+            self.cancel_button.configure(text=f"확인 ({seconds}초)")
+            self._auto_close_id = self.after(1000, lambda: self._countdown(seconds - 1))
+        else:
+            self._close()
+    
+    def _close(self) -> None:
+        """팝업 닫기"""
+        if self._auto_close_id:
+            self.after_cancel(self._auto_close_id)
+        self.destroy()
+
+
+class SettingsPopup(ctk.CTkToplevel):
+    """변환 설정 팝업"""
+    
+    NUMBER_FIELDS: Tuple[Tuple[str, str], ...] = (
+        ("dpi", "해상도 (DPI)"),
+        ("quality", "JPEG/WebP/AVIF 품질 (1~100)"),
+        ("max_width", "최대 가로 픽셀 (0: 제한 없음)"),
+        ("max_height", "최대 세로 픽셀 (0: 제한 없음)"),
+        ("scale_to", "긴 변 목표 픽셀 (0: DPI 사용)"),
+        ("max_pixels", "최대 픽셀 수 (0: 제한 없음)"),
+        ("workers", "작업자 수 (0: 자동)"),
+    )
+    
+    def __init__(self, parent, settings: RenderSettings):
+        super().__init__(parent)
+        self.settings = settings
+        self.save_callback: Optional[Callable[[RenderSettings], None]] = None
+        
+        self._setup_window(parent)
+        self._setup_icon()
+        self._create_widgets()
+    
+    def _setup_window(self, parent) -> None:
+        """창 설정"""
+        self.title("변환 설정")
+        self.geometry("380x580")
+        self.resizable(False, False)
+        self.grab_set()
+        
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - 380) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - 580) // 2
+        self.geometry(f"380x580+{x}+{y}")
+    
+    def _setup_icon(self) -> None:
+        """아이콘 설정"""
+        icon_path = PathUtils.get_icon_path()
+        if icon_path:
+            with suppress(Exception):
+                self.iconbitmap(icon_path)
+    
+    def _create_widgets(self) -> None:
+        """UI 요소 생성"""
+        form = ctk.CTkFrame(self, fg_color="transparent")
+        form.pack(padx=20, pady=(15, 5), fill="x")
+        form.grid_columnconfigure(0, weight=1)
+        
+        self.entries: Dict[str, ctk.CTkEntry] = {}
+        for row, (name, label) in enumerate(self.NUMBER_FIELDS):
+            ctk.CTkLabel(form, text=label).grid(row=row, column=0, sticky="w", pady=4)
+            entry = ctk.CTkEntry(form, width=120)
+            entry.insert(0, str(getattr(self.settings, name)))
+            entry.grid(row=row, column=1, sticky="e", pady=4)
+            self.entries[name] = entry
+        
+        row = len(self.NUMBER_FIELDS)
+        self.format_var = ctk.StringVar(value=self.settings.fmt)
+        ctk.CTkLabel(form, text="출력 형식").grid(row=row, column=0, sticky="w", pady=4)
+        ctk.CTkOptionMenu(form, values=sorted(OUTPUT_EXTENSIONS), variable=self.format_var, width=120).grid(
+            row=row, column=1, sticky="e", pady=4
+        )
+        
+        self.engine_var = ctk.StringVar(value=self.settings.engine)
+        ctk.CTkLabel(form, text="렌더링 엔진").grid(row=row + 1, column=0, sticky="w", pady=4)
+        ctk.CTkOptionMenu(form, values=list(RENDER_ENGINES), variable=self.engine_var, width=120).grid(
+            row=row + 1, column=1, sticky="e", pady=4
+        )
+        
+        self.color_mode_var = ctk.StringVar(value=self.settings.color_mode)
+        ctk.CTkLabel(form, text="색상 (auto: 흑백 스캔 자동 판단)").grid(row=row + 2, column=0, sticky="w", pady=4)
+        ctk.CTkOptionMenu(form, values=list(COLOR_MODES), variable=self.color_mode_var, width=120).grid(
+            row=row + 2, column=1, sticky="e", pady=4
+        )
+        
+        self.archive_var = ctk.StringVar(value=self.settings.archive)
+        ctk.CTkLabel(form, text="압축 파일로 저장 (zip/cbz)").grid(row=row + 3, column=0, sticky="w", pady=4)
+        ctk.CTkOptionMenu(form, values=list(ARCHIVE_FORMATS), variable=self.archive_var, width=120).grid(
+            row=row + 3, column=1, sticky="e", pady=4
+        )
+        
+        self.optimize_var = ctk.BooleanVar(value=self.settings.optimize)
+        ctk.CTkCheckBox(form, text="PNG/JPEG 최적 압축 (느림)", variable=self.optimize_var).grid(
+            row=row + 4, column=0, columnspan=2, sticky="w", pady=(8, 4)
+        )
+        
+        self.multipage_var = ctk.BooleanVar(value=self.settings.multipage)
+        ctk.CTkCheckBox(form, text="TIFF 여러 페이지 파일도 저장", variable=self.multipage_var).grid(
+            row=row + 5, column=0, columnspan=2, sticky="w", pady=4
+        )
+        
+        button_container = ctk.CTkFrame(self, fg_color="transparent")
+        button_container.pack(pady=10)
+        
+        ctk.CTkButton(button_container, text="저장", command=self._on_save, width=100).pack(side="left", padx=5)
+        ctk.CTkButton(button_container, text="취소", command=self.destroy, width=100).pack(side="left", padx=5)
+    
+    def _on_save(self) -> None:
+        """입력 값을 확인하여 저장"""
+        try:
+            values = {name: int(entry.get().strip()) for name, entry in self.entries.items()}
+        except ValueError:
+            messagebox.showerror("오류", "숫자 항목에는 정수를 입력해주세요.")
+            return
+        
+        settings = RenderSettings(
+            fmt=self.format_var.get(),
+            color_mode=self.color_mode_var.get(),
+            optimize=self.optimize_var.get(),
+            multipage=self.multipage_var.get(),
+            archive=self.archive_var.get(),
+            engine=self.engine_var.get(),
+            **values
+        )
+        
+        try:
+            settings.validate()
+        except ValueError as e:
+            messagebox.showerror("오류", str(e))
+            return
+        
+        if settings.engine == "pdfium" and not PdfiumRenderer.is_available():
+            messagebox.showerror("오류", "pdfium 엔진을 사용하려면 pypdfium2를 설치해주세요.")
+            return
+        
+        if settings.fmt not in STREAM_FORMATS and not check_encoder(settings.fmt):
+            messagebox.showerror("오류", f"{settings.fmt} 형식으로 저장할 수 없습니다. (Pillow 또는 pillow-avif-plugin 필요)")
+            return
+        
+        if self.save_callback:
+            self.save_callback(settings)
+        self.destroy()
+
+
+class PDFtoJPGApp(ctk.CTkFrame):
+    """메인 애플리케이션"""
+    
+    def __init__(self, master):
+        super().__init__(master)
+        self.pack(fill="both", expand=True)
+        self.master = master
+        
+        self.pdf_files: List[str] = []
+        self._cancel_requested = False
+        self.progress_popup: Optional[ProgressPopup] = None
+        
+        self._setup_window()
+        self._check_poppler()
+        self._create_widgets()
+        self._setup_drag_drop()
+    
+    def _setup_window(self) -> None:
+        """윈도우 설정"""
+        self.master.title(CONFIG.APP_TITLE)
+        self.master.geometry(CONFIG.MAIN_WINDOW_SIZE)
+        
+        icon_path = PathUtils.get_icon_path()
+        if icon_path:
+            with suppress(Exception):
+                self.master.iconbitmap(icon_path)
+            
+            self.master.update_idletasks()
+            self.master.after(100, lambda: IconManager.set_window_icon(self.master, icon_path))
+        
+        self.master.update_idletasks()
+        x = (self.master.winfo_screenwidth() - 600) // 2
+        y = (self.master.winfo_screenheight() - 300) // 2
+        self.master.geometry(f"600x300+{x}+{y}")
+    
+    def _check_poppler(self) -> None:
+        """Poppler 경로 확인"""
+        self.poppler_path = PathUtils.get_poppler_path()
+        
+        if not self.poppler_path:
+            app_dir = PathUtils.get_app_directory()
+            messagebox.showerror(
+                "오류",
+                f"Poppler를 찾을 수 없습니다.\n\n"
+                f"설치 경로: {app_dir / CONFIG.POPPLER_FOLDER_NAME}\n"
+                f"(또는 {CONFIG.POPPLER_PATH_ENV} 환경 변수나 PATH의 pdftoppm)\n\n"
+                f"프로그램을 다시 시작해주세요."
+            )
+            self.master.destroy()
+            sys.exit()
+        
+        app_dir = PathUtils.get_app_directory()
+        info_cache = PDFInfoCache(store_path=app_dir / CONFIG.PDFINFO_CACHE_FILENAME)
+        self.pdf_processor = PDFProcessor(self.poppler_path, info_cache)
+        # 환경 변수로 측정 파일을 지정하면 변환 단계별 시간을 기록
+        self.pdf_processor.metrics = MetricsRecorder.from_env()
+        self.render_cache = RenderCache(app_dir / CONFIG.RENDER_CACHE_FILENAME)
+        self.settings_path = app_dir / CONFIG.SETTINGS_FILENAME
+        self.settings = self._load_settings()
+        # 작업자 프로세스는 첫 변환 때 시작하여 프로그램 종료까지 재사용
+        self.worker_pool = RenderWorkerPool(self.settings.worker_count)
+    
+    def _load_settings(self) -> RenderSettings:
+        """저장된 변환 설정 불러오기 (없거나 읽을 수 없으면 기본값)"""
+        if not self.settings_path.exists():
+            return RenderSettings()
+        
+        try:
+            settings = RenderSettings.load(self.settings_path)
+            settings.validate()
+            return settings
+        except (OSError, ValueError) as e:
+            messagebox.showwarning("경고", f"설정 파일을 읽지 못해 기본값을 사용합니다.\n\n{e}")
+            return RenderSettings()
+    
+    def _create_widgets(self) -> None:
+        """UI 요소 생성"""
+        self.drop_area = ctk.CTkTextbox(self, height=220)
+        self.drop_area.pack(padx=10, pady=10, fill="x")
+        self.drop_area.configure(state="disabled")
+        
+        control_container = ctk.CTkFrame(self, fg_color="transparent")
+        control_container.pack(pady=10, fill="x", padx=10)
+        
+        buttons = [
+            ("불러오기", self.select_files),
+            ("지우기", self.remove_selected),
+            ("비우기", self.clear_list),
+            ("변환하기", self.start_conversion)
+        ]
+        
+        for text, command in buttons:
+            btn = ctk.CTkButton(control_container, text=text, command=command, width=100)
+            btn.pack(side="left", padx=5)
+        
+        version_label = ctk.CTkLabel(
+            control_container,
+            text=f"v{CONFIG.CURRENT_VERSION}",
+            text_color="gray"
+        )
+        version_label.pack(side="right", padx=10)
+        
+        settings_button = ctk.CTkButton(control_container, text="설정", command=self.open_settings, width=60)
+        settings_button.pack(side="right", padx=5)
+    
+    def _setup_drag_drop(self) -> None:
+        """드래그 앤 드롭 설정"""
+        self.master.drop_target_register(DND_FILES)
+        self.master.dnd_bind("<<Drop>>", self._on_drop)
+    
+    def select_files(self) -> None:
+        """파일 선택 대화상자"""
+        files = filedialog.askopenfilenames(
+            title="PDF 파일 선택",
+            filetypes=[("PDF files", "*.pdf")]
+        )
+        self._add_files(list(files))
+    
+    def _on_drop(self, event) -> None:
+        """드래그 앤 드롭 이벤트 처리"""
+        files = self.master.tk.splitlist(event.data)
+        pdf_files = [f for f in files if f.lower().endswith(".pdf")]
+        self._add_files(pdf_files)
+    
+    def _add_files(self, files) -> None:
+        """파일 목록에 추가 (같은 파일을 다른 경로 표기로 넣어도 한 번만 추가)"""
+        registered = {os.path.normcase(os.path.abspath(f)) for f in self.pdf_files}
+        for f in files:
+            key = os.path.normcase(os.path.abspath(f))
+            if key not in registered:
+                registered.add(key)
+                self.pdf_files.append(f)
+        self._update_file_list()
+    
+    def remove_selected(self) -> None:
+        """선택된 파일 제거"""
+        if not self.pdf_files:
+            messagebox.showinfo("알림", "목록에 파일이 없습니다.")
+            return
+        
+        try:
+            self.drop_area.configure(state="normal")
+            cursor_index = self.drop_area.index("insert")
+            self.drop_area.configure(state="disabled")
+            
+            line_num = int(cursor_index.split('.')[0]) - 1
+            
+            if 0 <= line_num < len(self.pdf_files):
+                removed_file = Path(self.pdf_files[line_num]).name
+                if messagebox.askyesno("파일 제거", f"'{removed_file}'을(를) 목록에서 제거하시겠습니까?"):
+                    self.pdf_files.pop(line_num)
+                    self._update_file_list()
+            else:
+                messagebox.showwarning("경고", "유효한 파일을 선택해주세요.")
+        
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 제거 중 오류 발생: {e}")
+    
+    def clear_list(self) -> None:
+        """파일 목록 비우기"""
+        if self.pdf_files:
+            if messagebox.askyesno("목록 비우기", "등록된 모든 파일을 목록에서 제거하시겠습니까?"):
+                self.pdf_files.clear()
+                self._update_file_list()
+        else:
+            messagebox.showinfo("알림", "목록이 이미 비어있습니다.")
+    
+    def _update_file_list(self) -> None:
+        """파일 목록 표시 업데이트"""
+        self.drop_area.configure(state="normal")
+        self.drop_area.delete("0.0", "end")
+        file_names = "\n".join(Path(f).name for f in self.pdf_files)
+        self.drop_area.insert("0.0", file_names)
+        self.drop_area.configure(state="disabled")
+    
+    def check_updates_in_background(self, update_checker: UpdateChecker) -> None:
+        """업데이트 확인 (캐시가 유효하면 네트워크를 사용하지 않음)"""
+        def worker() -> None:
+            status = update_checker.get()
+            with suppress(Exception):
+                self.master.after(0, lambda: self._on_update_checked(status))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_update_checked(self, status: UpdateStatus) -> None:
+        """새 버전이 있으면 Release 페이지 열기 제안 (새 Poppler는 다음 실행 때 초기화 창에서 설치)"""
+        release = status.release
+        if release and VersionManager.is_newer(CONFIG.CURRENT_VERSION, release.version):
+            if messagebox.askyesno("업데이트", f"새 버전 {release.version}이(가) 있습니다.\n\nRelease 페이지를 열까요?"):
+                ReleaseManager.open_release_page(release.html_url)
+    
+    def open_settings(self) -> None:
+        """변환 설정 팝업 열기"""
+        popup = SettingsPopup(self.master, self.settings)
+        popup.save_callback = self._save_settings
+    
+    def _save_settings(self, settings: RenderSettings) -> None:
+        """변환 설정 적용 및 저장"""
+        self.settings = settings
+        
+        try:
+            settings.save(self.settings_path)
+        except OSError as e:
+            messagebox.showwarning("경고", f"설정을 저장하지 못했습니다. (이번 실행에만 적용됩니다)\n\n{e}")
+    
+    def start_conversion(self) -> None:
+        """변환 작업 시작"""
+        if not self.pdf_files:
+            messagebox.showwarning("경고", "등록된 PDF 파일이 없습니다.")
+            return
+        
+        try:
+            self.settings.validate()
+        except ValueError as e:
+            messagebox.showerror("오류", f"변환 설정이 올바르지 않습니다: {e}")
+            return
+        
+        # 페이지 수는 변환 스레드에서 확인하며 확인되는 대로 전체 페이지 수를 갱신
+        self.progress_popup = ProgressPopup(self.master, len(self.pdf_files), 0)
+        self.progress_popup.cancel_callback = self._cancel_conversion
+        self._cancel_requested = False
+        
+        threading.Thread(target=self._convert_files, daemon=True).start()
+    
+    def _cancel_conversion(self) -> None:
+        """변환 작업 취소"""
+        self._cancel_requested = True
+    
+    def _convert_files(self) -> None:
+        """PDF 파일들을 JPG로 변환 (여러 파일을 프로세스 풀에서 동시에 처리)"""
+        try:
+            completed_files = 0
+            completed_pages = 0
+            errors: List[str] = []
+            
+            pdf_files = list(self.pdf_files)
+            total_pages = 0
+            
+            def iter_jobs() -> Iterator[ConversionJob]:
+                nonlocal total_pages
+                counted = 0
+                
+                for index, pages, error in self.pdf_processor.iter_page_counts(pdf_files):
+                    if error:
+                        errors.append(str(error))
+                        self._cancel_requested = True
+                        return
+                    
+                    if self._cancel_requested:
+                        return
+                    
+                    counted += 1
+                    total_pages += pages
+                    if self.progress_popup:
+                        self.progress_popup.update_total_pages(total_pages, counted < len(pdf_files))
+                    
+                    output_folder = PathUtils.get_output_folder(Path(pdf_files[index]))
+                    yield ConversionJob(index, pdf_files[index], str(output_folder), pages)
+            
+            def page_callback(job: ConversionJob, pages: int) -> None:
+                nonlocal completed_pages
+                if not self._cancel_requested and self.progress_popup:
+                    completed_pages += pages
+                    self.progress_popup.update_page_progress(completed_pages)
+            
+            def file_callback(job: ConversionJob, pages: int, error: Optional[BaseException]) -> None:
+                nonlocal completed_files
+                if error:
+                    # 한 파일이라도 실패하면 남은 작업을 중단
+                    errors.append(f"{Path(job.pdf_path).name}: {error}")
+                    self._cancel_requested = True
+                elif not self._cancel_requested and self.progress_popup:
+                    completed_files += 1
+                    self.progress_popup.update_file_progress(completed_files)
+            
+            scheduler = ConversionScheduler(
+                self.poppler_path, self.settings, render_cache=self.render_cache, pool=self.worker_pool,
+                metrics=self.pdf_processor.metrics
+            )
+            scheduler.run(iter_jobs(), page_callback, file_callback, lambda: self._cancel_requested)
+            
+            if errors:
+                raise RuntimeError(errors[0])
+            
+            if not self._cancel_requested:
+                if self.progress_popup:
+                    self.progress_popup.show_completion()
+            else:
+                if self.progress_popup:
+                    self.progress_popup.cancel_button.configure(state="disabled")
+            
+            self._cancel_requested = False
+        
+        except Exception as e:
+            self._cancel_requested = False
+            messagebox.showerror("오류", f"변환 중 오류 발생: {e}")
+            if self.progress_popup:
+                self.progress_popup.destroy()
+
+
+def run_initialization(update_checker: UpdateChecker) -> None:
+    """초기화 창 실행 (업데이트로 종료하거나 실패하면 프로그램 종료)"""
+    init_window: Optional[InitializationWindow] = None
+    
+    try:
+        init_window = InitializationWindow(update_checker)
+        init_window.mainloop()
+    except KeyboardInterrupt:
+        sys.exit(0)
+    except Exception as e:
+        print(f"초기화 오류: {e}")
+        sys.exit(1)
+    
+    result = InitializationResult()
+    
+    if init_window:
+        try:
+            result.update_started = init_window.result.update_started
+            result.launch_main = init_window.result.launch_main
+        except Exception:
+            pass
+        
+        with suppress(Exception):
+            init_window.destroy()
+        
+        del init_window
+    
+    if result.update_started:
+        sys.exit(0)
+    
+    if not result.launch_main:
+        sys.exit(1)
+
+
+def main() -> None:
+    """GUI 실행 (P2J.main()에서 불러옴)"""
+    initialize_app()
+    app_dir = PathUtils.get_app_directory()
+    # 오프라인 모드는 업데이트 확인/Poppler 설치 없이 찾은 Poppler로 바로 시작
+    offline = "--offline" in sys.argv[1:] or PathUtils.is_offline()
+    api_client = GitHubAPIClient(app_dir / CONFIG.RELEASE_CACHE_FILENAME, offline=offline, verify_ssl=VERIFY_SSL)
+    update_checker = UpdateChecker(app_dir / CONFIG.UPDATE_CACHE_FILENAME, api_client)
+    
+    # Poppler가 이미 있으면 초기화 창 없이 바로 시작하고 업데이트는 백그라운드에서 확인
+    fast_start = offline or update_checker.can_fast_start(app_dir)
+    if not fast_start:
+        run_initialization(update_checker)
+    
+    try:
+        root = TkinterDnD.Tk()
+        app = PDFtoJPGApp(root)
+        if fast_start and not offline:
+            app.check_updates_in_background(update_checker)
+        root.mainloop()
+        app.worker_pool.shutdown()
+    except Exception as e:
+        messagebox.showerror("오류", f"프로그램 실행 중 오류 발생:\n{e}")
+        sys.exit(1)
+
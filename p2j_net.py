@@ -0,0 +1,259 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Optional, Callable, Tuple, Dict, Any
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+
+from p2j_core import CONFIG
+
+
+# ==================== GitHub API ====================
+
+
+class GitHubAPIClient:
+    """GitHub API 클라이언트 (연결을 재사용하는 세션 하나로 요청, 오프라인이면 요청하지 않음)"""
+    
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        api_base: str = CONFIG.GITHUB_API_URL,
+        offline: bool = False,
+        verify_ssl: bool = True
+    ):
+        self.cache_path = cache_path
+        self.api_base = api_base.rstrip("/")
+        self.offline = offline
+        self.verify_ssl = verify_ssl
+        self._session = None
+        self._lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """requests 세션 (처음 사용할 때 생성)"""
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                self._session = requests.Session()
+                self._session.verify = self.verify_ssl
+                adapter = HTTPAdapter(pool_maxsize=CONFIG.DOWNLOAD_SEGMENTS)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+            return self._session
+    
+    def _load_release_cache(self) -> Dict[str, Any]:
+        """저장된 Release 정보 (API URL → ETag, 응답)"""
+        if not self.cache_path:
+            return {}
+        
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _store_release(self, api_url: str, etag: Optional[str], data: Dict[str, Any]) -> None:
+        """Release 정보와 ETag 저장"""
+        if not self.cache_path or not etag:
+            return
+        
+        with self._lock:
+            cache = self._load_release_cache()
+            cache[api_url] = {"etag": etag, "data": data}
+            temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with suppress(OSError):
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(cache, f, ensure_ascii=False)
+                os.replace(temp_path, self.cache_path)
+    
+    def get_latest_release(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """저장소의 최신 Release 정보 가져오기 (ETag가 같으면 저장된 정보 사용)"""
+        if self.offline:
+            return None
+        
+        import requests
+        
+        api_url = f"{self.api_base}/repos/{owner}/{repo}/releases/latest"
+        cached = self._load_release_cache().get(api_url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        
+        try:
+            response = self.session.get(api_url, headers=headers, timeout=CONFIG.REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached:
+                return cached["data"]
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError):
+            return None
+        
+        self._store_release(api_url, response.headers.get("ETag"), data)
+        return data
+    
+    def _probe(self, url: str) -> Tuple[str, int, bool]:
+        """리다이렉트 후 최종 URL, 파일 크기, 구간 요청 지원 여부 확인 (서명된 URL은 매번 새로 받음)"""
+        response = self.session.head(url, allow_redirects=True, timeout=CONFIG.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        size = int(response.headers.get("content-length", 0))
+        ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        return response.url, size, ranges
+    
+    @staticmethod
+    def _load_segments(state_path: Path, part_path: Path, url: str, total_size: int) -> List[List[int]]:
+        """이어받기 상태 불러오기 (없거나 맞지 않으면 새로 분할)
+        
+        각 구간은 [시작, 끝, 받은 바이트 수]
+        """
+        with suppress(OSError, ValueError, KeyError, TypeError):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state["url"] == url and state["size"] == total_size and part_path.stat().st_size == total_size:
+                return [[int(start), int(end), int(done)] for start, end, done in state["segments"]]
+        
+        count = max(1, min(CONFIG.DOWNLOAD_SEGMENTS, total_size // CONFIG.DOWNLOAD_SEGMENT_MIN_SIZE))
+        step = -(-total_size // count)
+        with open(part_path, "wb") as f:
+            f.truncate(total_size)
+        return [[start, min(start + step, total_size) - 1, 0] for start in range(0, total_size, step)]
+    
+    def _fetch_segment(
+        self,
+        url: str,
+        part_path: Path,
+        segment: List[int],
+        on_bytes: Callable[[int], None]
+    ) -> None:
+        """구간 하나 다운로드 (끊기면 받은 곳부터 다시 요청)"""
+        import requests
+        
+        for attempt in range(1, CONFIG.DOWNLOAD_RETRIES + 1):
+            start = segment[0] + segment[2]
+            if start > segment[1]:
+                return
+            
+            try:
+                headers = {"Range": f"bytes={start}-{segment[1]}"}
+                with self.session.get(url, headers=headers, stream=True, timeout=CONFIG.DOWNLOAD_TIMEOUT) as response:
+                    if response.status_code != 206:
+                        raise RuntimeError(f"구간 요청을 지원하지 않는 응답입니다: HTTP {response.status_code}")
+                    
+                    with open(part_path, "r+b") as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(chunk_size=CONFIG.DOWNLOAD_CHUNK_SIZE):
+                            chunk = chunk[:segment[1] + 1 - segment[0] - segment[2]]
+                            if not chunk:
+                                continue
+                            f.write(chunk)
+                            segment[2] += len(chunk)
+                            on_bytes(len(chunk))
+            except requests.RequestException:
+                if attempt == CONFIG.DOWNLOAD_RETRIES:
+                    raise
+        
+        if segment[0] + segment[2] <= segment[1]:
+            raise RuntimeError("다운로드가 끝나기 전에 연결이 끊겼습니다.")
+    
+    def _fetch_whole(self, url: str, part_path: Path, on_bytes: Callable[[int], None]) -> None:
+        """구간 요청을 지원하지 않는 서버에서 한 번에 다운로드"""
+        with self.session.get(url, stream=True, timeout=CONFIG.DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CONFIG.DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        on_bytes(len(chunk))
+    
+    @staticmethod
+    def file_sha256(path: Path) -> str:
+        """파일의 SHA-256"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def download_file(
+        self,
+        url: str,
+        dest_path: Path,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        sha256: Optional[str] = None
+    ) -> bool:
+        """파일 다운로드 (진행률 콜백 지원)
+        
+        서버가 구간 요청을 지원하면 여러 연결로 나눠 받고, 실패하면 받은 부분을 '.part'로 남겨
+        다음 호출에서 이어받음. sha256을 주면 받은 파일을 검증함
+        """
+        if self.offline:
+            return False
+        
+        part_path = dest_path.with_name(dest_path.name + ".part")
+        state_path = dest_path.with_name(dest_path.name + ".part.json")
+        segments: Optional[List[List[int]]] = None
+        progress_lock = threading.Lock()
+        downloaded = 0
+        last_percent = -1
+        
+        try:
+            try:
+                final_url, total_size, ranges = self._probe(url)
+            except Exception:
+                # HEAD를 받지 않는 서버는 한 번에 다운로드
+                final_url, total_size, ranges = url, 0, False
+            
+            def on_bytes(count: int) -> None:
+                nonlocal downloaded, last_percent
+                with progress_lock:
+                    downloaded += count
+                    if total_size and progress_callback:
+                        percent = min(99, int((downloaded / total_size) * 100))
+                        if percent != last_percent and percent % CONFIG.PROGRESS_UPDATE_INTERVAL == 0:
+                            progress_callback(percent)
+                            last_percent = percent
+            
+            if ranges and total_size:
+                segments = self._load_segments(state_path, part_path, url, total_size)
+                on_bytes(sum(segment[2] for segment in segments))
+                
+                with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+                    futures = [
+                        executor.submit(self._fetch_segment, final_url, part_path, segment, on_bytes)
+                        for segment in segments
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                self._fetch_whole(final_url, part_path, on_bytes)
+            
+            if total_size and part_path.stat().st_size != total_size:
+                raise RuntimeError("받은 파일 크기가 맞지 않습니다.")
+            
+            if sha256 and self.file_sha256(part_path) != sha256.lower():
+                # 손상된 파일은 이어받지 않도록 모두 삭제
+                segments = None
+                part_path.unlink(missing_ok=True)
+                raise RuntimeError("체크섬이 일치하지 않습니다.")
+            
+            os.replace(part_path, dest_path)
+            segments = None
+            state_path.unlink(missing_ok=True)
+            
+            if progress_callback:
+                progress_callback(100)
+            
+            return True
+        
+        except Exception:
+            return False
+        
+        finally:
+            if segments is not None:
+                with suppress(OSError):
+                    with open(state_path, "w", encoding="utf-8") as f:
+                        json.dump({"url": url, "size": segments[-1][1] + 1, "segments": segments}, f)
+            elif state_path.exists() and not part_path.exists():
+                state_path.unlink(missing_ok=True)
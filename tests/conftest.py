@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# 저장소 루트의 p2j_core를 설치 없이 불러옴
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+FAKE_PDFTOPPM = '''#!{python}
+import sys
+from pathlib import Path
+
+# -f/-l 범위의 페이지 파일을 이어서 표준 출력으로 내보내는 가짜 pdftoppm
+args = sys.argv[1:]
+first, last = int(args[args.index("-f") + 1]), int(args[args.index("-l") + 1])
+pages = sorted(Path({pages!r}).iterdir(), key=lambda p: int(p.stem))
+for page in pages[first - 1:last]:
+    sys.stdout.buffer.write(page.read_bytes())
+'''
+
+
+@pytest.fixture
+def fake_poppler(tmp_path):
+    """페이지 데이터 목록을 받아 그대로 출력하는 가짜 pdftoppm이 든 폴더 반환"""
+    if sys.platform == "win32":
+        pytest.skip("가짜 pdftoppm은 실행 권한이 있는 스크립트가 필요함")
+    
+    def make(pages):
+        pages_dir = tmp_path / "pages"
+        pages_dir.mkdir()
+        for page_num, data in enumerate(pages, start=1):
+            (pages_dir / f"{page_num}.bin").write_bytes(data)
+        
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        script = bin_dir / "pdftoppm"
+        script.write_text(FAKE_PDFTOPPM.format(python=sys.executable, pages=str(pages_dir)))
+        script.chmod(0o755)
+        return str(bin_dir)
+    
+    return make
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import p2j_core
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def pdfium():
+    pytest.importorskip("pypdfium2")
+    pytest.importorskip("PIL")
+
+
+def test_bench_command_renders_every_page(tmp_path):
+    # spawn 작업자가 P2J.py를 다시 불러와도 GUI 모듈 없이 동작해야 함
+    out = tmp_path / "bench.json"
+    result = subprocess.run(
+        [
+            sys.executable, str(REPO_ROOT / "P2J.py"), "bench", "--kinds", "text", "many-pages", "--pages", "2",
+            "--dpi", "30", "--engine", "pdfium", "--format", "png", "--out", str(out)
+        ],
+        cwd=tmp_path, capture_output=True, text=True, timeout=120
+    )
+    
+    assert result.returncode == 0, result.stdout + result.stderr
+    cases = json.loads(out.read_text(encoding="utf-8"))["cases"]
+    assert [(case["kind"], case["pages"]) for case in cases] == [("text", 2), ("many-pages", 20)]
+    assert all(case["pages_per_sec"] > 0 and case["output_bytes"] > 0 for case in cases)
+
+
+def test_bench_reports_cases_that_miss_pages(monkeypatch):
+    write_synthetic_pdf = p2j_core.write_synthetic_pdf
+    monkeypatch.setattr(p2j_core, "write_synthetic_pdf", lambda path, kind, pages: write_synthetic_pdf(path, kind, pages) + 1)
+    
+    report = p2j_core.run_benchmark(None, ["text"], [30], [1], ["pdfium"], ["png"], pages=2)
+    
+    assert report["cases"][0]["error"] == "3페이지 중 2페이지만 변환되었습니다."
+
+
+def test_bench_reports_serial_pdfium_rendering():
+    logs = []
+    
+    report = p2j_core.run_benchmark(
+        None, ["text"], [30], [2], ["pdfium"], ["png"], pages=2, log_callback=lambda msg, _: logs.append(msg)
+    )
+    
+    assert report["cases"][0]["render_threads"] == 1
+    assert "x2 (렌더링은 한 번에 하나씩)" in logs[-1]
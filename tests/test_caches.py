@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from p2j_core import PDFInfoCache, RenderCache
+
+
+# ==================== PDF 정보 캐시 ====================
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "input.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+    return path
+
+
+def test_pdfinfo_cache_round_trip(tmp_path, pdf_file):
+    store = tmp_path / "pdfinfo_cache.json"
+    cache = PDFInfoCache(store_path=store)
+    cache.put(str(pdf_file), {"Pages": 3})
+    cache.save()
+    
+    assert PDFInfoCache(store_path=store).get(str(pdf_file)) == {"Pages": 3}
+
+
+def test_pdfinfo_cache_misses_after_file_changes(tmp_path, pdf_file):
+    cache = PDFInfoCache()
+    cache.put(str(pdf_file), {"Pages": 3})
+    pdf_file.write_bytes(b"%PDF-1.4\n% changed\n")
+    
+    assert cache.get(str(pdf_file)) is None
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    '{"a": 1}',
+    "[1, 2, 3]",
+    '[["a.pdf", 1]]',
+    '[["a.pdf", "mtime", 1, {"Pages": 1}]]',
+    '[["a.pdf", 1, 1, "info"]]',
+])
+def test_pdfinfo_cache_ignores_malformed_store(tmp_path, pdf_file, content):
+    store = tmp_path / "pdfinfo_cache.json"
+    store.write_text(content, encoding="utf-8")
+    
+    cache = PDFInfoCache(store_path=store)
+    
+    assert cache.get(str(pdf_file)) is None
+    cache.put(str(pdf_file), {"Pages": 1})
+    cache.save()
+    assert json.loads(store.read_text(encoding="utf-8"))[0][3] == {"Pages": 1}
+
+
+# ==================== 렌더링 색인 ====================
+
+
+def test_render_cache_round_trip(tmp_path):
+    store = tmp_path / "render_cache.json"
+    cache = RenderCache(store)
+    cache.register("key", tmp_path / "a")
+    cache.register("key", tmp_path / "b")
+    cache.save()
+    
+    assert RenderCache(store).lookup("key") == [tmp_path / "b", tmp_path / "a"]
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    '{"key": ["a"]}',
+    "[1, 2]",
+    '[["key"]]',
+    '[["key", "folder"]]',
+    '[["key", [1]]]',
+    '[[["key"], ["folder"]]]',
+])
+def test_render_cache_ignores_malformed_store(tmp_path, content):
+    store = tmp_path / "render_cache.json"
+    store.write_text(content, encoding="utf-8")
+    
+    cache = RenderCache(store)
+    
+    assert cache.lookup("key") == []
+    cache.register("key", tmp_path / "a")
+    cache.save()
+    assert json.loads(store.read_text(encoding="utf-8")) == [["key", [str(tmp_path / "a")]]]
@@ -0,0 +1,171 @@
+import zipfile
+
+import pytest
+
+from p2j_core import (
+    ArchiveWriter, BatchConverter, ConversionJob, ConversionScheduler, PDFProcessor, RenderCache, RenderSettings,
+    convert, write_synthetic_pdf
+)
+
+
+@pytest.fixture
+def pdfium_processor():
+    pytest.importorskip("pypdfium2")
+    processor = PDFProcessor(None, engine="pdfium")
+    yield processor
+    processor.close()
+
+
+@pytest.fixture
+def text_pdf(tmp_path):
+    path = tmp_path / "문서.pdf"
+    write_synthetic_pdf(path, "text", 3)
+    return path
+
+
+# ==================== 압축 파일 저장 ====================
+
+
+def test_convert_to_archive_writes_every_page(pdfium_processor, text_pdf, tmp_path):
+    settings = RenderSettings(dpi=20, fmt="png", engine="pdfium", archive="cbz")
+    output_folder = tmp_path / "JPG 변환(문서)"
+    
+    pages = pdfium_processor.convert_to_images(str(text_pdf), output_folder, settings=settings)
+    
+    assert pages == 3
+    assert not output_folder.exists()
+    with zipfile.ZipFile(tmp_path / "JPG 변환(문서).cbz") as archive:
+        assert archive.namelist() == ["1.png", "2.png", "3.png"]
+        assert all(archive.read(name).startswith(b"\x89PNG") for name in archive.namelist())
+
+
+def test_convert_to_archive_leaves_same_named_user_file_alone(pdfium_processor, text_pdf, tmp_path):
+    user_archive = tmp_path / "문서.cbz"
+    user_archive.write_bytes(b"user data")
+    settings = RenderSettings(dpi=20, fmt="png", engine="pdfium", archive="cbz")
+    
+    pdfium_processor.convert_to_images(str(text_pdf), tmp_path / "JPG 변환(문서)", settings=settings)
+    
+    assert user_archive.read_bytes() == b"user data"
+
+
+def test_archive_abort_keeps_previous_result(tmp_path):
+    path = tmp_path / "JPG 변환(문서).zip"
+    path.write_bytes(b"previous run")
+    
+    writer = ArchiveWriter(path)
+    writer.add("1.png", b"partial")
+    writer.abort()
+    
+    assert path.read_bytes() == b"previous run"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [path.name]
+
+
+def test_archive_discard_drops_entries_of_failed_pdf(tmp_path):
+    path = tmp_path / "batch.zip"
+    writer = ArchiveWriter(path)
+    writer.add("a/1.png", b"1")
+    writer.add("a_2/1.png", b"2")
+    writer.add("b/1.png", b"3")
+    
+    writer.discard("a/")
+    writer.close()
+    
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == ["a_2/1.png", "b/1.png"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["batch.zip"]
+
+
+# ==================== 라이브러리 API ====================
+
+
+def test_convert_returns_requested_page_range(text_pdf):
+    pytest.importorskip("pypdfium2")
+    settings = RenderSettings(dpi=20, fmt="png", engine="pdfium")
+    
+    assert [page.page for page in convert(str(text_pdf), settings, first_page=2, last_page=3)] == [2, 3]
+
+
+@pytest.mark.parametrize("first_page, last_page", [(0, 2), (-1, None), (3, 2), (2, 4), (4, None)])
+def test_convert_rejects_invalid_page_range(text_pdf, first_page, last_page):
+    pytest.importorskip("pypdfium2")
+    settings = RenderSettings(engine="pdfium")
+    
+    with pytest.raises(ValueError, match="페이지 범위"):
+        convert(str(text_pdf), settings, first_page=first_page, last_page=last_page)
+
+
+# ==================== 일괄 변환 ====================
+
+
+def test_output_folders_mirror_input_tree_under_out(tmp_path):
+    for folder in ("a", "b", "b/c"):
+        (tmp_path / "tree" / folder).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "tree" / folder / "report.pdf").write_bytes(b"%PDF-1.4\n")
+    converter = BatchConverter(None, output_root=tmp_path / "out")
+    
+    pdf_files = BatchConverter.collect_inputs([str(tmp_path / "tree")])
+    output_folders = converter.get_output_folders(pdf_files)
+    
+    assert [folder.relative_to(tmp_path / "out").as_posix() for folder in output_folders] == [
+        "a/JPG 변환(report)", "b/c/JPG 변환(report)", "b/JPG 변환(report)"
+    ]
+    assert BatchConverter.find_conflicts(output_folders) == []
+
+
+def test_find_conflicts_reports_files_sharing_an_output_folder(tmp_path):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "report.pdf").write_bytes(b"%PDF-1.4\n")
+    converter = BatchConverter(None, output_root=tmp_path / "out")
+    
+    pdf_files = BatchConverter.collect_inputs([str(tmp_path / "a" / "report.pdf"), str(tmp_path / "b" / "report.pdf")])
+    
+    assert BatchConverter.find_conflicts(converter.get_output_folders(pdf_files)) == [(0, 1)]
+
+
+# ==================== 진행률 ====================
+
+
+def test_progress_callback_receives_running_page_count(pdfium_processor, text_pdf, tmp_path):
+    settings = RenderSettings(dpi=20, engine="pdfium", workers=2)
+    output_folder = tmp_path / "out"
+    output_folder.mkdir()
+    progress = []
+    
+    pdfium_processor.convert_to_images(str(text_pdf), output_folder, progress.append, settings, chunk_size=1)
+    
+    assert progress == [1, 2, 3]
+    
+    # 이어서 변환하면 건너뛴 페이지 수부터 시작
+    (output_folder / "2.jpg").unlink()
+    progress.clear()
+    pdfium_processor.convert_to_images(str(text_pdf), output_folder, progress.append, settings)
+    
+    assert progress == [2, 3]
+
+
+# ==================== 같은 내용의 PDF ====================
+
+
+@pytest.mark.parametrize("changes", [{"dpi": 40}, {"dpi": 40, "resume": False}])
+def test_reconverting_original_leaves_imported_duplicate_untouched(tmp_path, changes):
+    pytest.importorskip("pypdfium2")
+    original, duplicate = tmp_path / "x.pdf", tmp_path / "y.pdf"
+    write_synthetic_pdf(original, "vector", 2)
+    duplicate.write_bytes(original.read_bytes())
+    render_cache = RenderCache(tmp_path / "render_cache.json")
+    
+    def run(pdf, dpi=20, resume=True):
+        scheduler = ConversionScheduler(None, RenderSettings(dpi=dpi, engine="pdfium", workers=1), resume=resume, render_cache=render_cache)
+        scheduler.run([ConversionJob(0, str(pdf), str(tmp_path / pdf.stem), 2)])
+        return scheduler.page_counts
+    
+    run(original)
+    assert run(duplicate)["imported"] == 2
+    before = {name: (tmp_path / "y" / name).read_bytes() for name in ("1.jpg", "2.jpg")}
+    
+    run(original, **changes)
+    
+    assert {name: (tmp_path / "y" / name).read_bytes() for name in before} == before
+    assert run(duplicate)["skipped"] == 2
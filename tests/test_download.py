@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+import p2j_net
+from p2j_net import GitHubAPIClient
+
+
+BLOB = os.urandom(400_000)
+BLOB_SHA256 = hashlib.sha256(BLOB).hexdigest()
+
+
+class ReleaseServer(ThreadingHTTPServer):
+    """Release API와 구간 요청을 흉내 내는 로컬 서버 (drops만큼 응답을 중간에 끊음)"""
+    
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ReleaseHandler)
+        self.ranges = True
+        self.drops = 0
+        self.requests = []
+        self.lock = threading.Lock()
+    
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class ReleaseHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+    
+    def do_HEAD(self):
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/blob")
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BLOB)))
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(self.headers)))
+        
+        if self.path.startswith("/repos/"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps({"tag_name": "v1.0.0"}).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        
+        if self.path == "/redirect":
+            self.do_HEAD()
+            return
+        
+        requested = self.headers.get("Range")
+        if requested and self.server.ranges:
+            first, last = requested[len("bytes="):].split("-")
+            first, last = int(first), int(last) if last else len(BLOB) - 1
+            data = BLOB[first:last + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {first}-{last}/{len(BLOB)}")
+        else:
+            data = BLOB
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        
+        with self.server.lock:
+            drop = self.server.drops > 0
+            self.server.drops -= drop
+        if drop:
+            self.wfile.write(data[:len(data) // 3])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    server = ReleaseServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch):
+    # 작은 파일도 여러 구간으로 나누고, 끊기면 바로 실패하도록 재시도 없이 받음
+    monkeypatch.setattr(p2j_net, "CONFIG", replace(
+        p2j_net.CONFIG, DOWNLOAD_SEGMENT_MIN_SIZE=100_000, DOWNLOAD_CHUNK_SIZE=8192, DOWNLOAD_RETRIES=1
+    ))
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    client = GitHubAPIClient(tmp_path / "release_cache.json", api_base=server.base_url)
+    yield client
+    client.session.close()
+
+
+def blob_requests(server):
+    return [headers for path, headers in server.requests if path == "/blob"]
+
+
+# ==================== Release 정보 ====================
+
+
+def test_latest_release_is_revalidated_with_etag(server, client, tmp_path):
+    assert client.get_latest_release("owner", "repo") == {"tag_name": "v1.0.0"}
+    assert client.get_latest_release("owner", "repo") == {"tag_name": "v1.0.0"}
+    
+    api_requests = [headers for path, headers in server.requests if path.startswith("/repos/")]
+    assert "If-None-Match" not in api_requests[0]
+    assert api_requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_offline_client_makes_no_requests(server, tmp_path):
+    client = GitHubAPIClient(tmp_path / "release_cache.json", api_base=server.base_url, offline=True)
+    
+    assert client.get_latest_release("owner", "repo") is None
+    assert not client.download_file(f"{server.base_url}/redirect", tmp_path / "poppler.zip")
+    assert server.requests == []
+
+
+# ==================== 다운로드 ====================
+
+
+def test_segmented_download_with_checksum(server, client, tmp_path):
+    dest = tmp_path / "poppler.zip"
+    progress = []
+    
+    assert client.download_file(f"{server.base_url}/redirect", dest, progress.append, BLOB_SHA256)
+    
+    assert dest.read_bytes() == BLOB
+    assert progress[-1] == 100
+    assert len(blob_requests(server)) == 4
+    assert all(headers["Range"].startswith("bytes=") for headers in blob_requests(server))
+    assert sorted(os.listdir(tmp_path)) == ["poppler.zip"]
+
+
+def test_interrupted_download_resumes_on_next_call(server, client, tmp_path):
+    dest = tmp_path / "poppler.zip"
+    server.drops = 100
+    
+    assert not client.download_file(f"{server.base_url}/redirect", dest, sha256=BLOB_SHA256)
+    
+    assert not dest.exists()
+    state = json.loads((tmp_path / "poppler.zip.part.json").read_text(encoding="utf-8"))
+    received = [done for _, _, done in state["segments"]]
+    assert all(done > 0 for done in received)
+    
+    server.drops = 0
+    server.requests.clear()
+    assert client.download_file(f"{server.base_url}/redirect", dest, sha256=BLOB_SHA256)
+    
+    assert dest.read_bytes() == BLOB
+    resumed_from = sorted(int(headers["Range"][len("bytes="):].split("-")[0]) for headers in blob_requests(server))
+    assert resumed_from == [first + done for first, _, done in state["segments"]]
+    assert sorted(os.listdir(tmp_path)) == ["poppler.zip"]
+
+
+def test_checksum_mismatch_discards_download(server, client, tmp_path):
+    dest = tmp_path / "poppler.zip"
+    
+    assert not client.download_file(f"{server.base_url}/redirect", dest, sha256="0" * 64)
+    
+    assert os.listdir(tmp_path) == []
+    
+    # 손상된 파일은 이어받지 않고 처음부터 다시 받음
+    server.requests.clear()
+    assert client.download_file(f"{server.base_url}/redirect", dest, sha256=BLOB_SHA256)
+    assert dest.read_bytes() == BLOB
+    assert all(headers["Range"].split("-")[0] in {f"bytes={n * 100_000}" for n in range(4)} for headers in blob_requests(server))
+
+
+def test_download_without_range_support(server, client, tmp_path):
+    server.ranges = False
+    dest = tmp_path / "poppler.zip"
+    
+    assert client.download_file(f"{server.base_url}/redirect", dest, sha256=BLOB_SHA256)
+    
+    assert dest.read_bytes() == BLOB
+    assert ["Range" in headers for headers in blob_requests(server)] == [False]
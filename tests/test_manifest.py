@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+from p2j_core import ConversionJob, ConversionManifest, ConversionScheduler, RenderSettings, write_synthetic_pdf
+
+
+SETTINGS = RenderSettings().output_key()
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "input.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + b"x" * 100)
+    return path
+
+
+def finish(manifest, pages, extension="jpg"):
+    manifest.output_folder.mkdir(parents=True, exist_ok=True)
+    digits = len(str(manifest.total_pages))
+    for page_num in pages:
+        (manifest.output_folder / f"{str(page_num).zfill(digits)}.{extension}").write_bytes(b"page")
+        manifest.mark_done(page_num)
+    manifest.save()
+
+
+# ==================== 이어서 변환 ====================
+
+
+def test_resume_skips_completed_pages(tmp_path, pdf_file):
+    output_folder = tmp_path / "out"
+    finish(ConversionManifest.load(output_folder, str(pdf_file), 12, SETTINGS), [1, 2, 5])
+    
+    manifest = ConversionManifest.load(output_folder, str(pdf_file), 12, SETTINGS)
+    
+    assert manifest.missing_pages("jpg") == [3, 4] + list(range(6, 13))
+
+
+def test_resume_redoes_pages_whose_files_are_gone(tmp_path, pdf_file):
+    output_folder = tmp_path / "out"
+    finish(ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS), [1, 2, 3])
+    (output_folder / "2.jpg").unlink()
+    
+    manifest = ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS)
+    
+    assert manifest.missing_pages("jpg") == [2]
+    assert manifest.missing_pages("png") == [1, 2, 3]
+
+
+@pytest.mark.parametrize("change", ["content", "settings", "pages"])
+def test_resume_starts_over_when_source_or_settings_change(tmp_path, pdf_file, change):
+    output_folder = tmp_path / "out"
+    finish(ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS), [1, 2, 3])
+    settings, pages = SETTINGS, 3
+    if change == "content":
+        pdf_file.write_bytes(b"%PDF-1.4\n" + b"y" * 101)
+    elif change == "settings":
+        settings = RenderSettings(dpi=300).output_key()
+    else:
+        pages = 4
+    
+    manifest = ConversionManifest.load(output_folder, str(pdf_file), pages, settings)
+    
+    assert manifest.missing_pages("jpg") == list(range(1, pages + 1))
+
+
+def test_resume_reuses_stored_hash_when_file_is_unchanged(tmp_path, pdf_file, monkeypatch):
+    output_folder = tmp_path / "out"
+    finish(ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS), [1])
+    monkeypatch.setattr(ConversionManifest, "hash_file", classmethod(lambda cls, path: pytest.fail("해시를 다시 계산함")))
+    
+    assert ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS).missing_pages("jpg") == [2, 3]
+
+
+VALID = {"version": 1, "source": {"sha256": "0" * 64}, "settings": SETTINGS, "pages": 3, "completed": [1, 2, 3]}
+
+
+@pytest.mark.parametrize("content", [
+    "broken",
+    "[]",
+    json.dumps({**VALID, "version": 0}),
+    json.dumps({**VALID, "source": "x"}),
+    json.dumps({**VALID, "source": None}),
+    json.dumps({**VALID, "source": {"sha256": 1}}),
+    json.dumps({**VALID, "settings": []}),
+    json.dumps({**VALID, "pages": "3"}),
+    json.dumps({**VALID, "completed": "123"}),
+    json.dumps({**VALID, "completed": [1, "2"]}),
+])
+def test_resume_ignores_unreadable_manifest(tmp_path, pdf_file, content):
+    output_folder = tmp_path / "out"
+    output_folder.mkdir()
+    (output_folder / ConversionManifest.FILENAME).write_text(content, encoding="utf-8")
+    
+    manifest = ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS)
+    
+    assert manifest.missing_pages("jpg") == [1, 2, 3]
+    assert ConversionManifest.read(output_folder) is None
+
+
+def test_corrupt_manifest_does_not_stop_batch(tmp_path, pdf_file):
+    pytest.importorskip("pypdfium2")
+    write_synthetic_pdf(pdf_file, "text", 2)
+    output_folder = tmp_path / "out"
+    output_folder.mkdir()
+    (output_folder / ConversionManifest.FILENAME).write_text(json.dumps({**VALID, "source": "x"}), encoding="utf-8")
+    results = []
+    
+    scheduler = ConversionScheduler(None, RenderSettings(dpi=20, engine="pdfium", workers=1))
+    scheduler.run(
+        [ConversionJob(0, str(pdf_file), str(output_folder), 2)],
+        file_callback=lambda job, pages, error: results.append((pages, error))
+    )
+    
+    assert results == [(2, None)]
+
+
+def test_save_writes_completed_pages_sorted(tmp_path, pdf_file):
+    output_folder = tmp_path / "out"
+    finish(ConversionManifest.load(output_folder, str(pdf_file), 3, SETTINGS), [3, 1])
+    
+    stored = json.loads((output_folder / ConversionManifest.FILENAME).read_text(encoding="utf-8"))
+    
+    assert stored["completed"] == [1, 3]
+    assert stored["source"]["sha256"] == ConversionManifest.hash_file(str(pdf_file))
+
+
+# ==================== 같은 내용 가져오기 ====================
+
+
+def test_import_pages_from_identical_conversion(tmp_path, pdf_file):
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf_file.read_bytes())
+    source = ConversionManifest.load(tmp_path / "a", str(pdf_file), 3, SETTINGS)
+    finish(source, [1, 3])
+    target = ConversionManifest.load(tmp_path / "b", str(copy), 3, SETTINGS)
+    
+    assert target.import_pages(source, [1, 2, 3], "jpg") == [1, 3]
+    
+    assert target.missing_pages("jpg") == [2]
+    assert (tmp_path / "b" / "3.jpg").read_bytes() == b"page"
+
+
+def test_import_pages_requires_same_settings(tmp_path, pdf_file):
+    source = ConversionManifest.load(tmp_path / "a", str(pdf_file), 3, SETTINGS)
+    finish(source, [1, 2, 3])
+    target = ConversionManifest.load(tmp_path / "b", str(pdf_file), 3, RenderSettings(dpi=300).output_key())
+    
+    assert target.import_pages(source, [1, 2, 3], "jpg") == []
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from p2j_core import ConversionJob, ConversionScheduler, MetricsRecorder, RenderSettings, write_synthetic_pdf
+
+
+def test_prometheus_counts_page_kinds_separately():
+    metrics = MetricsRecorder()
+    metrics.extend([
+        {"event": "file", "pages": 5, "rendered": 2, "skipped": 3, "imported": 0},
+        {"event": "file", "pages": 4, "rendered": 0, "skipped": 0, "imported": 4},
+    ])
+    
+    text = metrics.render_prometheus()
+    
+    assert 'p2j_pages_total{kind="rendered"} 2' in text
+    assert 'p2j_pages_total{kind="skipped"} 3' in text
+    assert 'p2j_pages_total{kind="imported"} 4' in text
+
+
+def test_recorder_without_buffer_keeps_only_counters(tmp_path):
+    metrics = MetricsRecorder(prometheus_path=tmp_path / "p2j.prom")
+    metrics.extend([{"event": "page", "bytes": 10, "seconds_s": 0.5}] * 1000)
+    
+    assert metrics.drain() == []
+    assert metrics.event_counts == {"page": 1000}
+    assert metrics.bytes_written == 10_000
+    assert 'p2j_events_total{event="page"} 1000' in metrics.render_prometheus()
+
+
+def test_worker_recorder_buffers_events_until_drained():
+    metrics = MetricsRecorder(buffer=True)
+    metrics.record("page", bytes=10)
+    
+    assert [event["event"] for event in metrics.drain()] == ["page"]
+    assert metrics.drain() == []
+
+
+def test_resumed_run_reports_no_rendered_throughput(tmp_path):
+    pytest.importorskip("pypdfium2")
+    pdf_path = tmp_path / "input.pdf"
+    write_synthetic_pdf(pdf_path, "text", 3)
+    metrics_path = tmp_path / "metrics.jsonl"
+    settings = RenderSettings(dpi=20, engine="pdfium", workers=1)
+    
+    for _ in range(2):
+        scheduler = ConversionScheduler(None, settings, metrics=MetricsRecorder(metrics_path))
+        scheduler.run([ConversionJob(0, str(pdf_path), str(tmp_path / "out"), 3)])
+    
+    runs = [event for event in map(json.loads, metrics_path.read_text(encoding="utf-8").splitlines()) if event["event"] == "run"]
+    assert [(run["pages"], run["rendered"], run["skipped"]) for run in runs] == [(3, 3, 0), (3, 0, 3)]
+    assert runs[1]["pages_per_sec"] == 0.0
+    assert scheduler.page_counts == {"rendered": 0, "skipped": 3, "imported": 0}
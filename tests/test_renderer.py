@@ -0,0 +1,132 @@
+import importlib
+import io
+import random
+
+import pytest
+
+from p2j_core import PNG_SIGNATURE, PopplerRenderer, RenderSettings, check_encoder
+
+
+def make_jpeg(quality, seed=0, size=(64, 64)):
+    Image = pytest.importorskip("PIL.Image")
+    rng = random.Random(seed)
+    image = Image.frombytes("RGB", size, bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+# ==================== JPEG ====================
+
+
+def test_jpeg_end_skips_eoi_bytes_inside_quantization_table():
+    data = make_jpeg(quality=6)
+    # 낮은 품질에서는 양자화 테이블 안에 FF D9가 들어 있음
+    assert data.find(b"\xff\xd9") < len(data) - 2
+    
+    assert PopplerRenderer._find_image_end(bytearray(data + make_jpeg(6, seed=1)), "jpeg") == len(data)
+
+
+def test_jpeg_end_waits_for_complete_image():
+    data = make_jpeg(quality=6)
+    
+    for cut in (0, 1, 2, 40, 200, len(data) - 1):
+        assert PopplerRenderer._find_image_end(bytearray(data[:cut]), "jpeg") == -1
+
+
+def test_jpeg_end_handles_progressive_scans():
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.linear_gradient("L").save(buffer, "JPEG", quality=6, progressive=True)
+    data = buffer.getvalue()
+    
+    assert PopplerRenderer._find_image_end(bytearray(data + data), "jpeg") == len(data)
+
+
+def test_jpeg_end_rejects_other_data():
+    with pytest.raises(RuntimeError):
+        PopplerRenderer._find_image_end(bytearray(b"P6 1 1 255\n\x00\x00\x00"), "jpeg")
+
+
+def test_iter_pages_splits_low_quality_jpeg_stream(fake_poppler, tmp_path):
+    pages = [make_jpeg(6, seed=seed) for seed in range(3)]
+    renderer = PopplerRenderer(fake_poppler(pages))
+    settings = RenderSettings(fmt="jpeg", quality=6)
+    
+    result = list(renderer.iter_pages(str(tmp_path / "input.pdf"), 1, 3, settings))
+    
+    assert result == [(1, pages[0]), (2, pages[1]), (3, pages[2])]
+
+
+# ==================== PNG ====================
+
+
+def png_chunk(chunk_type, data):
+    return len(data).to_bytes(4, "big") + chunk_type + data + b"\0\0\0\0"
+
+
+def make_png(payload=b""):
+    # IDAT 안에 IEND 바이트가 있어도 청크 길이로 건너뜀
+    return PNG_SIGNATURE + png_chunk(b"IHDR", b"\0" * 13) + png_chunk(b"IDAT", payload + b"IEND") + png_chunk(b"IEND", b"")
+
+
+def test_png_end_follows_chunk_lengths():
+    data = make_png(b"\xff\xd9" * 10)
+    
+    assert PopplerRenderer._find_image_end(bytearray(data + make_png()), "png") == len(data)
+
+
+def test_png_end_waits_for_complete_image():
+    data = make_png()
+    
+    for cut in (0, 4, len(PNG_SIGNATURE), len(PNG_SIGNATURE) + 20, len(data) - 1):
+        assert PopplerRenderer._find_image_end(bytearray(data[:cut]), "png") == -1
+
+
+def test_png_end_rejects_other_data():
+    with pytest.raises(RuntimeError):
+        PopplerRenderer._find_image_end(bytearray(b"\xff\xd8\xff\xe0" + b"\0" * 8), "png")
+
+
+# ==================== PPM ====================
+
+
+@pytest.mark.parametrize("header, data_size", [
+    (b"P6 3 2 255\n", 3 * 2 * 3),
+    (b"P5\n3 2\n255\n", 3 * 2),
+    (b"P4\n10 2\n", 2 * 2),
+])
+def test_ppm_end_from_header(header, data_size):
+    # 픽셀 데이터에 다음 머리글처럼 보이는 바이트가 있어도 크기로 구분
+    data = header + (b"P6 1 1 " * data_size)[:data_size]
+    
+    assert PopplerRenderer._find_image_end(bytearray(data + header), "ppm") == len(data)
+    assert PopplerRenderer._find_image_end(bytearray(data[:-1]), "ppm") == -1
+
+
+def test_ppm_end_waits_for_header():
+    assert PopplerRenderer._find_image_end(bytearray(b"P6 3"), "ppm") == -1
+    assert PopplerRenderer._find_image_end(bytearray(b"P6 3 2 "), "ppm") == -1
+
+
+def test_ppm_end_rejects_other_data():
+    with pytest.raises(RuntimeError):
+        PopplerRenderer._find_image_end(bytearray(make_png(b"\0" * 100)), "ppm")
+
+
+# ==================== 인코더 확인 ====================
+
+
+def test_check_encoder_loads_avif_plugin_only_when_installed(monkeypatch):
+    pytest.importorskip("PIL")
+    loaded = []
+    monkeypatch.setattr(importlib, "import_module", loaded.append)
+    
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    check_encoder("avif")
+    assert loaded == []
+    
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    check_encoder("avif")
+    check_encoder("png")
+    assert loaded == ["pillow_avif"]
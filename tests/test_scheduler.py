@@ -0,0 +1,66 @@
+import pytest
+
+from p2j_core import CONFIG, ConversionJob, ConversionScheduler, PDFProcessor, RenderSettings
+
+
+def make_scheduler(workers, chunk_size=CONFIG.CHUNK_SIZE, **settings):
+    return ConversionScheduler(None, RenderSettings(workers=workers, **settings), chunk_size=chunk_size)
+
+
+# ==================== 페이지 구간 ====================
+
+
+@pytest.mark.parametrize("pages, chunk_size, expected", [
+    ([], 4, []),
+    ([1, 2, 3], None, [(1, 3)]),
+    ([1, 2, 3, 4, 5], 2, [(1, 2), (3, 4), (5, 5)]),
+    ([1, 2, 5, 6, 7, 9], None, [(1, 2), (5, 7), (9, 9)]),
+    ([9, 1, 2, 6, 5, 7], 2, [(1, 2), (5, 6), (7, 7), (9, 9)]),
+])
+def test_group_page_ranges(pages, chunk_size, expected):
+    assert PDFProcessor.group_page_ranges(pages, chunk_size) == expected
+
+
+# ==================== 작업 분할 ====================
+
+
+def test_balance_orders_largest_files_first():
+    jobs = [ConversionJob(index, f"{index}.pdf", f"out{index}", pages) for index, pages in enumerate([3, 40, 1, 12])]
+    
+    assert [job.pages for job in ConversionScheduler.balance(jobs)] == [40, 12, 3, 1]
+
+
+def test_split_tasks_spreads_a_single_file_over_all_workers():
+    job = ConversionJob(0, "a.pdf", "out", 100)
+    
+    tasks = make_scheduler(workers=4).split_tasks([job])
+    
+    assert [(first, last) for _, first, last in tasks] == [(1, 25), (26, 50), (51, 75), (76, 100)]
+
+
+def test_split_tasks_respects_chunk_size_and_lpt_order():
+    small = ConversionJob(0, "small.pdf", "out0", 3)
+    large = ConversionJob(1, "large.pdf", "out1", 30)
+    
+    tasks = make_scheduler(workers=2, chunk_size=10).split_tasks([small, large])
+    
+    assert [(job.index, first, last) for job, first, last in tasks] == [
+        (1, 1, 10), (1, 11, 20), (1, 21, 30), (0, 1, 3)
+    ]
+
+
+def test_split_tasks_only_schedules_pending_pages():
+    job = ConversionJob(0, "a.pdf", "out", 10, pending_pages=[2, 3, 4, 8])
+    
+    tasks = make_scheduler(workers=1, chunk_size=None).split_tasks([job])
+    
+    assert [(first, last) for _, first, last in tasks] == [(2, 4), (8, 8)]
+
+
+def test_split_tasks_caps_chunks_when_writing_archives():
+    job = ConversionJob(0, "a.pdf", "out", CONFIG.ARCHIVE_CHUNK_SIZE * 3)
+    
+    tasks = make_scheduler(workers=1, chunk_size=None, archive="zip").split_tasks([job])
+    
+    assert all(last - first + 1 <= CONFIG.ARCHIVE_CHUNK_SIZE for _, first, last in tasks)
+    assert len(tasks) == 3
@@ -0,0 +1,143 @@
+import io
+import sys
+import types
+from dataclasses import replace
+
+import pytest
+
+from p2j_core import RenderSettings, convert, write_synthetic_pdf
+
+
+# ==================== 설정 파일 ====================
+
+
+def test_load_json_and_toml(tmp_path):
+    json_path = tmp_path / "p2j_settings.json"
+    json_path.write_text('{"dpi": 300, "format": "png"}', encoding="utf-8")
+    toml_path = tmp_path / "p2j_settings.toml"
+    toml_path.write_text('dpi = 300\nformat = "png"\n', encoding="utf-8")
+    
+    assert RenderSettings.load(json_path) == RenderSettings.load(toml_path) == RenderSettings(dpi=300, fmt="png")
+
+
+def test_load_toml_falls_back_to_tomli(tmp_path, monkeypatch):
+    toml_path = tmp_path / "p2j_settings.toml"
+    toml_path.write_text("dpi = 150\n", encoding="utf-8")
+    tomli = types.ModuleType("tomli")
+    tomli.load = lambda f: {"dpi": 150}
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", tomli)
+    
+    assert RenderSettings.load(toml_path).dpi == 150
+
+
+def test_load_toml_without_parser_reports_value_error(tmp_path, monkeypatch):
+    toml_path = tmp_path / "p2j_settings.toml"
+    toml_path.write_text("dpi = 150\n", encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    
+    with pytest.raises(ValueError, match="tomli"):
+        RenderSettings.load(toml_path)
+
+
+# ==================== 목표 크기 ====================
+
+
+@pytest.mark.parametrize("scale_to", [100, 777, 1000])
+def test_scale_to_renders_long_side_at_target(tmp_path, scale_to):
+    pytest.importorskip("pypdfium2")
+    Image = pytest.importorskip("PIL.Image")
+    pdf_path = tmp_path / "a4.pdf"
+    write_synthetic_pdf(pdf_path, "text", 1)
+    settings = RenderSettings(fmt="png", engine="pdfium", scale_to=scale_to)
+    
+    (page,) = convert(pdf_path, settings)
+    
+    assert max(Image.open(io.BytesIO(page.data)).size) == scale_to
+
+
+def test_page_dpi_for_scale_to_is_not_rounded():
+    dpi = RenderSettings(scale_to=100).page_dpi(595, 842)
+    
+    assert dpi == pytest.approx(100 * 72 / 842)
+    assert 842 * dpi / 72 <= 100
+
+
+@pytest.mark.parametrize("settings", [
+    RenderSettings(dpi=300, max_width=1000),
+    RenderSettings(dpi=300, max_height=777),
+    RenderSettings(dpi=300, max_pixels=1_000_000),
+    RenderSettings(scale_to=1500, max_width=1001),
+])
+def test_page_dpi_never_exceeds_size_limits(settings):
+    width_pt, height_pt = 595, 842
+    dpi = settings.page_dpi(width_pt, height_pt)
+    width, height = width_pt * dpi / 72, height_pt * dpi / 72
+    
+    assert not settings.max_width or width <= settings.max_width
+    assert not settings.max_height or height <= settings.max_height
+    assert not settings.max_pixels or width * height <= settings.max_pixels
+
+
+def test_page_dpi_without_target_keeps_configured_dpi():
+    assert RenderSettings(dpi=200).page_dpi(595, 842) == 200
+
+
+# ==================== 설정 값 확인 ====================
+
+
+def test_from_dict_round_trips_to_dict():
+    settings = RenderSettings(dpi=300, fmt="tiff", multipage=True, color_mode="auto", max_width=2000, workers=2)
+    
+    assert RenderSettings.from_dict(settings.to_dict()) == settings
+    assert settings.to_dict()["format"] == "tiff"
+
+
+def test_from_dict_uses_defaults_for_missing_items():
+    assert RenderSettings.from_dict({}) == RenderSettings()
+
+
+@pytest.mark.parametrize("data", [
+    {"fmt": "png"},
+    {"unknown": 1},
+    {"dpi": "300"},
+    {"dpi": 300.0},
+    {"dpi": True},
+    {"optimize": 1},
+    {"format": 1},
+])
+def test_from_dict_rejects_unknown_items_and_wrong_types(data):
+    with pytest.raises(ValueError):
+        RenderSettings.from_dict(data)
+
+
+def test_validate_accepts_defaults():
+    RenderSettings().validate()
+
+
+@pytest.mark.parametrize("changes", [
+    {"dpi": 0},
+    {"dpi": 100_000},
+    {"fmt": "gif"},
+    {"quality": 0},
+    {"quality": 101},
+    {"multipage": True, "fmt": "png"},
+    {"archive": "rar"},
+    {"multipage": True, "fmt": "tiff", "archive": "zip"},
+    {"color_mode": "sepia"},
+    {"max_width": -1},
+    {"max_pixels": -1},
+    {"scale_to": -1},
+    {"workers": -1},
+    {"engine": "ghostscript"},
+])
+def test_validate_rejects_out_of_range_values(changes):
+    with pytest.raises(ValueError):
+        replace(RenderSettings(), **changes).validate()
+
+
+def test_override_ignores_none():
+    settings = RenderSettings(dpi=300)
+    
+    assert settings.override(dpi=None, fmt="png") == RenderSettings(dpi=300, fmt="png")